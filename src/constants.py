@@ -6,20 +6,46 @@ It also provides a test level data for testing purposes.
 from enum import Enum, IntEnum
 
 
+class CollisionMode(str, Enum):
+    """ Enum representing the available collision backends for levels. """
+    SPRITES = "sprites"
+    TILES = "tiles"
+    MERGED = "merged"
+
+
+class MoveResolver(str, Enum):
+    """ Enum representing the available movement resolvers for bodies. """
+    STEP = "step"
+    SWEPT = "swept"
+
+
 class Settings:
     """ Game settings and constants. """
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
     FPS = 240
 
+    # fixed physics rate, 0 updates once per rendered frame with variable dt
+    TICK_RATE = 120
+    MAX_FRAME_TIME = 0.25
+
     TILE_SIZE = 16
     ENEMY_SIZE = 32
     PLAYER_SIZE = 32
     CURSOR_TILE_RANGE = 3
 
+    # width and height in cells of the map chunks loaded around the view in large levels
+    CHUNK_SIZE = 16
+
     MAX_LEVEL_WIDTH = SCREEN_WIDTH // TILE_SIZE
     MAX_LEVEL_HEIGHT = SCREEN_HEIGHT // TILE_SIZE - (TILE_SIZE * 2)
 
+    # redraw only the changed areas of the display in scenes that support it
+    DIRTY_RECTS = True
+
+    COLLISION_MODE = CollisionMode.MERGED
+    MOVE_RESOLVER = MoveResolver.STEP
+
 
 class TileType(IntEnum):
     """ Enum representing different tile types in the game. """
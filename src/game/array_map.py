@@ -0,0 +1,183 @@
+""" Contains the ArrayMap class, a Map that stores its tiles in a flat typed array. """
+
+from array import array
+from collections import Counter
+
+from constants import Settings
+from game.map import Map
+
+
+class ArrayMap(Map):
+    """ Map that stores its tiles row by row in a single array of signed bytes.
+
+    Has the same public API as Map. Resizing and area operations work on row slices
+    of the array instead of single cells, and each cell takes one byte instead of
+    a reference in a nested list. Tile counts are kept by Map.
+
+    Attributes:
+        tiles (array): Flat array of tile IDs, the cell (x, y) is at index y * width + x.
+        width (int): Width of the map in cells.
+        height (int): Height of the map in cells.
+        tile_size (int): Size of each tile in pixels.
+    """
+
+    def __init__(self, map_data, tile_size=Settings.TILE_SIZE):
+        """ Initializes the ArrayMap object.
+
+        The map data is copied, so later changes to the map do not affect it.
+
+        Args:
+            map_data (list[list[int]]): 2D list of tile IDs.
+            tile_size (int, optional): Size of each tile in pixels. Defaults to constants.TILE_SIZE.
+        """
+        self._tiles = array("b")
+        for row in map_data:
+            self._tiles.extend(row)
+
+        super().__init__(map_data, tile_size)
+        self._data = None
+
+    @property
+    def data(self):
+        """ list[list[int]]: 2D list of tile IDs representing the map.
+
+        Built from the array on each access, changes to it do not affect the map.
+        Read-only property.
+        """
+        width = self._width
+        return [self._tiles[y * width:(y + 1) * width].tolist() for y in range(self._height)]
+
+    @property
+    def tiles(self):
+        """ array: Flat array of tile IDs, row by row. Read-only property. """
+        return self._tiles
+
+    def _iterate_all_cells(self):
+        """ Yield the indices and tile ID of each cell in the map, row by row.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each cell.
+        """
+        width = self._width
+        for index, tile_id in enumerate(self._tiles):
+            yield index % width, index // width, tile_id
+
+    def _build_index(self):
+        """ Count the tiles and find the positions of the unique tiles from the whole array. """
+        self._counts = Counter(self._tiles)
+        self._positions = {}
+
+        raw = self._tiles.tobytes()
+        for tile_id in self._INDEXED_TILES:
+            positions = set()
+            needle = bytes((tile_id & 0xFF,))
+            index = raw.find(needle)
+            while index != -1:
+                positions.add((index % self._width, index // self._width))
+                index = raw.find(needle, index + 1)
+            self._positions[tile_id] = positions
+
+    def _get_bounds(self):
+        """ Find the smallest rectangle that contains all non-zero tiles.
+
+        Empty rows and the empty ends of rows are found with byte string strips.
+
+        Returns:
+            tuple[int, int, int, int] or None: The bounds as (min_x, min_y, max_x, max_y),
+                or None if the map is empty.
+        """
+        raw = self._tiles.tobytes()
+        width = self._width
+        rows = [raw[y * width:(y + 1) * width] for y in range(self._height)]
+
+        filled = [y for y, row in enumerate(rows) if row.strip(b"\0")]
+        if not filled:
+            return None
+
+        min_x = min(width - len(rows[y].lstrip(b"\0")) for y in filled)
+        max_x = max(len(rows[y].rstrip(b"\0")) for y in filled) - 1
+
+        return min_x, filled[0], max_x, filled[-1]
+
+    def _move_tiles(self, offset_x, offset_y, new_width, new_height):
+        """ Replace the tiles with an array of a new size, copying the current tiles by row slices.
+
+        Args:
+            offset_x (int): The x index the current map's left column is moved to.
+            offset_y (int): The y index the current map's top row is moved to.
+            new_width (int): Width of the new array in cells.
+            new_height (int): Height of the new array in cells.
+        """
+        new_tiles = array("b", bytes(new_width * new_height))
+        src_x, dst_x, length, rows = self._get_copy_span(
+            offset_x, offset_y, new_width, new_height)
+
+        for src_y in rows:
+            src = src_y * self._width + src_x
+            dst = (src_y + offset_y) * new_width + dst_x
+            new_tiles[dst:dst + length] = self._tiles[src:src + length]
+
+        self._tiles = new_tiles
+
+    def get_tile_at_cell(self, cell_x, cell_y):
+        """ Get the tile ID at the specified cell.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+
+        Returns:
+            int or None: The tile ID at the specified cell, or None if out of bounds.
+        """
+        if self.cell_in_bounds(cell_x, cell_y):
+            return self._tiles[cell_y * self._width + cell_x]
+        return None
+
+    def _write_cell(self, cell_x, cell_y, tile_id):
+        """ Store a tile ID in a cell without bounds checks or index updates.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+            tile_id (int): The tile ID to store.
+        """
+        self._tiles[cell_y * self._width + cell_x] = tile_id
+
+    def is_empty_area(self, x, y, depth=(1, 1)):
+        """ Check if the rectangular area of cells is empty.
+
+        All cells in the area must be empty (0) and within the map bounds.
+
+        Args:
+            x (int): The x index of the area's top-left cell.
+            y (int): The y index of the area's top-left cell.
+            depth (tuple[int, int], optional): The width and height of the area. Defaults to (1, 1).
+
+        Returns:
+            bool: True if the area is entirely empty and within bounds, False otherwise.
+        """
+        if not self.is_area_in_bounds(x, y, depth):
+            return False
+
+        width, height = depth
+        for row in range(y, y + height):
+            start = row * self._width + x
+            if any(self._tiles[start:start + width]):
+                return False
+        return True
+
+    def is_area_in_bounds(self, x, y, depth=(1, 1)):
+        """ Check if the rectangular area of cells is within the map bounds.
+
+        Args:
+            x (int): The x index of the area's top-left cell.
+            y (int): The y index of the area's top-left cell.
+            depth (tuple[int, int], optional): The width and height of the area. Defaults to (1, 1).
+
+        Returns:
+            bool: True if the area is entirely within bounds, False otherwise.
+        """
+        width, height = depth
+        if width <= 0 or height <= 0:
+            return True
+        return self.cell_in_bounds(x, y) and self.cell_in_bounds(x + width - 1, y + height - 1)
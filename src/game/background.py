@@ -0,0 +1,128 @@
+""" Contains the Background class, the baked static layer used for dirty-rect drawing."""
+
+import pygame
+
+
+class Background:
+    """ Display-sized surface with the tiles and static blocks drawn on it.
+
+    The surface is allocated once for the display size. When the view moves, the
+    surface is scrolled and only the uncovered strips are drawn again, instead of
+    baking the whole background on every scrolled frame.
+    Also keeps the areas the other sprites were drawn to on the last dirty draw.
+
+    Attributes:
+        tile_layer (TileLayer or None): The tile layer drawn under the blocks.
+        drawn_rects (dict[Sprite, pygame.Rect]): The areas the unbaked sprites
+            were last drawn to.
+    """
+
+    _COLOR = (0, 0, 0)
+
+    def __init__(self):
+        """ Initialize the Background without a surface. """
+        self.tile_layer = None
+        self.drawn_rects = {}
+
+        self._surface = None
+        self._offset = (0, 0)
+        self._valid = False
+
+    @property
+    def surface(self):
+        """ pygame.Surface or None: The baked surface. Read-only property. """
+        return self._surface
+
+    def invalidate(self):
+        """ Draw the whole surface again on the next prepare. """
+        self._valid = False
+
+    def prepare(self, display, offset, blocks=(), changed=()):
+        """ Bring the surface up to date with the display size and the view offset.
+
+        The changed areas are drawn again after a scroll too, since the scrolled
+        contents still show them as they were.
+
+        Args:
+            display (pygame.Surface): The display, the surface matches its size and format.
+            offset (tuple[int, int]): World position of the display's top-left corner.
+            blocks (Iterable[Sprite], optional): The block sprites to bake near the view.
+                Defaults to no blocks.
+            changed (Iterable[pygame.Rect], optional): The areas of the surface whose
+                tiles have changed. Defaults to no areas.
+
+        Returns:
+            bool: True if the surface was drawn again or scrolled,
+                so the whole display has to be redrawn.
+        """
+        if self._surface is None or self._surface.get_size() != display.get_size():
+            self._surface = pygame.Surface(display.get_size(), 0, display)
+            self._valid = False
+
+        if not self._valid:
+            self._paint(self._surface.get_rect(), offset, blocks)
+            self._valid = True
+            self._offset = offset
+            return True
+
+        redraw_all = offset != self._offset
+        if redraw_all:
+            self._scroll(offset, blocks)
+            self._offset = offset
+
+        for area in changed:
+            self.patch(area, offset)
+
+        return redraw_all
+
+    def patch(self, area, offset):
+        """ Draw an area of the tile layer again.
+
+        Args:
+            area (pygame.Rect): The area of the surface to draw.
+            offset (tuple[int, int]): World position of the surface's top-left corner.
+        """
+        self._paint(area, offset, ())
+
+    def _scroll(self, offset, blocks):
+        """ Move the surface contents to a new offset and draw the uncovered strips.
+
+        Args:
+            offset (tuple[int, int]): The new world position of the surface's top-left corner.
+            blocks (Iterable[Sprite]): The block sprites to bake.
+        """
+        dx = self._offset[0] - offset[0]
+        dy = self._offset[1] - offset[1]
+        rect = self._surface.get_rect()
+
+        if abs(dx) >= rect.width or abs(dy) >= rect.height:
+            self._paint(rect, offset, blocks)
+            return
+
+        self._surface.scroll(dx, dy)
+
+        if dx:
+            self._paint(pygame.Rect(0 if dx > 0 else rect.width + dx, 0, abs(dx), rect.height),
+                        offset, blocks)
+        if dy:
+            self._paint(pygame.Rect(0, 0 if dy > 0 else rect.height + dy, rect.width, abs(dy)),
+                        offset, blocks)
+
+    def _paint(self, area, offset, blocks):
+        """ Clear an area of the surface and draw the tiles and blocks in it.
+
+        Args:
+            area (pygame.Rect): The area of the surface to draw.
+            offset (tuple[int, int]): World position of the surface's top-left corner.
+            blocks (Iterable[Sprite]): The block sprites to bake.
+        """
+        self._surface.set_clip(area)
+        self._surface.fill(self._COLOR)
+
+        if self.tile_layer:
+            self.tile_layer.draw(self._surface, offset, area)
+
+        for sprite in blocks:
+            self._surface.blit(sprite.image, sprite.rect.move(-offset[0], -offset[1]))
+
+        self._surface.set_clip(None)
@@ -0,0 +1,39 @@
+""" Function for merging cells of solid tiles into larger rectangles."""
+
+
+def merge_cells(cells):
+    """ Cover a set of cells with as few rectangles as a greedy scan finds.
+
+    Cells are taken row by row. Each rectangle is first grown to the right over
+    the remaining cells of its row, and then down while the whole row below is covered.
+    Every cell ends up in exactly one rectangle.
+
+    Args:
+        cells (Iterable[tuple[int, int]]): The (cell_x, cell_y) indices to cover.
+
+    Returns:
+        list[tuple[int, int, int, int]]: The rectangles as (cell_x, cell_y, width, height)
+            in cells, in the order their top-left cells were scanned.
+    """
+    remaining = set(cells)
+    rects = []
+
+    for cell_x, cell_y in sorted(remaining, key=lambda cell: (cell[1], cell[0])):
+        if (cell_x, cell_y) not in remaining:
+            continue
+
+        width = 1
+        while (cell_x + width, cell_y) in remaining:
+            width += 1
+
+        height = 1
+        while all((cell_x + i, cell_y + height) in remaining for i in range(width)):
+            height += 1
+
+        for j in range(height):
+            for i in range(width):
+                remaining.discard((cell_x + i, cell_y + j))
+
+        rects.append((cell_x, cell_y, width, height))
+
+    return rects
@@ -1,8 +1,26 @@
 """ Contains the Body class, which is used for sprites that require physics simulation."""
 
 import math
+from dataclasses import dataclass, field
+
 import pygame
 
+from constants import Settings, MoveResolver
+
+
+@dataclass
+class _Motion:
+    """ Position and velocity of a body, with the position before the last update.
+
+    Attributes:
+        position (pygame.Vector2): The exact position of the body.
+        previous (pygame.Vector2): The position before the last update, used for interpolation.
+        velocity (pygame.Vector2): The velocity of the body.
+    """
+    position: pygame.Vector2
+    previous: pygame.Vector2
+    velocity: pygame.Vector2 = field(default_factory=pygame.Vector2)
+
 
 class Body():
     """ Body class for sprites that require physics simulation.
@@ -27,21 +45,23 @@ class Body():
     _DIR_VERTICAL = 1
     _DIR_HORIZONTAL = 0
 
-    def __init__(self, rect, x, y):
+    def __init__(self, rect, x, y, resolver=Settings.MOVE_RESOLVER):
         """ Initialize the Body class.
 
         Args:
             rect (pygame.Rect): The rect of the sprite.
             x (int): The initial x position of the sprite.
             y (int): The initial y position of the sprite.
+            resolver (MoveResolver, optional): How movement is resolved against colliders.
+                Defaults to Settings.MOVE_RESOLVER.
         """
         self.rect = rect
+        self._resolver = resolver
 
         # movement variables
         self._input = [0, 0]
         self._gravity = 0.0
-        self._velocity = pygame.Vector2(0, 0)
-        self._position = pygame.Vector2(x, y)
+        self._motion = _Motion(pygame.Vector2(x, y), pygame.Vector2(x, y))
         self.on_floor = False
         self.touching_wall = False
         self.last_direction = 1
@@ -56,18 +76,20 @@ class Body():
             dt (float): The delta time since the last frame.
             colliders (pygame.sprite.Group): The group of colliders to check for collisions with.
         """
+        self._motion.previous.update(self._motion.position)
+
         # take input and apply movement speed
-        self._velocity.x = self._input[0] * self._BASE_MOVEMENT_SPEED
+        self._motion.velocity.x = self._input[0] * self._BASE_MOVEMENT_SPEED
 
         # jump + gravity
         self._apply_jump_input()
         self._apply_gravity(dt)
 
-        move = self._velocity * dt
+        move = self._motion.velocity * dt
 
         # remember last direction
         if self.is_moving_horizontal():
-            self.last_direction = 1 if self._velocity.x > 0 else -1
+            self.last_direction = 1 if self._motion.velocity.x > 0 else -1
 
         # reset input
         self._input[0] = 0
@@ -102,7 +124,7 @@ class Body():
         Args:
             dt (float): The delta time since the last frame. 
         """
-        self._velocity.y = self._gravity + dt * self._GRAVITY_CONSTANT / 2
+        self._motion.velocity.y = self._gravity + dt * self._GRAVITY_CONSTANT / 2
         self._gravity += self._GRAVITY_CONSTANT * dt
 
         self._gravity = min(self._gravity, self._TERMINAL_VELOCITY)
@@ -117,9 +139,13 @@ class Body():
         self.on_floor = False
         self.touching_wall = False
 
-        # move in steps to avoid going through walls
-        self._step_move(colliders, move, self._DIR_HORIZONTAL)
-        self._step_move(colliders, move, self._DIR_VERTICAL)
+        if self._resolver == MoveResolver.SWEPT:
+            self._swept_move(colliders, move, self._DIR_HORIZONTAL)
+            self._swept_move(colliders, move, self._DIR_VERTICAL)
+        else:
+            # move in steps to avoid going through walls
+            self._step_move(colliders, move, self._DIR_HORIZONTAL)
+            self._step_move(colliders, move, self._DIR_VERTICAL)
 
         self._check_for_ground(colliders)
 
@@ -136,12 +162,12 @@ class Body():
 
         while abs(move[direction]) > self._MOVE_EPSILON:
             if abs(move[direction]) > self._STEP_SIZE:
-                self._position[direction] += self._STEP_SIZE * \
+                self._motion.position[direction] += self._STEP_SIZE * \
                     math.copysign(1, move[direction])
                 move[direction] -= self._STEP_SIZE * \
                     math.copysign(1, move[direction])
             else:
-                self._position[direction] += move[direction]
+                self._motion.position[direction] += move[direction]
                 move[direction] = 0.0
 
             if direction == self._DIR_VERTICAL:
@@ -151,6 +177,74 @@ class Body():
                 if self._horizontal_move(colliders):
                     break
 
+    def _swept_move(self, colliders, move, direction):
+        """ Move the sprite the whole distance at once, stopping at the first collider hit.
+
+        The colliders are queried once for the area swept by the sprite along the axis,
+        and the sprite is placed against the nearest one in the direction of movement.
+
+        Args:
+            colliders (pygame.sprite.Group): The group of colliders to check for collisions with.
+            move (pygame.Vector2): Delta time scaled movement vector to be applied to the sprite.
+            direction (int): The direction to move in. 0 for horizontal, 1 for vertical.
+        """
+        if direction not in [self._DIR_HORIZONTAL, self._DIR_VERTICAL]:
+            return
+
+        if abs(move[direction]) <= self._MOVE_EPSILON:
+            return
+
+        start = self.rect.copy()
+        self._motion.position[direction] += move[direction]
+
+        if direction == self._DIR_HORIZONTAL:
+            self.rect.x = self._motion.position.x
+        else:
+            self.rect.y = self._motion.position.y
+
+        colliding = self._get_colliding(colliders, start.union(self.rect))
+
+        if not colliding:
+            return
+
+        if direction == self._DIR_HORIZONTAL:
+            self._swept_horizontal(colliding, move[direction])
+        else:
+            self._swept_vertical(colliding, move[direction])
+
+    def _swept_horizontal(self, colliding, distance):
+        """ Place the sprite against the nearest collider hit by a horizontal sweep.
+
+        Args:
+            colliding (list[pygame.Rect]): The rects of the colliders in the swept area.
+            distance (float): The distance moved, positive to the right.
+        """
+        if distance > 0:
+            self.rect.right = min(other.left for other in colliding)
+        else:
+            self.rect.left = max(other.right for other in colliding)
+
+        self._motion.velocity[0] = 0
+        self._motion.position.x = self.rect.x
+        self.touching_wall = True
+
+    def _swept_vertical(self, colliding, distance):
+        """ Place the sprite against the nearest collider hit by a vertical sweep.
+
+        Args:
+            colliding (list[pygame.Rect]): The rects of the colliders in the swept area.
+            distance (float): The distance moved, positive downwards.
+        """
+        if distance > 0:
+            self.rect.bottom = min(other.top for other in colliding)
+            self.on_floor = True
+        else:
+            self.rect.top = max(other.bottom for other in colliding)
+            self._gravity = 0
+
+        self._motion.velocity[1] = 0
+        self._motion.position.y = self.rect.y
+
     def _horizontal_move(self, colliders):
         """ Move one step horizontally and resolve collisions.
 
@@ -159,18 +253,18 @@ class Body():
         Args:
             colliders (pygame.sprite.Group): The group of colliders to check for collisions with.
         """
-        self.rect.x = self._position.x
-        colliding = pygame.sprite.spritecollide(self, colliders, False)
+        self.rect.x = self._motion.position.x
+        colliding = self._get_colliding(colliders)
 
         if colliding:
             for other in colliding:
-                if self._velocity[0] > 0:
-                    self.rect.right = other.rect.left
-                elif self._velocity[0] < 0:
-                    self.rect.left = other.rect.right
+                if self._motion.velocity[0] > 0:
+                    self.rect.right = other.left
+                elif self._motion.velocity[0] < 0:
+                    self.rect.left = other.right
 
-            self._velocity[0] = 0
-            self._position.x = self.rect.x
+            self._motion.velocity[0] = 0
+            self._motion.position.x = self.rect.x
             self.touching_wall = True
 
             return True
@@ -185,20 +279,20 @@ class Body():
         Args:
             colliders (pygame.sprite.Group): The group of colliders to check for collisions with.
         """
-        self.rect.y = self._position.y
-        colliding = pygame.sprite.spritecollide(self, colliders, False)
+        self.rect.y = self._motion.position.y
+        colliding = self._get_colliding(colliders)
 
         if colliding:
             for other in colliding:
-                if self._velocity[1] > 0:
-                    self.rect.bottom = other.rect.top
+                if self._motion.velocity[1] > 0:
+                    self.rect.bottom = other.top
                     self.on_floor = True
-                elif self._velocity[1] < 0:
-                    self.rect.top = other.rect.bottom
+                elif self._motion.velocity[1] < 0:
+                    self.rect.top = other.bottom
                     self._gravity = 0
 
-            self._velocity[1] = 0
-            self._position.y = self.rect.y
+            self._motion.velocity[1] = 0
+            self._motion.position.y = self.rect.y
 
             return True
 
@@ -212,14 +306,35 @@ class Body():
         """
 
         # check if not going up
-        if self._velocity[1] < 0:
+        if self._motion.velocity[1] < 0:
             return
 
         self.rect.y += 1
-        if pygame.sprite.spritecollide(self, colliders, False):
+        if self._get_colliding(colliders):
             self.on_floor = True
         self.rect.y -= 1
 
+    def _get_colliding(self, colliders, rect=None):
+        """ Get the rects of all colliders overlapping the sprite's rect.
+
+        Colliders that provide a collide_rect method (e.g. SpatialGroup) are queried
+        through it, any other sprite group is checked sprite by sprite.
+
+        Args:
+            colliders (pygame.sprite.Group): The group of colliders to check for collisions with.
+            rect (pygame.Rect, optional): The area to check. Defaults to the sprite's rect.
+
+        Returns:
+            list[pygame.Rect]: The rects of the colliding colliders.
+        """
+        if rect is None:
+            rect = self.rect
+
+        if hasattr(colliders, "collide_rect"):
+            return colliders.collide_rect(rect)
+
+        return [other.rect for other in colliders if rect.colliderect(other.rect)]
+
     def is_moving(self):
         """ Check if the sprite is moving in any direction.
 
@@ -234,7 +349,7 @@ class Body():
         Returns:
             bool: True if the sprite is moving horizontally, False otherwise.
         """
-        return abs(self._velocity[0]) > self._MOVE_EPSILON
+        return abs(self._motion.velocity[0]) > self._MOVE_EPSILON
 
     def is_moving_vertical(self):
         """ Check if the sprite is moving in the vertical direction.
@@ -242,7 +357,61 @@ class Body():
         Returns:
             bool: True if the sprite is moving vertically, False otherwise.
         """
-        return abs(self._velocity[1]) > self._MOVE_EPSILON and not self.on_floor
+        return abs(self._motion.velocity[1]) > self._MOVE_EPSILON and not self.on_floor
+
+    def get_interpolated_position(self, alpha):
+        """ Get a position between the previous and current position.
+
+        Used for drawing between two fixed time step updates.
+
+        Args:
+            alpha (float): How far to blend from the previous position
+                to the current one (0.0 - 1.0).
+
+        Returns:
+            tuple[int, int]: The blended position rounded to whole pixels.
+        """
+        position = self._motion.previous.lerp(self._motion.position, alpha)
+        return round(position.x), round(position.y)
+
+    def get_state(self):
+        """ Get a snapshot of the movement state.
+
+        Returns:
+            tuple: The state, to be restored with set_state.
+        """
+        return (
+            self.rect.topleft,
+            tuple(self._motion.position),
+            tuple(self._motion.velocity),
+            self._gravity,
+            self.on_floor,
+            self.touching_wall,
+            self.last_direction
+        )
+
+    def set_state(self, state):
+        """ Restore the movement state from a snapshot made with get_state.
+
+        Pending input is cleared.
+
+        Args:
+            state (tuple): The state to restore.
+        """
+        (
+            self.rect.topleft,
+            position,
+            velocity,
+            self._gravity,
+            self.on_floor,
+            self.touching_wall,
+            self.last_direction
+        ) = state
+
+        self._motion.position.update(position)
+        self._motion.previous.update(position)
+        self._motion.velocity.update(velocity)
+        self._input = [0, 0]
 
     def get_velocity(self):
         """ Get the current velocity. 
@@ -250,4 +419,4 @@ class Body():
         Returns:
             pygame.Vector2: The current velocity of the sprite.
         """
-        return self._velocity
+        return self._motion.velocity
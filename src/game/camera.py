@@ -0,0 +1,89 @@
+""" Contains the Camera class, the view into a level larger than the screen."""
+
+import pygame
+
+from constants import Settings
+
+
+class Camera:
+    """ Viewport that follows a target through the world.
+
+    The view is kept inside the world bounds, so a world the size of the screen is never
+    scrolled. Converts positions between screen and world space for drawing and mouse input.
+    """
+
+    def __init__(self, world_size, view_size=(Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)):
+        """ Initialize the Camera at the top-left corner of the world.
+
+        Args:
+            world_size (tuple[int, int]): Size of the world in pixels,
+                at least the size of the view.
+            view_size (tuple[int, int], optional): Size of the view in pixels.
+                Defaults to the screen size.
+        """
+        self._world = pygame.Rect((0, 0), world_size)
+        self._rect = pygame.Rect((0, 0), view_size)
+        self._previous = pygame.Vector2(0, 0)
+
+    @property
+    def rect(self):
+        """ pygame.Rect: The area of the world in view. Read-only property. """
+        return self._rect
+
+    @property
+    def world_rect(self):
+        """ pygame.Rect: The bounds of the world. Read-only property. """
+        return self._world
+
+    @property
+    def offset(self):
+        """ tuple[int, int]: World position of the view's top-left corner. Read-only property. """
+        return self._rect.topleft
+
+    def follow(self, target):
+        """ Center the view on a target, keeping the view inside the world.
+
+        Args:
+            target (pygame.Rect): The rect to center on.
+        """
+        self._previous.update(self._rect.topleft)
+        self._rect.center = target.center
+        self._rect.clamp_ip(self._world)
+
+    def get_draw_offset(self, alpha=None):
+        """ Get the view offset to draw with, between the last two follow calls.
+
+        Args:
+            alpha (float, optional): Interpolation factor between the last two updates.
+                Defaults to None, which uses the current offset.
+
+        Returns:
+            tuple[int, int]: The offset to subtract from world positions.
+        """
+        if alpha is None:
+            return self.offset
+
+        offset = self._previous.lerp(self._rect.topleft, alpha)
+        return round(offset.x), round(offset.y)
+
+    def screen_to_world(self, pos):
+        """ Convert a screen position to a world position.
+
+        Args:
+            pos (tuple[float, float]): The position on screen.
+
+        Returns:
+            tuple[float, float]: The position in the world.
+        """
+        return pos[0] + self._rect.x, pos[1] + self._rect.y
+
+    def world_to_screen(self, pos):
+        """ Convert a world position to a screen position.
+
+        Args:
+            pos (tuple[float, float]): The position in the world.
+
+        Returns:
+            tuple[float, float]: The position on screen.
+        """
+        return pos[0] - self._rect.x, pos[1] - self._rect.y
@@ -0,0 +1,221 @@
+""" Contains the ChunkLoader class, which streams map chunks in and out around the view."""
+
+import pygame
+
+from constants import TileType, CollisionMode
+from game.block_merge import merge_cells
+from sprites.block import Block
+from sprites.placeable import Placeable
+from sprites.enemy import Enemy
+
+
+class ChunkLoader:
+    """ Creates the sprites of map chunks near the view and releases them when they are far.
+
+    Chunks are loaded within _LOAD_MARGIN chunks of the view and released only after
+    they are more than _RELEASE_MARGIN chunks away, so moving back and forth over a chunk
+    border does not rebuild the same chunks. Loading a chunk also draws it to the tile layer.
+
+    Enemies are spawned the first time their chunk is loaded and are never released,
+    instead they are only updated while inside the active area around the view.
+
+    Block sprites depend on the collision mode. With merged collisions the blocks of
+    a chunk are merged into as few rectangular Block sprites as possible, so bodies
+    test fewer colliders. With tile collisions no block sprites are created, as
+    the map is used for collisions and the tile layer for drawing.
+    """
+
+    _LOAD_MARGIN = 2
+    _ACTIVE_MARGIN = 1
+    _RELEASE_MARGIN = 3
+
+    def __init__(self, tile_map, sprites, tile_layer, objects,
+                 collision_mode=CollisionMode.SPRITES):
+        """ Initialize the ChunkLoader without any loaded chunks.
+
+        Args:
+            tile_map (ChunkMap): The map to load the chunks from.
+            sprites (Sprites): The sprites to add the created sprites to.
+            tile_layer (TileLayer): The tile layer to draw the loaded chunks to.
+            objects (dict): The placeables of the level by cell, kept up to date with
+                the loaded chunks.
+            collision_mode (CollisionMode, optional): The collision backend of the level,
+                decides how block sprites are created. Defaults to CollisionMode.SPRITES.
+        """
+        self._map = tile_map
+        self._sprites = sprites
+        self._tile_layer = tile_layer
+        self._objects = objects
+        self._collision_mode = collision_mode
+
+        self._loaded = {}  # {chunk: {sprite: cell of a placeable or None}}
+        self._spawned = set()
+        self._active_rect = pygame.Rect(0, 0, 0, 0)
+
+    @property
+    def loaded_chunks(self):
+        """ set[tuple[int, int]]: The chunks with sprites. Read-only property. """
+        return set(self._loaded)
+
+    def update(self, view_rect):
+        """ Load the chunks near the view and release the chunks far from it.
+
+        Args:
+            view_rect (pygame.Rect): The area of the world in view.
+        """
+        pixels = self._map.chunk_size * self._map.tile_size
+
+        self._active_rect = view_rect.inflate(
+            2 * self._ACTIVE_MARGIN * pixels, 2 * self._ACTIVE_MARGIN * pixels)
+
+        keep = set(self._map.get_chunks_in_rect(view_rect.inflate(
+            2 * self._RELEASE_MARGIN * pixels, 2 * self._RELEASE_MARGIN * pixels)))
+        for chunk in [chunk for chunk in self._loaded if chunk not in keep]:
+            self._release_chunk(chunk)
+
+        for chunk in self._map.get_chunks_in_rect(view_rect.inflate(
+                2 * self._LOAD_MARGIN * pixels, 2 * self._LOAD_MARGIN * pixels)):
+            if chunk not in self._loaded:
+                self._load_chunk(chunk)
+
+    def is_active(self, rect):
+        """ Check if a rect is close enough to the view for its surroundings to be loaded.
+
+        Args:
+            rect (pygame.Rect): The rect to check.
+
+        Returns:
+            bool: True if the rect is inside the active area, False otherwise.
+        """
+        return self._active_rect.colliderect(rect)
+
+    def get_state(self):
+        """ Get a snapshot of the loaded chunks and the spawned enemies.
+
+        Returns:
+            tuple: The state, to be restored with set_state.
+        """
+        return frozenset(self._loaded), frozenset(self._spawned)
+
+    def set_state(self, state):
+        """ Restore the loaded chunks and spawned enemies from a snapshot made with get_state.
+
+        Chunks loaded after the snapshot are released and chunks released after it are
+        loaded again. Enemies spawned after the snapshot have to be removed by the caller,
+        they are spawned again the next time their chunk is loaded.
+
+        Args:
+            state (tuple): The state to restore.
+        """
+        loaded, spawned = state
+        self._spawned = set(spawned)
+
+        for chunk in [chunk for chunk in self._loaded if chunk not in loaded]:
+            self._release_chunk(chunk)
+
+        for chunk in loaded:
+            if chunk not in self._loaded:
+                self._load_chunk(chunk)
+
+    def add_placeable(self, cell_x, cell_y, placeable):
+        """ Add a placeable created during the level to its chunk.
+
+        Args:
+            cell_x (int): The x index of the placeable's cell.
+            cell_y (int): The y index of the placeable's cell.
+            placeable (Placeable): The placeable sprite.
+        """
+        self._objects[(cell_x, cell_y)] = placeable
+        self._sprites.add(placeable)
+
+        loaded = self._loaded.get(self._map.chunk_of_cell(cell_x, cell_y))
+        if loaded is not None:
+            loaded[placeable] = (cell_x, cell_y)
+
+    def remove_placeable(self, cell_x, cell_y):
+        """ Remove a placeable from its chunk and the level.
+
+        Args:
+            cell_x (int): The x index of the placeable's cell.
+            cell_y (int): The y index of the placeable's cell.
+        """
+        placeable = self._objects.pop((cell_x, cell_y), None)
+        if placeable is None:
+            return
+
+        placeable.kill()
+
+        loaded = self._loaded.get(self._map.chunk_of_cell(cell_x, cell_y))
+        if loaded is not None:
+            loaded.pop(placeable, None)
+
+    def _load_chunk(self, chunk):
+        """ Create the sprites of a chunk and draw it to the tile layer.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+        """
+        self._tile_layer.load_chunk(chunk)
+        loaded = {}
+        blocks = []
+
+        for cell_x, cell_y, tile_id in self._map.iterate_chunk(chunk):
+            if tile_id == TileType.BLOCK and self._collision_mode == CollisionMode.MERGED:
+                # built after the loop from the merged rectangles
+                blocks.append((cell_x, cell_y))
+            elif tile_id != TileType.BLOCK or self._collision_mode == CollisionMode.SPRITES:
+                self._spawn_cell(cell_x, cell_y, tile_id, loaded)
+
+        self._add_merged_blocks(blocks, loaded)
+        self._loaded[chunk] = loaded
+
+    def _spawn_cell(self, cell_x, cell_y, tile_id, loaded):
+        """ Create the sprite of a single cell, if the tile has one.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+            tile_id (int): The tile ID of the cell.
+            loaded (dict): The sprites of the chunk, see _loaded.
+        """
+        world_x, world_y = self._map.cell_index_to_world_pos((cell_x, cell_y))
+
+        if tile_id == TileType.BLOCK:
+            sprite = Block(world_x, world_y)
+            loaded[sprite] = None
+        elif tile_id == TileType.PLACEABLE:
+            sprite = Placeable(world_x, world_y)
+            loaded[sprite] = (cell_x, cell_y)
+            self._objects[(cell_x, cell_y)] = sprite
+        elif tile_id == TileType.ENEMY and (cell_x, cell_y) not in self._spawned:
+            sprite = Enemy(world_x, world_y)
+            self._spawned.add((cell_x, cell_y))
+        else:
+            return
+
+        self._sprites.add(sprite)
+
+    def _add_merged_blocks(self, blocks, loaded):
+        """ Merge the block cells of a chunk into rectangular Block colliders.
+
+        Args:
+            blocks (list[tuple[int, int]]): The block cells of the chunk.
+            loaded (dict): The sprites of the chunk, see _loaded.
+        """
+        for cell_x, cell_y, columns, rows in merge_cells(blocks):
+            sprite = Block(*self._map.cell_index_to_world_pos((cell_x, cell_y)), columns, rows)
+            loaded[sprite] = None
+            self._sprites.add(sprite)
+
+    def _release_chunk(self, chunk):
+        """ Remove the sprites of a chunk and free its tile layer surface.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+        """
+        for sprite, cell in self._loaded.pop(chunk).items():
+            sprite.kill()
+            if cell is not None:
+                self._objects.pop(cell, None)
+
+        self._tile_layer.release_chunk(chunk)
@@ -0,0 +1,286 @@
+""" Contains the ChunkMap class, a Map that stores its tiles in fixed-size chunks. """
+
+from array import array
+from collections import Counter
+
+import pygame
+
+from constants import Settings
+from game.map import Map
+
+
+class ChunkMap(Map):
+    """ Map that stores its tiles in square chunks of a fixed number of cells.
+
+    Each chunk is a flat array of signed bytes, row by row. Chunks without any tiles
+    are not stored, so empty parts of large levels take no memory.
+    The chunk queries let a level build and release the contents of single chunks
+    as the view moves, instead of the whole map at once.
+
+    Attributes:
+        chunk_size (int): Width and height of a chunk in cells.
+        width (int): Width of the map in cells.
+        height (int): Height of the map in cells.
+        tile_size (int): Size of each tile in pixels.
+    """
+
+    def __init__(self, map_data, tile_size=Settings.TILE_SIZE, chunk_size=Settings.CHUNK_SIZE):
+        """ Initializes the ChunkMap object.
+
+        The map data is copied, so later changes to the map do not affect it.
+
+        Args:
+            map_data (list[list[int]]): 2D list of tile IDs.
+            tile_size (int, optional): Size of each tile in pixels. Defaults to constants.TILE_SIZE.
+            chunk_size (int, optional): Width and height of a chunk in cells.
+                Defaults to Settings.CHUNK_SIZE.
+        """
+        self._chunk_size = chunk_size
+        self._chunks = {}  # {(chunk_x, chunk_y): array}
+
+        for cell_y, row in enumerate(map_data):
+            local = cell_y % chunk_size * chunk_size
+            for start in range(0, len(row), chunk_size):
+                segment = row[start:start + chunk_size]
+                if any(segment):
+                    chunk = self._get_chunk((start // chunk_size, cell_y // chunk_size))
+                    chunk[local:local + len(segment)] = array("b", segment)
+
+        super().__init__(map_data, tile_size)
+        self._data = None
+
+    @property
+    def data(self):
+        """ list[list[int]]: 2D list of tile IDs representing the map.
+
+        Built from the chunks on each access, changes to it do not affect the map.
+        Read-only property.
+        """
+        size = self._chunk_size
+        rows = []
+
+        for cell_y in range(self._height):
+            row = [0] * self._width
+            chunk_y, local_y = divmod(cell_y, size)
+
+            for start in range(0, self._width, size):
+                chunk = self._chunks.get((start // size, chunk_y))
+                if chunk:
+                    length = min(size, self._width - start)
+                    row[start:start + length] = \
+                        chunk[local_y * size:local_y * size + length].tolist()
+
+            rows.append(row)
+
+        return rows
+
+    @property
+    def chunk_size(self):
+        """ int: Width and height of a chunk in cells. Read-only property. """
+        return self._chunk_size
+
+    def _iterate_all_cells(self):
+        """ Yield the indices and tile ID of each cell in the map, row by row.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each cell.
+        """
+        for cell_y, row in enumerate(self.data):
+            for cell_x, tile_id in enumerate(row):
+                yield cell_x, cell_y, tile_id
+
+    def _iterate_filled_cells(self):
+        """ Yield the indices and tile ID of each non-empty cell in the stored chunks, row by row.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each non-empty cell.
+        """
+        cells = [cell for key in self._chunks for cell in self.iterate_chunk(key)]
+        return iter(sorted(cells, key=lambda cell: (cell[1], cell[0])))
+
+    def chunk_of_cell(self, cell_x, cell_y):
+        """ Get the chunk a cell belongs to.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+
+        Returns:
+            tuple[int, int]: The chunk indices (chunk_x, chunk_y).
+        """
+        return cell_x // self._chunk_size, cell_y // self._chunk_size
+
+    def get_chunk_rect(self, chunk):
+        """ Get the world area a chunk covers, cut to the map bounds.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+
+        Returns:
+            pygame.Rect: The area of the chunk in world pixels.
+        """
+        pixels = self._chunk_size * self._tile_size
+        rect = pygame.Rect(chunk[0] * pixels, chunk[1] * pixels, pixels, pixels)
+        return rect.clip(self._get_world_rect())
+
+    def get_chunks_in_rect(self, rect):
+        """ Get the chunks of the map that overlap a world area.
+
+        Args:
+            rect (pygame.Rect): The area in world pixels.
+
+        Returns:
+            list[tuple[int, int]]: The chunk indices, row by row.
+        """
+        area = rect.clip(self._get_world_rect())
+        if area.width <= 0 or area.height <= 0:
+            return []
+
+        pixels = self._chunk_size * self._tile_size
+        return [(chunk_x, chunk_y)
+                for chunk_y in range(area.top // pixels, (area.bottom - 1) // pixels + 1)
+                for chunk_x in range(area.left // pixels, (area.right - 1) // pixels + 1)]
+
+    def iterate_chunk(self, chunk):
+        """ Yield the non-empty cells of a chunk.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each non-empty cell.
+        """
+        tiles = self._chunks.get(chunk)
+        if tiles is None:
+            return
+
+        size = self._chunk_size
+        base_x = chunk[0] * size
+        base_y = chunk[1] * size
+
+        for index, tile_id in enumerate(tiles):
+            if tile_id:
+                yield base_x + index % size, base_y + index // size, tile_id
+
+    def get_tile_at_cell(self, cell_x, cell_y):
+        """ Get the tile ID at the specified cell.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+
+        Returns:
+            int or None: The tile ID at the specified cell, or None if out of bounds.
+        """
+        if not self.cell_in_bounds(cell_x, cell_y):
+            return None
+
+        size = self._chunk_size
+        chunk = self._chunks.get((cell_x // size, cell_y // size))
+        if chunk is None:
+            return 0
+        return chunk[cell_y % size * size + cell_x % size]
+
+    def is_empty_area(self, x, y, depth=(1, 1)):
+        """ Check if the rectangular area of cells is empty.
+
+        All cells in the area must be empty (0) and within the map bounds.
+
+        Args:
+            x (int): The x index of the area's top-left cell.
+            y (int): The y index of the area's top-left cell.
+            depth (tuple[int, int], optional): The width and height of the area. Defaults to (1, 1).
+
+        Returns:
+            bool: True if the area is entirely empty and within bounds, False otherwise.
+        """
+        width, height = depth
+        return all(self.get_tile_at_cell(x + j, y + i) == 0
+                   for i in range(height) for j in range(width))
+
+    def _write_cell(self, cell_x, cell_y, tile_id):
+        """ Store a tile ID in a cell without bounds checks or index updates.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+            tile_id (int): The tile ID to store.
+        """
+        size = self._chunk_size
+        key = (cell_x // size, cell_y // size)
+
+        if tile_id == 0 and key not in self._chunks:
+            return
+
+        self._get_chunk(key)[cell_y % size * size + cell_x % size] = tile_id
+
+    def _get_chunk(self, key):
+        """ Get the tiles of a chunk, creating an empty chunk if it is not stored.
+
+        Args:
+            key (tuple[int, int]): The chunk indices.
+
+        Returns:
+            array: The flat array of the chunk's tiles.
+        """
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = array("b", bytes(self._chunk_size * self._chunk_size))
+            self._chunks[key] = chunk
+        return chunk
+
+    def _get_world_rect(self):
+        """ Get the area of the map in world pixels.
+
+        Returns:
+            pygame.Rect: The area of the map.
+        """
+        return pygame.Rect(0, 0, self._width * self._tile_size, self._height * self._tile_size)
+
+    def _build_index(self):
+        """ Count the tiles and find the positions of the unique tiles from the stored chunks. """
+        self._counts = Counter()
+        for chunk in self._chunks.values():
+            self._counts.update(chunk)
+
+        # cells of missing chunks and cells past the map edge are stored as or count as empty
+        filled = sum(count for tile_id, count in self._counts.items() if tile_id != 0)
+        self._counts[0] = self._width * self._height - filled
+
+        self._positions = {tile_id: set() for tile_id in self._INDEXED_TILES}
+        for key in self._chunks:
+            for cell_x, cell_y, tile_id in self.iterate_chunk(key):
+                if tile_id in self._positions:
+                    self._positions[tile_id].add((cell_x, cell_y))
+
+    def _get_bounds(self):
+        """ Find the smallest rectangle that contains all non-zero tiles.
+
+        Returns:
+            tuple[int, int, int, int] or None: The bounds as (min_x, min_y, max_x, max_y),
+                or None if the map is empty.
+        """
+        cells = [(x, y) for key in self._chunks for x, y, _ in self.iterate_chunk(key)]
+        if not cells:
+            return None
+
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _move_tiles(self, offset_x, offset_y, new_width, new_height):
+        """ Move the non-empty tiles to new chunks, dropping the ones outside the new size.
+
+        Args:
+            offset_x (int): The x index the current map's left column is moved to.
+            offset_y (int): The y index the current map's top row is moved to.
+            new_width (int): New width of the map in cells.
+            new_height (int): New height of the map in cells.
+        """
+        cells = [(x + offset_x, y + offset_y, tile_id)
+                 for key in self._chunks for x, y, tile_id in self.iterate_chunk(key)]
+
+        self._chunks = {}
+        for cell_x, cell_y, tile_id in cells:
+            if 0 <= cell_x < new_width and 0 <= cell_y < new_height:
+                self._write_cell(cell_x, cell_y, tile_id)
@@ -1,7 +1,10 @@
-""" Contains the LevelData dataclass, representing the level data structure."""
+""" Contains the LevelData and LevelSummary dataclasses, representing stored levels."""
 
+from array import array
 from dataclasses import dataclass
 import json
+import struct
+import zlib
 
 
 @dataclass
@@ -12,26 +15,98 @@ class LevelData:
         id (int): The unique identifier for the level.
         name (str): The name of the level.
         data (list[list[int]]): 2D grid data representing the level layout.
+
+    Binary tile format (little-endian):
+        header: magic, version, width, height
+        tiles: zlib compressed signed bytes, one per cell, row by row
     """
 
     id: int
     name: str
     data: list[list[int]]
 
+    TILES_MAGIC = b"OTLV"
+    TILES_VERSION = 1
+    _TILES_HEADER = struct.Struct("<4sBHH")
+
     @classmethod
-    def from_db_row(cls, row: tuple) -> "LevelData":
+    def from_db_row(cls, row: tuple) -> "LevelData | None":
         """ Create a LevelData instance from a database row.
 
         Args:
             row (tuple): A tuple containing (id, name, data) as stored in the database.
+                The data is either the binary tile format or a legacy JSON string.
 
         Returns:
-            LevelData: A LevelData object.
+            LevelData or None: A LevelData object, or None if the binary data is not valid.
         """
-        level_id, name, data_json = row
-        data = json.loads(data_json)
+        level_id, name, stored = row
+
+        if isinstance(stored, bytes):
+            data = cls.decode_tiles(stored)
+            if data is None:
+                return None
+        else:
+            data = json.loads(stored)
+
         return cls(id=level_id, name=name, data=data)
 
+    @classmethod
+    def encode_tiles(cls, data) -> bytes | None:
+        """ Encode a tile grid to the binary tile format.
+
+        Args:
+            data (list[list[int]]): 2D grid of tile values.
+
+        Returns:
+            bytes or None: The encoded tiles, or None if the grid is empty, not rectangular
+                or has values that do not fit in a signed byte.
+        """
+        height = len(data)
+        width = len(data[0]) if data else 0
+
+        if width == 0 or width > 0xFFFF or height > 0xFFFF or \
+                any(len(row) != width for row in data):
+            return None
+
+        tiles = array("b")
+        try:
+            for row in data:
+                tiles.extend(row)
+        except OverflowError:
+            return None
+
+        header = cls._TILES_HEADER.pack(cls.TILES_MAGIC, cls.TILES_VERSION, width, height)
+        return header + zlib.compress(tiles.tobytes())
+
+    @classmethod
+    def decode_tiles(cls, blob) -> list[list[int]] | None:
+        """ Decode a tile grid from the binary tile format.
+
+        Args:
+            blob (bytes): The encoded tiles.
+
+        Returns:
+            list[list[int]] or None: The 2D grid of tile values, or None if the data is not valid.
+        """
+        if len(blob) < cls._TILES_HEADER.size:
+            return None
+
+        magic, version, width, height = cls._TILES_HEADER.unpack_from(blob)
+        if magic != cls.TILES_MAGIC or version != cls.TILES_VERSION:
+            return None
+
+        try:
+            raw = zlib.decompress(blob[cls._TILES_HEADER.size:])
+        except zlib.error:
+            return None
+
+        if len(raw) != width * height:
+            return None
+
+        tiles = array("b", raw).tolist()
+        return [tiles[y * width:(y + 1) * width] for y in range(height)]
+
     @classmethod
     def is_valid(cls, obj) -> bool:
         """Check if the given data is a valid LevelData object.
@@ -54,3 +129,22 @@ class LevelData:
                 for row in obj.data
             )
         )
+
+
+@dataclass
+class LevelSummary:
+    """Dataclass with the listing information of a level, without the level layout.
+
+    Attributes:
+        id (int): The unique identifier for the level.
+        name (str): The name of the level.
+        width (int): Width of the level in cells.
+        height (int): Height of the level in cells.
+        best_time (float or None): The best time for the level, None if there are no times.
+    """
+
+    id: int
+    name: str
+    width: int
+    height: int
+    best_time: float | None = None
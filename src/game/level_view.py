@@ -0,0 +1,63 @@
+""" Contains the LevelView class, the camera of a level and the map chunks around it."""
+
+from constants import Settings, CollisionMode
+from game.camera import Camera
+from game.chunk_loader import ChunkLoader
+from game.tile_layer import TileLayer
+
+
+class LevelView:
+    """ The camera of a level and the map chunks loaded around it.
+
+    Moving the view loads the chunks near the camera and releases the far ones,
+    so the tile layer and the chunk sprites always match the area in view.
+
+    Attributes:
+        camera (Camera): The view into the level.
+        tile_layer (TileLayer): The drawn tiles of the loaded chunks.
+        chunks (ChunkLoader): Creates and releases the sprites of the chunks.
+        objects (dict): The placeables of the loaded chunks by cell.
+        alpha (float or None): Interpolation factor between the last two updates,
+            used when drawing. None draws the current positions.
+    """
+
+    def __init__(self, tile_map, sprites, collision_mode=CollisionMode.SPRITES):
+        """ Initialize the LevelView with the camera at the top-left corner of the level.
+
+        The world is the size of the map, but at least the size of the screen.
+
+        Args:
+            tile_map (ChunkMap): The map of the level.
+            sprites (Sprites): The sprites of the level, the chunk sprites are added to it
+                and the tile layer is drawn with it.
+            collision_mode (CollisionMode, optional): The collision backend of the level.
+                Defaults to CollisionMode.SPRITES.
+        """
+        self.camera = Camera((
+            max(tile_map.width * tile_map.tile_size, Settings.SCREEN_WIDTH),
+            max(tile_map.height * tile_map.tile_size, Settings.SCREEN_HEIGHT)))
+
+        self.tile_layer = TileLayer(tile_map)
+        sprites.set_tile_layer(self.tile_layer)
+
+        self.objects = {}
+        self.chunks = ChunkLoader(tile_map, sprites, self.tile_layer, self.objects,
+                                  collision_mode)
+        self.alpha = None
+
+    def follow(self, target):
+        """ Center the camera on a target and load the chunks around the new view.
+
+        Args:
+            target (pygame.Rect): The rect to center on.
+        """
+        self.camera.follow(target)
+        self.chunks.update(self.camera.rect)
+
+    def get_draw_offset(self):
+        """ Get the camera offset to draw with, interpolated with alpha.
+
+        Returns:
+            tuple[int, int]: The offset to subtract from world positions.
+        """
+        return self.camera.get_draw_offset(self.alpha)
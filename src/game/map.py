@@ -1,5 +1,8 @@
 """ Contains the Map class, which represents a 2D grid of tiles for game levels. """
 
+from collections import Counter
+from itertools import chain
+
 from constants import TileType, Settings
 
 
@@ -11,6 +14,12 @@ class Map:
     iterating over cells and map resizing,
     as well as performing coordinate conversion between screen, world and cell space.
 
+    Keeps a count of each tile ID and the positions of the unique tiles (spawn, end),
+    updated on every change, so tile lookups do not have to scan the map.
+    Multi-tiles also record the top-left cell owning each of their filler cells,
+    so finding the corner does not depend on the multi-tile size. The multi-tiles of
+    the loaded map data are found when the map is created.
+
     Attributes:
         data (list[list[int]]): 2D list representing the map data, where each element is a tile ID.
         width (int): Width of the map in cells.
@@ -18,6 +27,8 @@ class Map:
         tile_size (int): Size of each tile in pixels.
     """
 
+    _INDEXED_TILES = (TileType.SPAWN, TileType.END)
+
     def __init__(self, map_data, tile_size=Settings.TILE_SIZE):
         """ Initializes the Map object.
 
@@ -30,6 +41,14 @@ class Map:
         self._height = len(map_data)
         self._tile_size = tile_size
 
+        self._counts = Counter()
+        self._positions = {}
+        self._build_index()
+
+        self._anchors = {}  # {filler cell: top-left cell}
+        self._areas = {}  # {top-left cell: (width, height)}
+        self._build_multi_tile_index()
+
     @property
     def data(self):
         """ list[list[int]]: 2D list of tile IDs representing the map. Read-only property. """
@@ -50,8 +69,28 @@ class Map:
         """ int: Size of each tile in pixels. Read-only property. """
         return self._tile_size
 
-    def iterate_cells(self):
-        """ Yield the indices and tile ID of each cell in the map.
+    def iterate_cells(self, tile_id=None):
+        """ Yield the indices and tile ID of the cells in the map, row by row.
+
+        Args:
+            tile_id (int, optional): Only yield the cells with this tile ID. The cells of
+                the unique tiles (spawn, end) are taken from the tile index without scanning
+                the map. Defaults to None, which yields every cell.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each cell.
+        """
+        if tile_id in self._positions:
+            for cell_x, cell_y in sorted(self._positions[tile_id], key=lambda cell: cell[::-1]):
+                yield cell_x, cell_y, tile_id
+            return
+
+        for cell in self._iterate_all_cells():
+            if tile_id is None or cell[2] == tile_id:
+                yield cell
+
+    def _iterate_all_cells(self):
+        """ Yield the indices and tile ID of each cell in the map, row by row.
 
         Yields:
             tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each cell.
@@ -60,6 +99,88 @@ class Map:
             for x in range(self._width):
                 yield x, y, self._data[y][x]
 
+    def _iterate_filled_cells(self):
+        """ Yield the indices and tile ID of each non-empty cell in the map, row by row.
+
+        Yields:
+            tuple[int, int, int]: Contains (cell_x, cell_y, tile_id) for each non-empty cell.
+        """
+        return (cell for cell in self._iterate_all_cells() if cell[2] != 0)
+
+    def _build_index(self):
+        """ Count the tiles and find the positions of the unique tiles from the whole map. """
+        self._counts = Counter(chain.from_iterable(self._data))
+        self._positions = {tile_id: set() for tile_id in self._INDEXED_TILES}
+
+        for y, row in enumerate(self._data):
+            for tile_id, positions in self._positions.items():
+                if tile_id in row:
+                    positions.update((x, y) for x, cell in enumerate(row) if cell == tile_id)
+
+    def _build_multi_tile_index(self):
+        """ Find the multi-tiles of the map and record the top-left cell of their filler cells.
+
+        A multi-tile is a top-left cell with a tile ID and a rectangle of cells with
+        the negative tile ID to its right and below it, as made by add_multi_tile.
+        Filler cells not in such a rectangle are left without a recorded corner.
+        """
+        self._anchors = {}
+        self._areas = {}
+
+        for x, y, tile_id in self._iterate_filled_cells():
+            if tile_id < 0 or (x, y) in self._anchors:
+                continue
+
+            width, height = self._find_multi_tile_depth(x, y, tile_id)
+            fillers = [(x + j, y + i) for i in range(height) for j in range(width) if i or j]
+
+            if fillers and all(self.get_tile_at_cell(*cell) == -tile_id
+                               and cell not in self._anchors for cell in fillers):
+                self._anchors.update((cell, (x, y)) for cell in fillers)
+                self._areas[(x, y)] = (width, height)
+
+    def _find_multi_tile_depth(self, x, y, tile_id):
+        """ Measure the filler cells to the right of and below a multi-tile's top-left cell.
+
+        Args:
+            x (int): The x index of the top-left cell.
+            y (int): The y index of the top-left cell.
+            tile_id (int): The tile ID of the top-left cell.
+
+        Returns:
+            tuple[int, int]: The width and height of the multi-tile.
+        """
+        width = 1
+        while self.get_tile_at_cell(x + width, y) == -tile_id:
+            width += 1
+
+        height = 1
+        while self.get_tile_at_cell(x, y + height) == -tile_id:
+            height += 1
+
+        return width, height
+
+    def _update_index(self, cell_x, cell_y, old_id, new_id):
+        """ Update the tile counts and positions after a cell has changed.
+
+        Args:
+            cell_x (int): The x index of the changed cell.
+            cell_y (int): The y index of the changed cell.
+            old_id (int): The tile ID the cell had.
+            new_id (int): The tile ID the cell has now.
+        """
+        self._counts[old_id] -= 1
+        self._counts[new_id] += 1
+
+        if old_id in self._positions:
+            self._positions[old_id].discard((cell_x, cell_y))
+        if new_id in self._positions:
+            self._positions[new_id].add((cell_x, cell_y))
+
+        # a changed cell no longer belongs to the multi-tile it was part of
+        self._anchors.pop((cell_x, cell_y), None)
+        self._areas.pop((cell_x, cell_y), None)
+
     def snap_to_grid(self, pos):
         """ Snap screen position to the nearest grid-aligned position.
 
@@ -109,53 +230,122 @@ class Map:
     def expand_map(self, screen_w=Settings.SCREEN_WIDTH, screen_h=Settings.SCREEN_HEIGHT):
         """ Expand the map to the given screen size, centering the current map data.
 
+        A map larger than the screen keeps its size on that axis, so no tiles are cut off.
+
         Args:
             screen_w (int, optional): Width in pixels. Defaults to Settings.SCREEN_WIDTH.
             screen_h (int, optional): Height in pixels. Defaults to Settings.SCREEN_HEIGHT.
         """
-        new_width = screen_w // self._tile_size
-        new_height = screen_h // self._tile_size
+        new_width = max(self._width, screen_w // self._tile_size)
+        new_height = max(self._height, screen_h // self._tile_size)
 
         pad_x = (new_width - self._width) // 2
         pad_y = (new_height - self._height) // 2
 
-        new_map_data = [[0 for _ in range(new_width)]
-                        for _ in range(new_height)]
+        self._resize(pad_x, pad_y, new_width, new_height)
 
-        for y in range(self._height):
-            for x in range(self._width):
-                new_map_data[y+pad_y][x+pad_x] = self._data[y][x]
+    def shrink_map(self):
+        """ Shrink the map to the smallest rectangle that contains all non-zero tiles.
 
-        self._data = new_map_data
+        An empty map is shrunk to a single empty cell.
+        """
+        bounds = self._get_bounds()
+        if bounds is None:
+            self._resize(0, 0, 1, 1)
+            return
+
+        min_x, min_y, max_x, max_y = bounds
+        self._resize(-min_x, -min_y, max_x - min_x + 1, max_y - min_y + 1)
+
+    def _get_bounds(self):
+        """ Find the smallest rectangle that contains all non-zero tiles.
+
+        Uses a reduction over the rows and then over the columns of the non-empty rows.
+
+        Returns:
+            tuple[int, int, int, int] or None: The bounds as (min_x, min_y, max_x, max_y),
+                or None if the map is empty.
+        """
+        filled = [y for y, row in enumerate(self._data) if any(row)]
+        if not filled:
+            return None
+
+        min_y, max_y = filled[0], filled[-1]
+        columns = [any(column) for column in zip(*self._data[min_y:max_y + 1])]
+
+        min_x = columns.index(True)
+        max_x = len(columns) - 1 - columns[::-1].index(True)
+
+        return min_x, min_y, max_x, max_y
+
+    def _resize(self, offset_x, offset_y, new_width, new_height):
+        """ Change the size of the map, moving the current tiles by an offset.
+
+        Only empty cells may be cut off, so the tile index is moved instead of rebuilt.
+
+        Args:
+            offset_x (int): The x index the current map's left column is moved to.
+            offset_y (int): The y index the current map's top row is moved to.
+            new_width (int): New width of the map in cells.
+            new_height (int): New height of the map in cells.
+        """
+        old_cells = self._width * self._height
+        self._move_tiles(offset_x, offset_y, new_width, new_height)
         self._width = new_width
         self._height = new_height
 
-    def shrink_map(self):
-        """ Shrink the map to the smallest rectangle that contains all non-zero tiles. """
-        min_x, min_y = self._width, self._height
-        max_x, max_y = 0, 0
+        self._counts[TileType.EMPTY] += new_width * new_height - old_cells
+        for positions in self._positions.values():
+            moved = {(x + offset_x, y + offset_y) for x, y in positions}
+            positions.clear()
+            positions.update(moved)
 
-        for y in range(self._height):
-            for x in range(self._width):
-                if self._data[y][x] != 0:
-                    min_x = min(min_x, x)
-                    max_x = max(max_x, x)
-                    min_y = min(min_y, y)
-                    max_y = max(max_y, y)
+        self._anchors = {(x + offset_x, y + offset_y): (anchor_x + offset_x, anchor_y + offset_y)
+                         for (x, y), (anchor_x, anchor_y) in self._anchors.items()}
+        self._areas = {(x + offset_x, y + offset_y): depth
+                       for (x, y), depth in self._areas.items()}
 
-        new_width = max_x - min_x + 1
-        new_height = max_y - min_y + 1
+    def _move_tiles(self, offset_x, offset_y, new_width, new_height):
+        """ Replace the tiles with a grid of a new size, copying the current tiles by row slices.
 
-        new_map_data = [[0 for _ in range(new_width)]
-                        for _ in range(new_height)]
+        Args:
+            offset_x (int): The x index the current map's left column is moved to.
+            offset_y (int): The y index the current map's top row is moved to.
+            new_width (int): Width of the new grid in cells.
+            new_height (int): Height of the new grid in cells.
+        """
+        new_map_data = [[0] * new_width for _ in range(new_height)]
+        src_x, dst_x, length, rows = self._get_copy_span(
+            offset_x, offset_y, new_width, new_height)
 
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                new_map_data[y - min_y][x - min_x] = self._data[y][x]
+        for src_y in rows:
+            new_map_data[src_y + offset_y][dst_x:dst_x + length] = \
+                self._data[src_y][src_x:src_x + length]
 
         self._data = new_map_data
-        self._width = new_width
-        self._height = new_height
+
+    def _get_copy_span(self, offset_x, offset_y, new_width, new_height):
+        """ Get the part of each row that stays inside a resized map.
+
+        Args:
+            offset_x (int): The x index the current map's left column is moved to.
+            offset_y (int): The y index the current map's top row is moved to.
+            new_width (int): Width of the new map in cells.
+            new_height (int): Height of the new map in cells.
+
+        Returns:
+            tuple[int, int, int, range]: The source x index, destination x index and length
+                of the row slices, and the source rows to copy.
+        """
+        src_x = max(-offset_x, 0)
+        dst_x = max(offset_x, 0)
+        length = min(self._width - src_x, new_width - dst_x)
+
+        if length <= 0:
+            return src_x, dst_x, 0, range(0)
+
+        rows = range(max(-offset_y, 0), min(self._height, new_height - offset_y))
+        return src_x, dst_x, length, rows
 
     def get_tile_at_cell(self, cell_x, cell_y):
         """ Get the tile ID at the specified cell.
@@ -183,10 +373,22 @@ class Map:
             bool: True if the tile was set successfully, False if out of bounds.
         """
         if self.cell_in_bounds(cell_x, cell_y):
-            self._data[cell_y][cell_x] = tile_id
+            old_id = self.get_tile_at_cell(cell_x, cell_y)
+            self._write_cell(cell_x, cell_y, tile_id)
+            self._update_index(cell_x, cell_y, old_id, tile_id)
             return True
         return False
 
+    def _write_cell(self, cell_x, cell_y, tile_id):
+        """ Store a tile ID in a cell without bounds checks or index updates.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+            tile_id (int): The tile ID to store.
+        """
+        self._data[cell_y][cell_x] = tile_id
+
     def cell_in_bounds(self, cell_x, cell_y):
         """ Check if the specified cell is within the map bounds.
 
@@ -208,11 +410,7 @@ class Map:
         Returns:
             bool: True if the tile ID is found in the map, False otherwise.
         """
-        for y in range(self._height):
-            for x in range(self._width):
-                if self._data[y][x] == tile_id:
-                    return True
-        return False
+        return self._counts.get(tile_id, 0) > 0
 
     def is_empty_area(self, x, y, depth=(1, 1)):
         """ Check if the rectangular area of cells is empty.
@@ -278,19 +476,27 @@ class Map:
                     self.set_tile_at_cell(x + j, y + i, tile_id)
                 else:
                     self.set_tile_at_cell(x + j, y + i, -tile_id)
+                    self._anchors[(x + j, y + i)] = (x, y)
+
+        self._areas[(x, y)] = (width, height)
         return True
 
-    def remove_multi_tile(self, x, y, depth=(1, 1)):
+    def remove_multi_tile(self, x, y, depth=None):
         """ Remove all tiles from the rectangular area of cells.
 
         Args:
             x (int): The x index of the area's top-left cell.
             y (int): The y index of the area's top-left cell.
-            depth (tuple[int, int], optional): The width and height of the area. Defaults to (1, 1).
+            depth (tuple[int, int], optional): The width and height of the area.
+                Defaults to None, which uses the size of the multi-tile at the cell,
+                or a single cell if there is no multi-tile.
 
         Returns:
             bool: True if the area was removed successfully, False if any cell is out of bounds.
         """
+        if depth is None:
+            depth = self._areas.get((x, y), (1, 1))
+
         width, height = depth
         if not self.is_area_in_bounds(x, y, depth):
             return False
@@ -304,8 +510,10 @@ class Map:
         """ Find the nearest top-left cell of a tile in area with the given tile_id.
 
         If given tile_id is positive, only the starting cell (x, y) is checked.
-        If given tile_id is negative, searches for the nearest cell with the same absolute tile id.
+        If given tile_id is negative, the recorded corner of the multi-tile is returned.
 
+        Cells without a recorded corner (filler cells that are not part of a complete
+        multi-tile) are searched for the nearest cell with the same absolute tile id instead.
         Searches in a diamond pattern from the starting cell (x, y) and expanding outwards.
         The search area is limited to the given depth in both x and y directions from the center.
 
@@ -322,6 +530,10 @@ class Map:
         if tile_id > 0:
             return (x, y) if self.get_tile_at_cell(x, y) == tile_id else None
 
+        anchor = self._anchors.get((x, y))
+        if anchor is not None and self.get_tile_at_cell(*anchor) == -tile_id:
+            return anchor
+
         for distance in range(1, max_x + max_y + 1):
             for i in range(0, min(distance, max_x) + 1):
                 j = distance - i
@@ -0,0 +1,166 @@
+""" Contains the Replay class for recording level input and its binary format."""
+
+import struct
+
+from constants import InputAction, Settings
+
+
+class Replay:
+    """ Recording of the input given to a level, one entry per update tick.
+
+    Held keys are stored as a bitmask per tick, run-length encoded since the same
+    keys are usually held for many ticks in a row. Mouse clicks are stored
+    separately as events with the tick they were made on.
+
+    Binary format (little-endian):
+        header: magic, version, tick rate, level ID, tick count, run count, click count
+        runs: (key mask, length) for each run of ticks with the same keys held
+        clicks: (tick, button, x, y) for each click
+    """
+
+    MAGIC = b"OTRP"
+    VERSION = 1
+
+    _HEADER = struct.Struct("<4sBHiIII")
+    _RUN = struct.Struct("<BH")
+    _CLICK = struct.Struct("<IBhh")
+    _MAX_RUN = 0xFFFF
+
+    _KEYS = (InputAction.LEFT, InputAction.RIGHT,
+             InputAction.JUMP, InputAction.DOWN)
+    _BUTTONS = (InputAction.MOUSE_LEFT, InputAction.MOUSE_RIGHT,
+                InputAction.MOUSE_SCROLL_UP, InputAction.MOUSE_SCROLL_DOWN)
+
+    def __init__(self, level_id, tick_rate=Settings.TICK_RATE):
+        """ Initialize an empty Replay.
+
+        Args:
+            level_id (int): The ID of the recorded level.
+            tick_rate (int, optional): Updates per second the level was played at.
+                Defaults to Settings.TICK_RATE.
+        """
+        self.level_id = level_id
+        self.tick_rate = tick_rate
+
+        self._runs = []
+        self._clicks = []
+        self._ticks = 0
+        self._mask = 0
+
+    @property
+    def ticks(self):
+        """ int: Number of recorded ticks. Read-only property. """
+        return self._ticks
+
+    def add_key(self, key):
+        """ Record a key held during the current tick.
+
+        Args:
+            key (InputAction): The key held.
+        """
+        if key in self._KEYS:
+            self._mask |= 1 << self._KEYS.index(key)
+
+    def add_click(self, click, pos):
+        """ Record a mouse click made before the current tick.
+
+        Args:
+            click (InputAction): The mouse button clicked.
+            pos (tuple[int,int]): The position of the click.
+        """
+        if click in self._BUTTONS:
+            self._clicks.append(
+                (self._ticks, self._BUTTONS.index(click), int(pos[0]), int(pos[1])))
+
+    def end_tick(self):
+        """ Finish the current tick and store the keys held during it."""
+        if self._runs and self._runs[-1][0] == self._mask and \
+                self._runs[-1][1] < self._MAX_RUN:
+            self._runs[-1][1] += 1
+        else:
+            self._runs.append([self._mask, 1])
+
+        self._mask = 0
+        self._ticks += 1
+
+    def iterate_ticks(self):
+        """ Iterate the recorded input tick by tick.
+
+        Yields:
+            tuple[tuple[InputAction], tuple[tuple[InputAction, tuple[int,int]]]]:
+                The held keys and the clicks made for each tick.
+        """
+        clicks = iter(self._clicks)
+        click = next(clicks, None)
+        tick = 0
+
+        for mask, length in self._runs:
+            keys = tuple(key for i, key in enumerate(self._KEYS) if mask & (1 << i))
+
+            for _ in range(length):
+                tick_clicks = []
+                while click is not None and click[0] == tick:
+                    tick_clicks.append((self._BUTTONS[click[1]], (click[2], click[3])))
+                    click = next(clicks, None)
+
+                yield keys, tuple(tick_clicks)
+                tick += 1
+
+    def to_bytes(self):
+        """ Encode the replay to its binary format.
+
+        Returns:
+            bytes: The encoded replay.
+        """
+        # clicks after the last update never affected the level
+        clicks = [click for click in self._clicks if click[0] < self._ticks]
+
+        parts = [self._HEADER.pack(self.MAGIC, self.VERSION, self.tick_rate, self.level_id,
+                                   self._ticks, len(self._runs), len(clicks))]
+        parts.extend(self._RUN.pack(mask, length) for mask, length in self._runs)
+        parts.extend(self._CLICK.pack(*click) for click in clicks)
+
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> "Replay | None":
+        """ Decode a replay from its binary format.
+
+        Args:
+            data (bytes): The encoded replay.
+
+        Returns:
+            Replay or None: The decoded replay, or None if the data is not a valid replay.
+        """
+        if len(data) < cls._HEADER.size:
+            return None
+
+        magic, version, tick_rate, level_id, ticks, run_count, click_count = \
+            cls._HEADER.unpack_from(data)
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            return None
+
+        offset = cls._HEADER.size
+        if len(data) != offset + run_count * cls._RUN.size + click_count * cls._CLICK.size:
+            return None
+
+        replay = cls(level_id, tick_rate)
+
+        for _ in range(run_count):
+            replay._runs.append(list(cls._RUN.unpack_from(data, offset)))
+            offset += cls._RUN.size
+
+        for _ in range(click_count):
+            replay._clicks.append(cls._CLICK.unpack_from(data, offset))
+            offset += cls._CLICK.size
+
+        replay._ticks = ticks
+
+        if sum(length for _, length in replay._runs) != ticks:
+            return None
+
+        if any(click[0] >= ticks or click[1] >= len(cls._BUTTONS) for click in replay._clicks):
+            return None
+
+        return replay
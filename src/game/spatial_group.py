@@ -0,0 +1,114 @@
+""" Contains the SpatialGroup class, a sprite group with a spatial index for collisions."""
+
+import pygame
+
+from game.spatial_hash import SpatialHash
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """ Sprite group that keeps its sprites in a SpatialHash.
+
+    Works like a normal pygame.sprite.Group, but collision queries only check
+    the sprites in the grid cells the queried rect overlaps.
+    The index is updated when sprites are added or killed.
+    Sprites in the group are expected not to move.
+    """
+
+    def __init__(self, cell_size, *sprites):
+        """ Initialize the SpatialGroup.
+
+        Args:
+            cell_size (int): Size of a single index cell in pixels, usually the tile size.
+            *sprites (pygame.sprite.Sprite): Sprites to add to the group.
+        """
+        self._index = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._index.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._index.remove(sprite)
+
+    def collide_rect(self, rect):
+        """ Get the rects of all sprites colliding with the given rect.
+
+        Args:
+            rect (pygame.Rect): The rect to check for collisions.
+
+        Returns:
+            list[pygame.Rect]: The rects of the colliding sprites.
+        """
+        return [sprite.rect for sprite in self._index.query(rect)]
+
+
+class SpatialDrawGroup(pygame.sprite.LayeredUpdates):
+    """ Layered sprite group that keeps the draw areas of its sprites in a SpatialHash.
+
+    Used to find the sprites in view without checking every sprite in the group.
+    Unlike SpatialGroup its sprites may move, but a moved sprite is only found
+    at its new position after it is indexed again with refresh.
+    """
+
+    def __init__(self, cell_size, *sprites, **kwargs):
+        """ Initialize the SpatialDrawGroup.
+
+        Args:
+            cell_size (int): Size of a single index cell in pixels.
+            *sprites (pygame.sprite.Sprite): Sprites to add to the group.
+            **kwargs: Keyword arguments passed to pygame.sprite.LayeredUpdates, such as layer.
+        """
+        self._index = SpatialHash(cell_size)
+        self._order = {}
+        self._added = 0
+        super().__init__(*sprites, **kwargs)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._order[sprite] = self._added
+        self._added += 1
+        self._index.insert(sprite, self._get_area(sprite))
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        del self._order[sprite]
+        self._index.remove(sprite)
+
+    def refresh(self, *sprites):
+        """ Index the current draw areas of moved sprites.
+
+        Sprites not in the group are ignored.
+
+        Args:
+            *sprites (pygame.sprite.Sprite): The sprites that moved.
+        """
+        for sprite in sprites:
+            if sprite in self._order:
+                self._index.insert(sprite, self._get_area(sprite))
+
+    def get_sprites_in_rect(self, rect):
+        """ Get the sprites whose indexed draw area collides with the given rect.
+
+        Args:
+            rect (pygame.Rect): The area to check.
+
+        Returns:
+            list[pygame.sprite.Sprite]: The sprites in drawing order, by layer
+                and then by the order they were added.
+        """
+        found = self._index.query(rect)
+        found.sort(key=lambda sprite: (self.get_layer_of_sprite(sprite), self._order[sprite]))
+        return found
+
+    def _get_area(self, sprite):
+        """ Get the area a sprite is drawn to at its current rect.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite.
+
+        Returns:
+            pygame.Rect: The draw area of the sprite.
+        """
+        return sprite.image.get_rect(topleft=sprite.rect.topleft)
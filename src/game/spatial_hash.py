@@ -0,0 +1,107 @@
+""" Contains the SpatialHash class, a uniform grid index for rectangle queries."""
+
+
+class SpatialHash:
+    """ Uniform grid that buckets items by the cells their rects overlap.
+
+    Used to find the items near a rectangle without checking every item.
+    Items are expected to be static while they are in the index,
+    moving an item requires removing and inserting it again.
+    """
+
+    def __init__(self, cell_size):
+        """ Initialize the SpatialHash class.
+
+        Args:
+            cell_size (int): Width and height of a single grid cell in pixels.
+        """
+        self._cell_size = cell_size
+        self._cells = {}  # {(cell_x, cell_y): {item: pygame.Rect}}
+        self._items = {}  # {item: [(cell_x, cell_y)]}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def insert(self, item, rect):
+        """ Add an item to every cell its rect overlaps.
+
+        If the item is already in the index, it is moved to the new rect.
+
+        Args:
+            item (Hashable): The item to store.
+            rect (pygame.Rect): The rect of the item.
+        """
+        if item in self._items:
+            self.remove(item)
+
+        cells = list(self._cells_in_rect(rect))
+        for cell in cells:
+            self._cells.setdefault(cell, {})[item] = rect
+
+        self._items[item] = cells
+
+    def remove(self, item):
+        """ Remove an item from the index.
+
+        Args:
+            item (Hashable): The item to remove.
+
+        Returns:
+            bool: True if the item was removed, False if it was not in the index.
+        """
+        cells = self._items.pop(item, None)
+        if cells is None:
+            return False
+
+        for cell in cells:
+            bucket = self._cells[cell]
+            del bucket[item]
+            if not bucket:
+                del self._cells[cell]
+
+        return True
+
+    def clear(self):
+        """ Remove all items from the index."""
+        self._cells.clear()
+        self._items.clear()
+
+    def query(self, rect):
+        """ Get all items whose rect collides with the given rect.
+
+        Args:
+            rect (pygame.Rect): The area to check.
+
+        Returns:
+            list: The colliding items in insertion order of their cells.
+        """
+        found = {}
+        for cell in self._cells_in_rect(rect):
+            bucket = self._cells.get(cell)
+            if not bucket:
+                continue
+            for item, item_rect in bucket.items():
+                if item not in found and rect.colliderect(item_rect):
+                    found[item] = None
+
+        return list(found)
+
+    def _cells_in_rect(self, rect):
+        """ Yield the indices of all cells the rect overlaps.
+
+        Args:
+            rect (pygame.Rect): The rect to get the cells for.
+
+        Yields:
+            tuple[int, int]: The cell indices (cell_x, cell_y).
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return
+
+        size = self._cell_size
+        for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield cell_x, cell_y
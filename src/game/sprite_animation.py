@@ -1,29 +1,201 @@
-""" Contains the SpriteAnimation class for handling sprite animations."""
+""" Contains the SpriteAnimation class for handling sprite animations,
+the FrameSet class for its loaded frames and the FrameSetRegistry
+for sharing the frames between animations."""
 
 import pygame
 from tools.asset_helpers import load_image, get_spritesheet_frames
 
 
+class FrameSetRegistry:
+    """A reference-counted registry of loaded animation frame sets.
+
+    Animations of the same sprite type share the same frames instead of each
+    loading, scaling and compositing their own copies. A frame set is removed
+    from the registry when the last animation using it releases it.
+    The shared frames must not be modified.
+    """
+    _frame_sets = {}
+
+    @classmethod
+    def acquire(cls, key, loader):
+        """Get a frame set, loading it if not already loaded.
+
+        Every acquire must be matched by a release.
+
+        Args:
+            key (tuple): Key identifying the frame set.
+            loader (Callable[[], tuple]): Function that loads the frame set.
+
+        Returns:
+            tuple: The frame set.
+        """
+        entry = cls._frame_sets.get(key)
+
+        if entry is None:
+            entry = [loader(), 0]
+            cls._frame_sets[key] = entry
+
+        entry[1] += 1
+        return entry[0]
+
+    @classmethod
+    def release(cls, key):
+        """Release a frame set, removing it from the registry if no longer used.
+
+        Args:
+            key (tuple): Key identifying the frame set.
+        """
+        entry = cls._frame_sets.get(key)
+
+        if entry is None:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del cls._frame_sets[key]
+
+    @classmethod
+    def get_ref_count(cls, key):
+        """Get the number of users of a frame set.
+
+        Args:
+            key (tuple): Key identifying the frame set.
+
+        Returns:
+            int: The number of users, 0 if the frame set is not loaded.
+        """
+        entry = cls._frame_sets.get(key)
+        return entry[1] if entry else 0
+
+    @classmethod
+    def clear(cls):
+        """Clear all frame sets."""
+        cls._frame_sets.clear()
+
+
+class FrameSet:
+    """Frames of one sprite sheet in normal and flipped variants.
+
+    The frames are composited on the base image and flipped once when loaded,
+    and shared through the FrameSetRegistry with every FrameSet of the same key.
+    The frames stay usable after the frame set is released.
+    """
+
+    def __init__(self, key):
+        """Acquire the frames of a sprite sheet from the FrameSetRegistry.
+
+        Args:
+            key (tuple): Describes the frames as (asset, frame_size, count, scale, base,
+                base_alpha), see _load_frames. Also the key of the frames in the registry.
+        """
+        self._key = key
+        self._frames, self._flipped_frames = FrameSetRegistry.acquire(
+            key, lambda: self._load_frames(key))
+        self._released = False
+
+    @property
+    def key(self):
+        """tuple: Key of the frame set in the FrameSetRegistry. Read-only property."""
+        return self._key
+
+    def get_frames(self, flipped=False):
+        """Get the frames of the set.
+
+        Args:
+            flipped (bool, optional): True to get the flipped frames. Defaults to False.
+
+        Returns:
+            tuple[pygame.Surface]: The frames in order.
+        """
+        return self._flipped_frames if flipped else self._frames
+
+    def release(self):
+        """Release the frame set in the registry. Calling release again does nothing."""
+        if not self._released:
+            FrameSetRegistry.release(self._key)
+            self._released = True
+
+    @staticmethod
+    def _load_frames(key):
+        """Load the frames of a sheet in normal and flipped variants.
+
+        Args:
+            key (tuple): Contains (asset, frame_size, count, scale, base, base_alpha):
+                the asset filename or path relative to the assets folder,
+                the size (width, height) of each frame in the sheet,
+                the number of frames to read from the sheet,
+                the size (width, height) to scale the frames to, (0, 0) to not scale,
+                the asset filename of an image drawn under every frame or None,
+                and the alpha of that image (0 - 255).
+
+        Returns:
+            tuple[tuple[pygame.Surface], tuple[pygame.Surface]]: The normal and flipped frames.
+        """
+        asset, (frame_width, frame_height), count, scale, base, base_alpha = key
+
+        sheet = load_image(asset, convert_alpha=True)
+
+        frames = get_spritesheet_frames(
+            sheet, frame_width, frame_height, count=count, scale=scale)
+
+        base_image = None
+        if base:
+            # copy, the cached image is shared
+            base_image = load_image(base).copy()
+            base_image.set_alpha(base_alpha)
+
+        return (
+            tuple(FrameSet._composite(base_image, frame) for frame in frames),
+            tuple(FrameSet._composite(base_image, pygame.transform.flip(frame, True, False))
+                  for frame in frames)
+        )
+
+    @staticmethod
+    def _composite(base, frame):
+        """Draw a frame on top of the base image.
+
+        Args:
+            base (pygame.Surface or None): The base image.
+            frame (pygame.Surface): The frame to draw.
+
+        Returns:
+            pygame.Surface: A new surface with the base and the frame.
+        """
+        image = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
+        if base:
+            image.blit(base, (0, 0))
+        image.blit(frame, (0, 0))
+        return image
+
+
 class SpriteAnimation:
     """ Stores and handles sprite animations.
 
     Provides methods to update the animation frames, add new image sets,
     retrieve frames, reset animations and change animation modes.
+
+    Frames are composited on the base image and flipped horizontally once when loaded,
+    so getting a frame never renders anything. The frames are shared through the
+    FrameSetRegistry as FrameSet objects, each animation only keeps its own playback state.
     """
 
-    def __init__(self, fps=15, scale=(0, 0)):
+    def __init__(self, fps=15, scale=(0, 0), base=None, base_alpha=255):
         """ Initialize the SpriteAnimation class.
         Args:
             fps (int, optional): Frames per second for the animation. Defaults to 15.
             scale (tuple[int, int], optional): Size (width, height) to scale the frames to.
                 Defaults to (0, 0), which disables scaling and uses the original frame sizes.
+            base (str, optional): Asset filename of an image drawn under every frame.
+                Defaults to None.
+            base_alpha (int, optional): Alpha of the base image (0 - 255). Defaults to 255.
         """
         self._fps = fps
-        self._scale = scale
+        self._frame_options = (tuple(scale), base, base_alpha)
+        self._frame_sets = {}
         self._current_frame = 0
         self._animation_time = 0.0
         self._mode = 0
-        self._images = {}
+        self._flipped = False
 
     def update(self, dt):
         """ Update the animation state based on the time elapsed.
@@ -47,12 +219,20 @@ class SpriteAnimation:
             frame_size (tuple[int, int]): The size (width, height) of each frame in the sheet.
             count (int): The number of frames to read from the sprite sheet.
         """
-        frame_width, frame_height = frame_size
+        if name in self._frame_sets:
+            self._frame_sets[name].release()
+
+        self._frame_sets[name] = FrameSet(
+            (asset, tuple(frame_size), count, *self._frame_options))
 
-        sheet = load_image(asset)
+    def release(self):
+        """ Release the frame sets used by the animation.
 
-        self._images[name] = get_spritesheet_frames(
-            sheet, frame_width, frame_height, count=count, scale=self._scale)
+        The frames stay usable by this animation, but are no longer shared with
+        animations created later. Calling release again does nothing.
+        """
+        for frame_set in self._frame_sets.values():
+            frame_set.release()
 
     def get_frame(self, name, index=-1):
         """ Get a frame from the specified animation set.
@@ -63,17 +243,28 @@ class SpriteAnimation:
                 Defaults to -1, which return the current frame based on the internal timer.
 
         Returns:
-            pygame.Surface: The requested frame, or a blank surface if not found.
+            pygame.Surface: The requested frame, flipped if set with set_flipped,
+                or a blank surface if not found.
         """
-        if name in self._images:
+        frame_set = self._frame_sets.get(name)
+
+        if frame_set:
+            frames = frame_set.get_frames(self._flipped)
             if index != -1:
-                return self._images[name][index % len(self._images[name])]
+                return frames[index % len(frames)]
 
-            current_frame = self._current_frame % len(self._images[name])
-            return self._images[name][current_frame]
+            return frames[self._current_frame % len(frames)]
 
         return pygame.Surface((1, 1))
 
+    def set_flipped(self, flipped):
+        """ Set whether the frames are returned flipped horizontally.
+
+        Args:
+            flipped (bool): True to get the flipped frames.
+        """
+        self._flipped = flipped
+
     def reset_animation(self):
         """ Reset the animation frame to the first frame and reset the animation time. """
         self._current_frame = 0
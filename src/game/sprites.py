@@ -10,25 +10,50 @@ from sprites.enemy import Enemy
 from sprites.end import End
 from sprites.tile_cursor import TileCursor
 
+from constants import Settings
+from game.background import Background
+from game.spatial_group import SpatialGroup, SpatialDrawGroup
+
 
 class Sprites:
     """Container for all sprite groups and sprite references used during a level.
 
     Handles adding sprites to the appropriate drawing layers and collision groups.
     Provides methods for drawing sprites, checking collisions, and cleaning up sprites.
+
+    Blocks and placeables can be drawn from a pre-rendered TileLayer instead of as sprites.
+    Sprites are positioned in world space and drawn shifted by the camera offset.
+    Only the sprites in view are drawn, they are found from a spatial index of the draw areas.
+    For dirty-rect drawing, the static blocks are baked into a background surface
+    and only the areas where the other sprites have changed are redrawn.
     """
 
-    def __init__(self):
-        """Initialize the Sprites class."""
+    # only redrawn when added, removed or moved, other unbaked sprites are redrawn every frame
+    _STATIC_SPRITES = (Placeable, End)
+
+    # cell size of the draw index, and how far outside the view indexed sprites are looked up,
+    # covering interpolated positions between the last two updates
+    _DRAW_CELL_SIZE = 128
+    _CULL_MARGIN = Settings.TILE_SIZE * 4
+
+    def __init__(self, cell_size=Settings.TILE_SIZE):
+        """Initialize the Sprites class.
+
+        Args:
+            cell_size (int, optional): Cell size of the block collision index in pixels.
+                Defaults to Settings.TILE_SIZE.
+        """
         self._player = None
         self._cursor = None
         self._end = None
 
-        self._blocks = pygame.sprite.Group()
+        self._blocks = SpatialGroup(cell_size)
         self._enemies = pygame.sprite.Group()
         self._world = pygame.sprite.Group()
 
-        self._draw_sprites = pygame.sprite.LayeredUpdates()
+        self._draw_sprites = SpatialDrawGroup(self._DRAW_CELL_SIZE)
+
+        self._background = Background()
 
     @property
     def player(self) -> Sprite | None:
@@ -58,11 +83,13 @@ class Sprites:
         return self._end
 
     @property
-    def blocks(self) -> Group:
+    def blocks(self) -> SpatialGroup:
         """Get the group of block and placeable sprites.
 
+        The group is spatially indexed, so it can be used directly as colliders.
+
         Returns:
-            Group: The group of block and placeable sprites.
+            SpatialGroup: The group of block and placeable sprites.
         """
         return self._blocks
 
@@ -84,6 +111,20 @@ class Sprites:
         """
         return self._world
 
+    def set_tile_layer(self, tile_layer):
+        """Draw blocks and placeables from a tile layer instead of as sprites.
+
+        Block and placeable sprites added after this are only used for collisions.
+
+        Args:
+            tile_layer (TileLayer): The tile layer to draw.
+        """
+        self._background.tile_layer = tile_layer
+        self._background.invalidate()
+
+        for sprite in self._blocks:
+            self._draw_sprites.remove(sprite)
+
     def add(self, sprite):
         """Add a sprite to the appropriate group and layer.
 
@@ -104,6 +145,14 @@ class Sprites:
     def _add_block(self, sprite):
         self._blocks.add(sprite)
         self._world.add(sprite)
+
+        # merged blocks have no image and are only drawn by the tile layer
+        if self._background.tile_layer or sprite.image is None:
+            return
+
+        if isinstance(sprite, Block):
+            # rebaked on the next dirty draw
+            self._background.invalidate()
         self._draw_sprites.add(sprite, layer=10)
 
     def _add_enemy(self, sprite):
@@ -125,13 +174,186 @@ class Sprites:
         self._cursor = sprite
         self._draw_sprites.add(sprite, layer=50)
 
-    def draw(self, display):
+    def refresh(self, *sprites):
+        """Update the positions of moved sprites for finding the sprites in view.
+
+        Must be called after moving a sprite, otherwise it is drawn only
+        while its previous position is in view.
+
+        Args:
+            *sprites (Sprite): The sprites that moved.
+        """
+        self._draw_sprites.refresh(*sprites)
+
+    def draw(self, display, alpha=None, offset=(0, 0)):
         """Draw all sprites to the display.
 
         Args:
             display (pygame.Surface): The display surface to draw on.
+            alpha (float, optional): Interpolation factor between the last two physics updates.
+                Defaults to None, which draws all sprites at their current rects.
+            offset (tuple[int, int], optional): World position of the display's top-left corner.
+                Defaults to (0, 0).
         """
-        self._draw_sprites.draw(display)
+        if self._background.tile_layer:
+            self._background.tile_layer.draw(display, offset)
+
+        screen = display.get_rect()
+        for sprite in self._get_sprites_in_view(display, offset):
+            rect = self._get_draw_rect(sprite, alpha, offset)
+            if rect.colliderect(screen):
+                display.blit(sprite.image, rect)
+
+    def draw_dirty(self, display, alpha=None, extra_rects=(), offset=(0, 0)):
+        """Redraw only the changed areas of the display.
+
+        Blocks are drawn from a pre-baked background. Everything is redrawn on the
+        first call, when the background has to be baked again and when the offset changes.
+        A changed offset only scrolls the background and draws the uncovered strips.
+
+        Args:
+            display (pygame.Surface): The display surface to draw on.
+            alpha (float, optional): Interpolation factor between the last two physics updates.
+                Defaults to None, which draws all sprites at their current rects.
+            extra_rects (Iterable[pygame.Rect], optional): Additional areas to redraw,
+                such as UI drawn on top of the sprites. Defaults to no extra areas.
+            offset (tuple[int, int], optional): World position of the display's top-left corner.
+                Defaults to (0, 0).
+
+        Returns:
+            list[pygame.Rect]: The areas of the display that were redrawn.
+        """
+        in_view = self._get_sprites_in_view(display, offset)
+        redraw_all, changed = self._update_background(display, offset, in_view)
+
+        screen = display.get_rect()
+        rects = self._get_visible_rects(in_view, alpha, offset, screen)
+
+        if redraw_all:
+            dirty = [screen]
+        else:
+            dirty = self._get_dirty_rects(rects, [*extra_rects, *changed])
+            dirty = [area.clip(screen) for area in dirty if area.colliderect(screen)]
+
+        self._background.drawn_rects = rects
+
+        for area in dirty:
+            display.blit(self._background.surface, area, area)
+            for sprite, rect in rects.items():
+                if rect.colliderect(area):
+                    clipped = rect.clip(area)
+                    display.blit(sprite.image, clipped,
+                                 clipped.move(-rect.x, -rect.y))
+
+        return dirty
+
+    def _update_background(self, display, offset, in_view):
+        """Bring the background up to date with the view and the changed tiles.
+
+        Args:
+            display (pygame.Surface): The display surface to draw on.
+            offset (tuple[int, int]): World position of the display's top-left corner.
+            in_view (list[Sprite]): The sprites near the view, see _get_sprites_in_view.
+
+        Returns:
+            tuple[bool, list[pygame.Rect]]: True if the whole display has to be redrawn,
+                and the display areas of the changed tiles.
+        """
+        tile_layer = self._background.tile_layer
+        changed = tile_layer.pop_changed() if tile_layer else []
+        changed = [area.move(-offset[0], -offset[1]) for area in changed]
+
+        blocks = [sprite for sprite in in_view if isinstance(sprite, Block)]
+
+        redraw_all = self._background.prepare(display, offset, blocks, changed)
+        return redraw_all, changed
+
+    def _get_visible_rects(self, sprites, alpha, offset, screen):
+        """Get the draw rects of the unbaked sprites that are on the display.
+
+        Args:
+            sprites (Iterable[Sprite]): The sprites near the view.
+            alpha (float or None): Interpolation factor, see draw.
+            offset (tuple[int, int]): World position of the display's top-left corner.
+            screen (pygame.Rect): The area of the display.
+
+        Returns:
+            dict[Sprite, pygame.Rect]: The draw rects by sprite, in drawing order.
+        """
+        rects = {}
+        for sprite in sprites:
+            if not isinstance(sprite, Block):
+                rect = self._get_draw_rect(sprite, alpha, offset)
+                if rect.colliderect(screen):
+                    rects[sprite] = rect
+        return rects
+
+    def _get_sprites_in_view(self, display, offset):
+        """Get the sprites that may be visible on the display.
+
+        Args:
+            display (pygame.Surface): The display surface to draw on.
+            offset (tuple[int, int]): World position of the display's top-left corner.
+
+        Returns:
+            list[Sprite]: The sprites near the view in drawing order.
+        """
+        view = display.get_rect().move(offset).inflate(
+            2 * self._CULL_MARGIN, 2 * self._CULL_MARGIN)
+        return self._draw_sprites.get_sprites_in_rect(view)
+
+    def _get_draw_rect(self, sprite, alpha, offset=(0, 0)):
+        """Get the rect a sprite is drawn to.
+
+        Args:
+            sprite (Sprite): The sprite to draw.
+            alpha (float or None): Interpolation factor, see draw.
+            offset (tuple[int, int], optional): World position of the display's top-left corner.
+                Defaults to (0, 0).
+
+        Returns:
+            pygame.Rect: The area the sprite covers on the display.
+        """
+        if alpha is not None and isinstance(sprite, (Player, Enemy)):
+            rect = sprite.image.get_rect(topleft=sprite.get_draw_position(alpha))
+        else:
+            rect = sprite.image.get_rect(topleft=sprite.rect.topleft)
+        return rect.move(-offset[0], -offset[1])
+
+    def _get_dirty_rects(self, rects, extra_rects):
+        """Get the areas that changed since the last dirty draw.
+
+        Overlapping areas are merged, so nothing is drawn twice.
+
+        Args:
+            rects (dict[Sprite, pygame.Rect]): The current draw rects of the unbaked sprites.
+            extra_rects (Iterable[pygame.Rect]): Additional areas to redraw.
+
+        Returns:
+            list[pygame.Rect]: The changed areas.
+        """
+        dirty = [pygame.Rect(rect) for rect in extra_rects]
+
+        for sprite, rect in rects.items():
+            previous = self._background.drawn_rects.get(sprite)
+            if previous != rect or not isinstance(sprite, self._STATIC_SPRITES):
+                dirty.append(rect)
+                if previous is not None:
+                    dirty.append(previous)
+
+        for sprite, previous in self._background.drawn_rects.items():
+            if sprite not in rects:
+                dirty.append(previous)
+
+        merged = []
+        for rect in dirty:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        return merged
 
     def cleanup(self):
         """Remove all sprites from the groups and clear references."""
@@ -146,6 +368,7 @@ class Sprites:
         self._enemies.empty()
         self._world.empty()
         self._draw_sprites.empty()
+        self._background = Background()
 
     def player_collides_with_enemy(self):
         """Check if the player collides with any enemies.
@@ -0,0 +1,50 @@
+""" Contains the TileCollider class, which resolves collisions directly against map tiles."""
+
+import pygame
+
+from constants import TileType
+
+
+class TileCollider:
+    """ Collision backend that looks up solid tiles from the map by cell index.
+
+    Instead of testing against sprites, only the cells overlapped by the queried rect
+    are checked, so the cost depends on the size of the rect and not on the number of
+    blocks in the level. Changes made to the map are visible immediately.
+    """
+
+    _SOLID_TILES = (TileType.BLOCK, TileType.PLACEABLE)
+
+    def __init__(self, tile_map, solid_tiles=_SOLID_TILES):
+        """ Initialize the TileCollider.
+
+        Args:
+            tile_map (Map): The map to read the tiles from.
+            solid_tiles (tuple[int], optional): Tile IDs that block movement.
+                Defaults to BLOCK and PLACEABLE.
+        """
+        self._map = tile_map
+        self._solid_tiles = frozenset(solid_tiles)
+
+    def collide_rect(self, rect):
+        """ Get the rects of all solid tiles colliding with the given rect.
+
+        Args:
+            rect (pygame.Rect): The rect to check for collisions.
+
+        Returns:
+            list[pygame.Rect]: The rects of the colliding tiles.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+
+        size = self._map.tile_size
+        colliding = []
+
+        for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+                if self._map.get_tile_at_cell(cell_x, cell_y) in self._solid_tiles:
+                    colliding.append(pygame.Rect(
+                        cell_x * size, cell_y * size, size, size))
+
+        return colliding
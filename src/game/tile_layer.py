@@ -0,0 +1,122 @@
+""" Contains the TileLayer class, pre-rendered surfaces of the static map tiles."""
+
+import pygame
+
+from constants import TileType
+from tools.asset_helpers import load_image
+
+
+class TileLayer:
+    """ Surfaces with the block and placeable tiles of map chunks drawn on them.
+
+    Each chunk is drawn to its own surface when it is loaded, so drawing the tiles
+    takes one blit per loaded chunk, and only the chunks near the view use memory.
+    When a tile changes during the level only that cell is drawn again,
+    and the changed area is kept until it is taken with pop_changed.
+    """
+
+    _TILE_IMAGES = {
+        TileType.BLOCK: "pl_block.png",
+        TileType.PLACEABLE: "pl_block_placeable.png",
+    }
+    _BG_COLOR = (0, 0, 0)
+
+    def __init__(self, tile_map):
+        """ Initialize the TileLayer without any loaded chunks.
+
+        Args:
+            tile_map (ChunkMap): The map to draw the tiles from.
+        """
+        self._map = tile_map
+        self._images = {tile_id: load_image(image, convert_alpha=True)
+                        for tile_id, image in self._TILE_IMAGES.items()}
+        self._changed = []
+        self._chunks = {}  # {chunk: (world rect, surface)}
+
+    @property
+    def loaded_chunks(self):
+        """ set[tuple[int, int]]: The chunks with a surface. Read-only property. """
+        return set(self._chunks)
+
+    def load_chunk(self, chunk):
+        """ Draw the tiles of a chunk to a new surface.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+        """
+        rect = self._map.get_chunk_rect(chunk)
+        surface = pygame.Surface(rect.size)
+        surface.fill(self._BG_COLOR)
+
+        size = self._map.tile_size
+        for cell_x, cell_y, tile_id in self._map.iterate_chunk(chunk):
+            image = self._images.get(tile_id)
+            if image:
+                surface.blit(image, (cell_x * size - rect.x, cell_y * size - rect.y))
+
+        self._chunks[chunk] = (rect, surface)
+
+    def release_chunk(self, chunk):
+        """ Free the surface of a chunk.
+
+        Args:
+            chunk (tuple[int, int]): The chunk indices.
+        """
+        self._chunks.pop(chunk, None)
+
+    def patch_cell(self, cell_x, cell_y):
+        """ Draw a single cell again from the current tile in the map.
+
+        Cells of chunks that are not loaded are drawn when the chunk is loaded.
+
+        Args:
+            cell_x (int): The x index of the cell.
+            cell_y (int): The y index of the cell.
+        """
+        if not self._map.cell_in_bounds(cell_x, cell_y):
+            return
+
+        loaded = self._chunks.get(self._map.chunk_of_cell(cell_x, cell_y))
+        if loaded is None:
+            return
+
+        size = self._map.tile_size
+        rect = pygame.Rect(cell_x * size, cell_y * size, size, size)
+        chunk_rect, surface = loaded
+        local = rect.move(-chunk_rect.x, -chunk_rect.y)
+
+        surface.fill(self._BG_COLOR, local)
+        image = self._images.get(self._map.get_tile_at_cell(cell_x, cell_y))
+        if image:
+            surface.blit(image, local)
+
+        self._changed.append(rect)
+
+    def pop_changed(self):
+        """ Get and clear the areas changed since the last call.
+
+        Returns:
+            list[pygame.Rect]: The world areas of the changed cells.
+        """
+        changed = self._changed
+        self._changed = []
+        return changed
+
+    def draw(self, display, offset=(0, 0), area=None):
+        """ Draw the tiles of the loaded chunks to the display.
+
+        Args:
+            display (pygame.Surface): The display surface to draw on.
+            offset (tuple[int, int], optional): World position of the display's top-left corner.
+                Defaults to (0, 0).
+            area (pygame.Rect, optional): Only draw inside this area of the display.
+                Defaults to None, which draws everything.
+        """
+        for rect, surface in self._chunks.values():
+            screen_rect = rect.move(-offset[0], -offset[1])
+
+            if area is None:
+                display.blit(surface, screen_rect)
+            elif screen_rect.colliderect(area):
+                clipped = screen_rect.clip(area)
+                display.blit(surface, clipped, clipped.move(-screen_rect.x, -screen_rect.y))
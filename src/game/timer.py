@@ -10,15 +10,18 @@ class Timer:
     If the current time is better than the best time, it is saved.
     """
 
-    def __init__(self, level_id):
+    def __init__(self, level_id, persist=True):
         """ Initialize the Timer class.
 
         Args:
             level_id (int): The ID of the level to track time for.
+            persist (bool, optional): If False, the database is not used for best times.
+                Defaults to True.
         """
         self._time = 0.0
         self._level_id = level_id
-        self._best_time = get_best_time(level_id)
+        self._persist = persist
+        self._best_time = get_best_time(level_id) if persist else None
 
         self._active = False
 
@@ -67,8 +70,14 @@ class Timer:
         """ Pause the timer."""
         self._active = False
 
-    def finish(self):
-        """ Stop the timer and save the time if it's a new best time."""
+    def finish(self, replay=None):
+        """ Stop the timer and save the time if it's a new best time.
+
+        Args:
+            replay (Replay, optional): Input recording of the run, saved along with the time
+                so it can be verified later. Defaults to None.
+        """
         self._active = False
-        if self.is_best_time():
-            save_level_time(self._level_id, self._time)
+        if self._persist and self.is_best_time():
+            save_level_time(self._level_id, self._time,
+                            replay.to_bytes() if replay else None)
@@ -21,7 +21,7 @@ class GameLoop:
     updating the game state, rendering the scene, and transitioning between different scenes.
     """
 
-    def __init__(self, scene, renderer, user_input, clock):
+    def __init__(self, scene, renderer, user_input, clock, tick_rate=0):
         """Initialize the game loop.
 
         Args:
@@ -29,12 +29,17 @@ class GameLoop:
             renderer (Renderer): The renderer responsible for drawing the scene.
             user_input (UserInput): The user input handler for capturing events.
             clock (Clock): The clock for managing frame rate and timing.
+            tick_rate (int, optional): Fixed number of scene updates per second.
+                Defaults to 0, which updates once per frame with the frame's delta time.
         """
         self._scene = scene
         self._renderer = renderer
         self._user_input = user_input
         self._clock = clock
 
+        self._tick_rate = tick_rate
+        self._accumulator = 0.0
+
     def start(self):
         """Start the game loop.
 
@@ -45,10 +50,13 @@ class GameLoop:
             if not self._handle_events():
                 break
 
-            self._handle_input()
+            if self._tick_rate > 0:
+                self._fixed_update()
+            else:
+                self._handle_input()
 
-            self._scene.update(self._clock.get_dt(),
-                               self._user_input.get_mouse_pos())
+                self._scene.update(self._clock.get_dt(),
+                                   self._user_input.get_mouse_pos())
 
             self._render()
 
@@ -61,6 +69,26 @@ class GameLoop:
                 ):
                     break
 
+    def _fixed_update(self):
+        """Update the scene in fixed time steps for the time passed since the last frame.
+
+        Leftover time is carried to the next frame and passed to the scene
+        as an interpolation factor for drawing between two updates.
+        """
+        step = 1 / self._tick_rate
+        self._accumulator += min(self._clock.get_dt(), Settings.MAX_FRAME_TIME)
+
+        while self._accumulator >= step:
+            self._handle_input()
+
+            self._scene.update(step, self._user_input.get_mouse_pos())
+            self._accumulator -= step
+
+            if self._scene.is_done():
+                break
+
+        self._scene.interpolate(self._accumulator / step)
+
     def _handle_events(self):
         """Process Pygame events and forward them to the active scene.
 
@@ -132,6 +160,7 @@ class GameLoop:
 
         self._renderer.set_scene(scene)
         self._scene = scene
+        self._accumulator = 0.0
 
         return True
 
@@ -166,4 +195,8 @@ class GameLoop:
         if validator and not validator(new_scene_data):
             return None
 
+        if scene_class is Level:
+            # replays record the update rate the level is played at
+            return Level(new_scene_data, tick_rate=self._tick_rate)
+
         return scene_class(new_scene_data) if new_scene_data is not None else scene_class()
@@ -0,0 +1,225 @@
+""" Contains the HeadlessLoop class for running levels without a display.
+
+Levels are updated at a fixed time step with scripted input as fast as possible.
+Used for validating levels, verifying recorded replays and benchmarking the physics.
+Can be run directly to benchmark all levels in the database.
+"""
+
+import itertools
+import math
+import time
+from dataclasses import dataclass
+
+from constants import SceneName, Settings
+from scenes.level import Level
+from game.level_data import LevelData
+from game.replay import Replay
+from tools.db import init_db, get_all_levels
+
+
+@dataclass(frozen=True)
+class TickInput:
+    """Dataclass representing the input for a single simulation tick.
+
+    Attributes:
+        keys (tuple[InputAction]): Keyboard actions held down during the tick.
+        clicks (tuple[tuple[InputAction, tuple[int, int]]]):
+            Mouse clicks (button, position) made before the tick.
+    """
+
+    keys: tuple = ()
+    clicks: tuple = ()
+
+
+@dataclass
+class SimulationResult:
+    """Dataclass representing the outcome of a headless level run.
+
+    Attributes:
+        completed (bool): True if the player reached the end of the level.
+        failed (bool): True if the level was reset (player died or fell out of the level).
+        ticks (int): Number of updates simulated.
+        time (float or None): Level timer time on completion, None if not completed.
+        elapsed (float): Real time spent simulating in seconds.
+    """
+
+    completed: bool
+    failed: bool
+    ticks: int
+    time: float | None
+    elapsed: float
+
+    @property
+    def steps_per_second(self) -> float:
+        """float: Simulated updates per second of real time."""
+        return self.ticks / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class HeadlessLoop:
+    """ Runs a Level scene without a window, rendering or real time.
+
+    Input is given as a stream of TickInput objects, one per update.
+    The run stops when the level finishes, the input runs out or the tick limit is reached.
+    """
+
+    _MOUSE_POS = (0, 0)
+
+    def __init__(self, level: LevelData, tick_rate=Settings.TICK_RATE, max_ticks=0):
+        """Initialize the headless loop.
+
+        Args:
+            level (LevelData): The level to simulate.
+            tick_rate (int, optional): Updates per simulated second.
+                Defaults to Settings.TICK_RATE.
+            max_ticks (int, optional): Maximum number of updates per run.
+                Defaults to 0, which means no limit.
+        """
+        self._level = level
+        self._tick_rate = tick_rate
+        self._dt = 1 / tick_rate
+        self._max_ticks = max_ticks
+
+    @property
+    def dt(self):
+        """ float: Time step of a single update in seconds. Read-only property. """
+        return self._dt
+
+    def create_scene(self):
+        """Create a fresh Level scene for the simulated level.
+
+        Best times are not read from or saved to the database.
+
+        Returns:
+            Level: The new level scene.
+        """
+        return Level(self._level, save_times=False, tick_rate=self._tick_rate)
+
+    def run(self, inputs):
+        """Simulate the level from the start with the given input stream.
+
+        Args:
+            inputs (Iterable[TickInput or None]): Input for each tick, None for no input.
+
+        Returns:
+            SimulationResult: The outcome of the run.
+        """
+        scene = self.create_scene()
+        ticks = 0
+        start = time.perf_counter()
+
+        for tick_input in inputs:
+            if 0 < self._max_ticks <= ticks:
+                break
+
+            self.step(scene, tick_input)
+            ticks += 1
+
+            if scene.is_done():
+                break
+
+        elapsed = time.perf_counter() - start
+        result = self._get_result(scene, ticks, elapsed)
+        scene.cleanup()
+
+        return result
+
+    def run_replay(self, replay: Replay):
+        """Simulate the level from the start with the input of a recorded replay.
+
+        Args:
+            replay (Replay): The recorded input.
+
+        Returns:
+            SimulationResult: The outcome of the run.
+        """
+        return self.run(TickInput(keys, clicks) for keys, clicks in replay.iterate_ticks())
+
+    def step(self, scene, tick_input):
+        """Apply the input for one tick and update the scene once.
+
+        Args:
+            scene (Level): The scene to update.
+            tick_input (TickInput or None): The input for this tick.
+        """
+        if tick_input is not None:
+            for click, pos in tick_input.clicks:
+                scene.input_mouse(click, pos)
+            for key in tick_input.keys:
+                scene.input_key(key)
+
+        scene.update(self._dt, self._MOUSE_POS)
+
+    def _get_result(self, scene, ticks, elapsed):
+        """Build the result of a run from the final scene state.
+
+        Args:
+            scene (Level): The simulated scene.
+            ticks (int): Number of updates simulated.
+            elapsed (float): Real time spent in seconds.
+
+        Returns:
+            SimulationResult: The outcome of the run.
+        """
+        next_scene = scene.get_next_scene()
+        completed = next_scene == SceneName.END_SCREEN
+
+        return SimulationResult(
+            completed=completed,
+            failed=next_scene == SceneName.LEVEL,
+            ticks=ticks,
+            time=scene.get_next_scene_data().timer.get_time() if completed else None,
+            elapsed=elapsed
+        )
+
+
+def verify_replay(level: LevelData, replay_data: bytes, expected_time: float) -> bool:
+    """Check that a replay completes the level in the claimed time.
+
+    The replay is simulated at the tick rate it was recorded at.
+
+    Args:
+        level (LevelData): The level the replay was recorded on.
+        replay_data (bytes): The encoded replay.
+        expected_time (float): The claimed completion time in seconds.
+
+    Returns:
+        bool: True if the replay reproduces the time, False otherwise.
+    """
+    replay = Replay.from_bytes(replay_data)
+
+    if replay is None or replay.level_id != level.id or replay.tick_rate <= 0:
+        return False
+
+    result = HeadlessLoop(level, replay.tick_rate).run_replay(replay)
+
+    return result.completed and math.isclose(result.time, expected_time, abs_tol=1e-6)
+
+
+def benchmark(level: LevelData, ticks=10000, keys=()):
+    """Measure how many level updates per second can be simulated.
+
+    Args:
+        level (LevelData): The level to simulate.
+        ticks (int, optional): Number of updates to run. Defaults to 10000.
+        keys (tuple[InputAction], optional): Keys held for the whole run.
+            Defaults to no input.
+
+    Returns:
+        SimulationResult: The outcome of the run, see steps_per_second.
+    """
+    loop = HeadlessLoop(level, max_ticks=ticks)
+    return loop.run(itertools.repeat(TickInput(keys=keys)))
+
+
+def main():
+    """Benchmark every level in the database and print the results."""
+    init_db()
+
+    for level in get_all_levels():
+        result = benchmark(level)
+        print(f"{level.id:>5} {level.name:<32} "
+              f"{result.ticks:>7} ticks {result.steps_per_second:>10.0f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,7 +30,8 @@ def main():
     renderer = Renderer(display, scene)
     clock = Clock()
 
-    game_loop = GameLoop(scene, renderer, user_input, clock)
+    game_loop = GameLoop(scene, renderer, user_input,
+                         clock, Settings.TICK_RATE)
 
     game_loop.start()
 
@@ -0,0 +1,29 @@
+""" Converts the levels in the database from JSON to the binary tile format.
+
+The database schema is updated when the database is initialized,
+this converts the data of levels saved before the binary format
+and compacts the database file afterwards.
+Can be run directly to migrate the levels in the database.
+"""
+
+from tools.db import init_db, migrate_legacy_levels, compact_db
+
+
+def main():
+    """Migrate the levels in the database and print the result."""
+    init_db()
+
+    converted = migrate_legacy_levels()
+
+    if converted is None:
+        print("Migration failed.")
+        return
+
+    print(f"Converted {converted} levels to the binary format.")
+
+    if not compact_db():
+        print("Compacting the database failed.")
+
+
+if __name__ == "__main__":
+    main()
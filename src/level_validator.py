@@ -0,0 +1,248 @@
+""" Batch validator that checks that levels can be completed.
+
+Every level is searched for a solution with a headless simulation in its own process,
+and the results (passed, completion time) are written to the database.
+Can be run directly to validate all levels in the database.
+"""
+
+import heapq
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from constants import SceneName, InputAction, Settings
+from headless_loop import HeadlessLoop, TickInput
+from game.level_data import LevelData
+from game.array_map import ArrayMap
+from tools.db import init_db, get_all_levels, save_level_validation
+
+
+class LevelSolver:
+    """ Searches for an input sequence that completes a level.
+
+    Uses a best-first search over short held actions, ordered by the player's
+    distance to the level end. The level is simulated headlessly and its state is
+    snapshotted between actions, so each action is only simulated once per node.
+    Only movement is searched, placeable blocks are not used.
+    """
+
+    _ACTIONS = tuple(TickInput(keys=keys) for keys in (
+        (),
+        (InputAction.LEFT,),
+        (InputAction.RIGHT,),
+        (InputAction.JUMP,),
+        (InputAction.JUMP, InputAction.LEFT),
+        (InputAction.JUMP, InputAction.RIGHT),
+    ))
+    _ACTION_TIME = 0.125
+    _POSITION_BUCKET = 4
+    _DEPTH_BUCKET = 8
+
+    def __init__(self, level: LevelData, node_budget=2000, max_time=60.0,
+                 tick_rate=Settings.TICK_RATE):
+        """Initialize the LevelSolver.
+
+        Args:
+            level (LevelData): The level to solve.
+            node_budget (int, optional): Maximum number of search nodes to expand.
+                Defaults to 2000.
+            max_time (float, optional): Maximum length of a solution in seconds.
+                Defaults to 60.0.
+            tick_rate (int, optional): Updates per simulated second.
+                Defaults to Settings.TICK_RATE.
+        """
+        self._loop = HeadlessLoop(level, tick_rate)
+        self._node_budget = node_budget
+        self._action_ticks = max(1, round(self._ACTION_TIME * tick_rate))
+        self._max_depth = int(max_time / self._ACTION_TIME)
+
+    def solve(self):
+        """Search for a sequence of actions that completes the level.
+
+        Returns:
+            list[TickInput] or None: The input for each tick of the solution,
+                or None if no solution was found within the budget.
+        """
+        scene = self._loop.create_scene()
+        end = scene.get_end_rect()
+
+        try:
+            if end is None:
+                return None
+            path = self._search(scene, end)
+        finally:
+            scene.cleanup()
+
+        if path is None:
+            return None
+
+        return [action for action in path for _ in range(self._action_ticks)]
+
+    def replay(self, inputs):
+        """Run the level from the start with the given input.
+
+        Args:
+            inputs (list[TickInput]): The input for each tick.
+
+        Returns:
+            SimulationResult: The outcome of the run.
+        """
+        return self._loop.run(inputs)
+
+    def _search(self, scene, end):
+        """Best-first search from the scene's current state.
+
+        Args:
+            scene (Level): The scene to simulate in.
+            end (pygame.Rect): The rect of the level end.
+
+        Returns:
+            tuple[TickInput] or None: The actions of the solution, or None if not found.
+        """
+        counter = itertools.count()
+        queue = [(0, next(counter), scene.get_state(), ())]
+        visited = {self._get_key(scene, 0)}
+        expanded = 0
+
+        while queue and expanded < self._node_budget:
+            _, _, state, path = heapq.heappop(queue)
+            expanded += 1
+
+            if len(path) >= self._max_depth:
+                continue
+
+            for action in self._ACTIONS:
+                scene.set_state(state)
+                outcome = self._simulate(scene, action)
+
+                if outcome == SceneName.END_SCREEN:
+                    return path + (action,)
+                if outcome is not None:
+                    continue
+
+                key = self._get_key(scene, len(path) + 1)
+                if key in visited:
+                    continue
+                visited.add(key)
+
+                distance = self._get_distance(scene.get_player_rect(), end)
+                heapq.heappush(
+                    queue, (distance, next(counter), scene.get_state(), path + (action,)))
+
+        return None
+
+    def _simulate(self, scene, action):
+        """Hold an action for its duration.
+
+        Args:
+            scene (Level): The scene to simulate in.
+            action (TickInput): The input to hold.
+
+        Returns:
+            SceneName or None: The scene the level wants to change to, None if still playing.
+        """
+        for _ in range(self._action_ticks):
+            self._loop.step(scene, action)
+            if scene.is_done():
+                return scene.get_next_scene()
+        return None
+
+    def _get_key(self, scene, depth):
+        """Get a key for detecting already visited player states.
+
+        The search depth is included in coarse buckets, so waiting in place
+        for enemies to move is not pruned as a visited state.
+
+        Args:
+            scene (Level): The scene to get the key for.
+            depth (int): Number of actions taken to reach the state.
+
+        Returns:
+            tuple[int, int, bool, int]: The bucketed player position, floor status and depth.
+        """
+        rect = scene.get_player_rect()
+        return (rect.x // self._POSITION_BUCKET,
+                rect.y // self._POSITION_BUCKET,
+                scene.is_player_on_floor(),
+                depth // self._DEPTH_BUCKET)
+
+    def _get_distance(self, rect, end):
+        """Get the distance between the centers of two rects.
+
+        Args:
+            rect (pygame.Rect): The first rect.
+            end (pygame.Rect): The second rect.
+
+        Returns:
+            float: The distance in pixels.
+        """
+        return ((rect.centerx - end.centerx) ** 2 + (rect.centery - end.centery) ** 2) ** 0.5
+
+
+def validate_level(level: LevelData, node_budget=2000):
+    """Check if a level can be completed.
+
+    Runs in a worker process, so it only simulates and does not use the database.
+
+    Args:
+        level (LevelData): The level to validate.
+        node_budget (int, optional): Maximum number of search nodes. Defaults to 2000.
+
+    Returns:
+        tuple[int, bool, float or None]: (level id, passed, completion time).
+    """
+    if not ArrayMap(level.data).is_map_viable():
+        return level.id, False, None
+
+    solver = LevelSolver(level, node_budget)
+    inputs = solver.solve()
+
+    if inputs is None:
+        return level.id, False, None
+
+    # confirm the solution from a fresh start, also gives the completion time
+    result = solver.replay(inputs)
+
+    return level.id, result.completed, result.time
+
+
+def validate_levels(levels, workers=None, node_budget=2000):
+    """Validate levels in parallel and save the results to the database.
+
+    Args:
+        levels (list[LevelData]): The levels to validate.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        node_budget (int, optional): Maximum number of search nodes per level.
+            Defaults to 2000.
+
+    Returns:
+        dict[int, tuple[bool, float or None]]: A dictionary mapping level IDs to (passed, time).
+    """
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(validate_level, level, node_budget)
+                   for level in levels]
+
+        for future in as_completed(futures):
+            level_id, passed, time = future.result()
+            save_level_validation(level_id, passed, time)
+            results[level_id] = (passed, time)
+
+    return results
+
+
+def main():
+    """Validate every level in the database and print the results."""
+    init_db()
+
+    levels = get_all_levels()
+    results = validate_levels(levels)
+
+    for level in levels:
+        passed, time = results[level.id]
+        status = f"passed {time:.2f}" if passed else "failed"
+        print(f"{level.id:>5} {level.name:<32} {status}")
+
+
+if __name__ == "__main__":
+    main()
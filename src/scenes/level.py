@@ -1,17 +1,18 @@
 """ Contains the Level scene class, which manages the game level."""
 
-from constants import SceneName, TileType, InputAction, Settings
+from constants import SceneName, TileType, InputAction, Settings, CollisionMode
 from scenes.scene import Scene
 
-from sprites.block import Block
 from sprites.player import Player
 from sprites.placeable import Placeable
-from sprites.enemy import Enemy
 from sprites.end import End
 from sprites.tile_cursor import TileCursor
 
-from game.map import Map
+from game.chunk_map import ChunkMap
+from game.level_view import LevelView
+from game.replay import Replay
 from game.sprites import Sprites
+from game.tile_collider import TileCollider
 from game.timer import Timer
 from game.level_data import LevelData
 from game.endscreen_data import EndScreenData
@@ -23,59 +24,105 @@ class Level(Scene):
     """ Scene for the game level.
 
     Manages the game level, including the map, input, gamerules, sprites, and user interface.
+    Levels can be larger than the screen, the camera follows the player and only
+    the chunks of the map near the view have sprites.
     """
 
-    def __init__(self, level: LevelData):
+    def __init__(self, level: LevelData, collision_mode=Settings.COLLISION_MODE, save_times=True,
+                 tick_rate=Settings.TICK_RATE):
         """Initialize the Level scene.
 
         Args:
             level (LevelData): The level data to be loaded.
+            collision_mode (CollisionMode, optional): The collision backend used for bodies.
+                Defaults to Settings.COLLISION_MODE.
+            save_times (bool, optional): If False, best times are not read from
+                or saved to the database. Defaults to True.
+            tick_rate (int, optional): Fixed updates per second the level is played at,
+                recorded in the replay. 0 for variable time steps. Defaults to Settings.TICK_RATE.
         """
         super().__init__()
 
         self._level = level
-        self._map = Map(level.data)
-
-        self._map_objects = {}
-        self._sprites = Sprites()
-
-        self._timer = Timer(level.id)
+        # copy, placeables are written to the map during play
+        self._map = ChunkMap(level.data)
+        self._sprites = Sprites(self._map.tile_size)
+        self._view = LevelView(self._map, self._sprites, collision_mode)
+        self._colliders = self._create_colliders(collision_mode)
+
+        self._timer = Timer(level.id, save_times)
+        self._replay = Replay(level.id, tick_rate)
         self._level_ui = LevelUI(level.name)
 
         self._initialize_sprites()
 
     def _initialize_sprites(self):
-        """ Create and place all sprites based on the map data. """
-        for cell_x, cell_y, tile_id in self._map.iterate_cells():
-
-            world_x, world_y = self._map.cell_index_to_world_pos(
-                (cell_x, cell_y))
-
-            if tile_id == TileType.BLOCK:
-                self._sprites.add(Block(world_x, world_y))
-            elif tile_id == TileType.PLACEABLE:
-                placeable = Placeable(world_x, world_y)
-                self._sprites.add(placeable)
-                self._map_objects[(cell_x, cell_y)] = placeable
-            elif tile_id == TileType.ENEMY:
-                self._sprites.add(Enemy(world_x, world_y))
-            elif tile_id == TileType.SPAWN:
-                self._sprites.add(Player(world_x, world_y))
-            elif tile_id == TileType.END:
-                self._sprites.add(End(world_x, world_y))
+        """ Create the player and end, and load the chunks around them.
+
+        Blocks, placeables and enemies are created by the chunk loader when their chunk
+        comes near the view. Blocks and placeables are drawn from a tile layer.
+        """
+        for cell_x, cell_y, _ in self._map.iterate_cells(TileType.SPAWN):
+            self._sprites.add(Player(*self._map.cell_index_to_world_pos((cell_x, cell_y))))
+
+        for cell_x, cell_y, _ in self._map.iterate_cells(TileType.END):
+            self._sprites.add(End(*self._map.cell_index_to_world_pos((cell_x, cell_y))))
 
         self._sprites.add(TileCursor(
             Settings.CURSOR_TILE_RANGE * self._map.tile_size))
 
+        self._update_view()
+
+    def _create_colliders(self, collision_mode):
+        """ Create the colliders the player and enemies move against.
+
+        Merged colliders use the same sprite group as sprite collisions,
+        the blocks are merged when their chunk is loaded.
+
+        Args:
+            collision_mode (CollisionMode): The collision backend to use.
+
+        Returns:
+            SpatialGroup or TileCollider: The colliders for the selected backend.
+        """
+        if collision_mode == CollisionMode.TILES:
+            return TileCollider(self._map)
+        return self._sprites.blocks
+
     def draw(self, display):
         """ Draw the level and all sprites to the display. 
 
         Args:
             display (pygame.Surface): The display surface to draw on.
         """
-        self._sprites.draw(display)
+        self._sprites.draw(display, self._view.alpha, self._view.get_draw_offset())
         self._level_ui.draw(display, self._sprites.player.charges, self._timer)
 
+    def draw_dirty(self, display):
+        """ Redraw only the moving sprites, changed blocks and the UI.
+
+        Args:
+            display (pygame.Surface): The display surface to draw on.
+
+        Returns:
+            list[pygame.Rect]: The areas of the display that were redrawn.
+        """
+        ui_rects = self._level_ui.render(self._sprites.player.charges, self._timer)
+
+        dirty = self._sprites.draw_dirty(
+            display, self._view.alpha, ui_rects, self._view.get_draw_offset())
+        self._level_ui.blit(display)
+
+        return dirty
+
+    def interpolate(self, alpha):
+        """ Set the interpolation factor used when drawing moving sprites.
+
+        Args:
+            alpha (float): Fraction of a time step passed since the last update (0.0 - 1.0).
+        """
+        self._view.alpha = alpha
+
     def input_key(self, key):
         """ Handle keyboard input for player movement and actions.
 
@@ -83,6 +130,7 @@ class Level(Scene):
             key (InputAction): The key pressed.
         """
         self._timer.activate()
+        self._replay.add_key(key)
 
         if key == InputAction.LEFT:
             self._sprites.player.add_input(-1, 0)
@@ -98,15 +146,16 @@ class Level(Scene):
 
         Args:
             click (InputAction): The mouse button clicked.
-            pos (tuple[int,int]): The position of the mouse click.
+            pos (tuple[int,int]): The position of the mouse click on the screen.
         """
+        self._replay.add_click(click, pos)
 
         self._update_cursor(pos)
 
         if click == InputAction.MOUSE_LEFT and self._level_ui.is_back_clicked(pos):
             self.set_next_scene(SceneName.LEVEL_LIST, False)
 
-        cell_x, cell_y = self._map.screen_to_cell_index(pos)
+        cell_x, cell_y = self._map.screen_to_cell_index(self._view.camera.screen_to_world(pos))
 
         if not self._map.cell_in_bounds(cell_x, cell_y):
             return
@@ -126,32 +175,115 @@ class Level(Scene):
             dt (float): The delta time since the last frame.
             mouse_pos (tuple[int,int]): The current mouse position.
         """
+        self._replay.end_tick()
 
         self._timer.update(dt)
         self._level_ui.update(mouse_pos)
 
-        self._sprites.player.move(dt, self._sprites.blocks)
-        self._sprites.enemies.update(
-            dt, self._sprites.blocks, self._sprites.player.rect)
+        self._sprites.player.move(dt, self._colliders)
+        moved = [self._sprites.player]
+        for enemy in self._sprites.enemies.sprites():
+            if self._view.chunks.is_active(enemy.rect):
+                enemy.update(dt, self._colliders, self._sprites.player.rect)
+                moved.append(enemy)
+        self._sprites.refresh(*moved)
 
+        self._update_view()
         self._update_cursor(mouse_pos)
 
         self._check_entities_in_bounds()
         self._check_enemy_collisions()
         self._check_end_collisions()
 
+    def get_state(self):
+        """ Get a snapshot of the player, enemy and loaded chunk state.
+
+        Placed blocks, the timer and the cursor are not part of the snapshot.
+
+        Returns:
+            tuple: The state, to be restored with set_state.
+        """
+        enemies = tuple((enemy, enemy.get_state())
+                        for enemy in self._sprites.enemies)
+        return (self._sprites.player.get_state(), enemies, self._view.chunks.get_state())
+
+    def set_state(self, state):
+        """ Restore the player, enemies and loaded chunks from a snapshot made with get_state.
+
+        Enemies removed after the snapshot are added back, enemies spawned after it are removed
+        and spawned again with their chunk, and any pending scene change is cleared.
+
+        Args:
+            state (tuple): The state to restore.
+        """
+        player_state, enemies, chunks = state
+        self._sprites.player.set_state(player_state)
+
+        saved = {enemy for enemy, _ in enemies}
+        for enemy in self._sprites.enemies:
+            if enemy not in saved:
+                enemy.kill()
+
+        for enemy, enemy_state in enemies:
+            if not enemy.alive():
+                self._sprites.add(enemy)
+            enemy.set_state(enemy_state)
+
+        self._view.chunks.set_state(chunks)
+        self._sprites.refresh(self._sprites.player, *saved)
+        self._update_view()
+        self.clear_next_scene()
+
+    def get_player_rect(self):
+        """ Get the rect of the player.
+
+        Returns:
+            pygame.Rect: The player's rect.
+        """
+        return self._sprites.player.rect
+
+    def is_player_on_floor(self):
+        """ Check if the player is standing on the ground.
+
+        Returns:
+            bool: True if the player is on the floor, False otherwise.
+        """
+        return self._sprites.player.is_on_floor()
+
+    def get_end_rect(self):
+        """ Get the rect of the level end.
+
+        Returns:
+            pygame.Rect or None: The end's rect, or None if the level has no end.
+        """
+        return self._sprites.end.rect if self._sprites.end else None
+
+    def get_replay(self):
+        """ Get the recording of the input given to the level so far.
+
+        Returns:
+            Replay: The input recording.
+        """
+        return self._replay
+
     def cleanup(self):
         """ Cleanup the level scene. """
         self._sprites.cleanup()
 
+    def _update_view(self):
+        """ Move the camera to the player and load the chunks around the new view. """
+        self._view.follow(self._sprites.player.rect)
+
     def _update_cursor(self, pos):
         """ Update the tile cursor position and range check.
 
         Args:
-            pos (tuple[int,int]): The current mouse position.
+            pos (tuple[int,int]): The current mouse position on the screen.
         """
         self._sprites.cursor.update(
-            self._map.snap_to_grid(pos), self._sprites.player.rect)
+            self._map.snap_to_grid(self._view.camera.screen_to_world(pos)),
+            self._sprites.player.rect)
+        self._sprites.refresh(self._sprites.cursor)
 
     def _add_placeable_to_world(self, cell_x, cell_y):
         """ Attempt to add a placeable object to the world at the specified cell position.
@@ -169,15 +301,18 @@ class Level(Scene):
         if self._sprites.cursor_collides_with_world():
             return
 
-        if (cell_x, cell_y) in self._map_objects:
+        # blocks have no sprites with tile collisions, and moved enemies leave their spawn cells
+        if self._map.get_tile_at_cell(cell_x, cell_y) != TileType.EMPTY:
+            return
+
+        if (cell_x, cell_y) in self._view.objects:
             return
 
         # add placeable to world
         world_x, world_y = self._map.cell_index_to_world_pos((cell_x, cell_y))
-        placeable = Placeable(world_x, world_y)
-        self._map_objects[(cell_x, cell_y)] = placeable
-
-        self._sprites.add(placeable)
+        self._view.chunks.add_placeable(cell_x, cell_y, Placeable(world_x, world_y))
+        self._map.set_tile_at_cell(cell_x, cell_y, TileType.PLACEABLE)
+        self._view.tile_layer.patch_cell(cell_x, cell_y)
 
         # decrease inventory
         self._sprites.player.charges -= 1
@@ -193,14 +328,12 @@ class Level(Scene):
             cell_y (int): The y index of the cell.
         """
         # check if cell has a removable object
-        placeable = self._map_objects.get((cell_x, cell_y))
-
-        if not placeable:
+        if (cell_x, cell_y) not in self._view.objects:
             return
 
-        # kill
-        placeable.kill()
-        del self._map_objects[(cell_x, cell_y)]
+        self._view.chunks.remove_placeable(cell_x, cell_y)
+        self._map.set_tile_at_cell(cell_x, cell_y, TileType.EMPTY)
+        self._view.tile_layer.patch_cell(cell_x, cell_y)
 
         # increase inventory
         self._sprites.player.charges += 1
@@ -217,30 +350,34 @@ class Level(Scene):
         """ Check for collisions between the player and the level end.
 
             If a collision is detected, the level is completed and scene changed to the end screen.
-            The timer is finished and passed along with the level data to the end screen.
+            The timer is finished with the input recording of the run
+            and passed along with the level data to the end screen.
+            Runs played with variable time steps can not be replayed, so they are saved
+            without the recording.
         """
         if self._sprites.player_collides_with_end():
-            self._timer.finish()
+            self._timer.finish(self._replay if self._replay.tick_rate > 0 else None)
 
             self.set_next_scene(SceneName.END_SCREEN, EndScreenData(
                 level=self._level, timer=self._timer))
 
     def _check_entities_in_bounds(self):
-        """ Check if the player and enemies are within the screen bounds.
+        """ Check if the player and enemies are within the world bounds.
 
+            The world is the size of the map, but at least the size of the screen.
             If player is out of bounds, the level is reset.
             If an enemy is out of bounds, it is removed from the game.
         """
-        left = self._sprites.player.rect.left
-        right = self._sprites.player.rect.right
-        top = self._sprites.player.rect.top
-        if right < 0 or \
-            left > Settings.SCREEN_WIDTH or \
-                top > Settings.SCREEN_HEIGHT:
+        world = self._view.camera.world_rect
+
+        player = self._sprites.player.rect
+        if player.right < world.left or \
+            player.left > world.right or \
+                player.top > world.bottom:
             self.set_next_scene(SceneName.LEVEL, self._level)
 
         for sprite in self._sprites.enemies:
-            if sprite.rect.right < 0 or \
-                sprite.rect.left > Settings.SCREEN_WIDTH or \
-                    sprite.rect.top > Settings.SCREEN_HEIGHT:
+            if sprite.rect.right < world.left or \
+                sprite.rect.left > world.right or \
+                    sprite.rect.top > world.bottom:
                 sprite.kill()
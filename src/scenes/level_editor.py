@@ -3,13 +3,13 @@
 import pygame
 
 from constants import TileType, SceneName, InputAction, Settings
-from tools.preview_generator import generate_level_preview
+from tools.preview_generator import generate_tiles_preview, patch_level_preview
 from tools.db import save_level
 
 from scenes.scene import Scene
 from ui.editor_ui import EditorUI
 from sprites.tile_cursor import TileCursor
-from game.map import Map
+from game.array_map import ArrayMap
 from game.level_data import LevelData
 
 
@@ -37,7 +37,7 @@ class LevelEditor(Scene):
 
         self._level = level
         self._ui = EditorUI(level.name)
-        self._map = Map(level.data)
+        self._map = ArrayMap(level.data)
         self._map.expand_map()
         self._hand = TileType.EMPTY
 
@@ -134,7 +134,7 @@ class LevelEditor(Scene):
         updated = self._add_tile_to_map(x, y, self._hand)
 
         if updated:
-            self._update_image()
+            self._patch_image(x, y)
             self._update_required()
 
     def _add_tile_to_map(self, x, y, tile):
@@ -180,7 +180,7 @@ class LevelEditor(Scene):
         updated = self._remove_tile_from_map(x, y)
 
         if updated:
-            self._update_image()
+            self._patch_image(x, y)
             self._update_required()
 
     def _remove_tile_from_map(self, x, y):
@@ -200,7 +200,7 @@ class LevelEditor(Scene):
 
         # 2x2 tiles
         if tile in self._MULTI_TILES:
-            return self._map.remove_multi_tile(x, y, self._MULTI_TILE_SIZE)
+            return self._map.remove_multi_tile(x, y)
 
         if tile < 0 and abs(tile) in self._MULTI_TILES:
             res = self._map.find_nearest_tile_corner(
@@ -208,14 +208,29 @@ class LevelEditor(Scene):
             if res is None:
                 return False
             corner_x, corner_y = res
-            return self._map.remove_multi_tile(corner_x, corner_y, self._MULTI_TILE_SIZE)
+            return self._map.remove_multi_tile(corner_x, corner_y)
 
         return False
 
     def _update_image(self):
         """ Regenerates the level preview image based on the current map data. """
-        self._image = generate_level_preview(
-            self._map.data, (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT))
+        self._image = generate_tiles_preview(
+            self._map.tiles, (self._map.width, self._map.height),
+            (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT))
+
+    def _patch_image(self, x, y):
+        """ Redraw the cells of the preview image that an edit at a cell can change.
+
+        A multi-tile placed or removed at the cell can extend one tile less than
+        its size in any direction from it.
+
+        Args:
+            x (int): The x index of the edited cell.
+            y (int): The y index of the edited cell.
+        """
+        width, height = self._MULTI_TILE_SIZE
+        patch_level_preview(self._image, self._map,
+                            (x - width + 1, y - height + 1, width * 2 - 1, height * 2 - 1))
 
     def _update_required(self):
         """ Update the status of required tiles for the level. """
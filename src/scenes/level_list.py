@@ -5,9 +5,9 @@ from ui.button import Button
 from ui.text_box import TextBox
 from ui.confirm_box import ConfirmBox
 
-from tools.db import get_all_levels, get_all_best_times, \
+from tools.db import get_level_count, get_level_summaries, load_level, \
     level_name_exists, delete_level, delete_times
-from tools.preview_generator import generate_level_preview
+from tools.preview_cache import get_level_preview
 from tools.font_manager import FontManager
 
 from constants import SceneName, InputAction, Settings
@@ -21,11 +21,20 @@ class LevelList(Scene):
     In the play mode, it shows the best times for each level and gives the option to play them.
     In the editor mode it allows creating, deleting and moving to level editor.
     The scene is scrollable if there are more levels than can be displayed at once.
+    Level summaries are fetched from the database in pages and their entries are only built
+    when scrolled near the view, entries far off-screen are released.
+    The previews come from the preview cache, and the full level data is only loaded
+    when a level is opened.
     """
     # Scroll settings
     _SCROLL_SPEED = 50
     _MAX_VISIBLE_ROWS = 4
 
+    # Virtualized list settings
+    _PAGE_SIZE = 8
+    _PRELOAD_ROWS = 1
+    _RELEASE_ROWS = 4
+
     # Colors
     _BACKGROUND_COLOR = (128, 128, 128)
     _TEXT_COLOR_TIME = (50, 200, 50)
@@ -62,6 +71,7 @@ class LevelList(Scene):
         super().__init__()
         self._font = FontManager.get_font()
         self._buttons = []  # [(Button, scrollable)]
+        self._entries = {}  # {index: [Button]}
 
         self._to_editor = to_editor
 
@@ -97,45 +107,116 @@ class LevelList(Scene):
             )
 
     def _init_scrollable_buttons(self):
-        """Set up the scrollable buttons for the level list."""
-        levels = get_all_levels()
-        times = get_all_best_times()
+        """Set up the scrollable level list, entries are built as they come into view."""
+        self._scrollable_count = get_level_count()
+
+        self._update_entries()
+
+    def _update_entries(self):
+        """Build the entries near the view and release the entries far off-screen.
+
+        Missing entries are fetched from the database a page at a time.
+        """
+        first, last = self._get_visible_range()
+
+        for index in list(self._entries):
+            if index < first - self._RELEASE_ROWS or index > last + self._RELEASE_ROWS:
+                del self._entries[index]
+
+        missing = [i for i in range(first - self._PRELOAD_ROWS, last + self._PRELOAD_ROWS + 1)
+                   if 0 <= i < self._scrollable_count and i not in self._entries]
+
+        for page in sorted({i // self._PAGE_SIZE for i in missing}):
+            start = page * self._PAGE_SIZE
+            summaries = get_level_summaries(start, self._PAGE_SIZE)
+
+            for index, summary in enumerate(summaries, start):
+                if index in missing:
+                    self._entries[index] = self._create_entry(index, summary)
+
+    def _get_visible_range(self):
+        """Get the indices of the first and last entry in view.
+
+        Returns:
+            tuple[int, int]: The first and last visible index.
+        """
+        first = (-self._scroll - self._LIST_START_Y_OFFSET) // self._LIST_ENTRY_HEIGHT
+        last = (-self._scroll + Settings.SCREEN_HEIGHT) // self._LIST_ENTRY_HEIGHT
+        return max(first, 0), last
+
+    def _create_entry(self, index, summary):
+        """Create the buttons of a single level entry in the list.
+
+        Args:
+            index (int): The index of the level in the list.
+            summary (LevelSummary): The listing information of the level.
+
+        Returns:
+            list[Button]: The buttons of the entry, empty if the level no longer exists.
+        """
         scene = SceneName.EDITOR if self._to_editor else SceneName.LEVEL
 
-        for i, level in enumerate(levels):
-            button = Button(
-                f"{level.name}", self._font,
-                self._get_element_offset(i, self._LEVEL_BUTTON_RECT),
-                preview=generate_level_preview(
-                    level.data, self._PREVIEW_SCALE),
-                on_click=lambda level=level: self.set_next_scene(scene, level)
-            )
+        preview = get_level_preview(summary.id, self._PREVIEW_SCALE)
+        if preview is None:
+            return []
 
-            time = times.get(level.id, None)
+        button = Button(
+            f"{summary.name}", self._font,
+            self._get_element_offset(index, self._LEVEL_BUTTON_RECT),
+            preview=preview,
+            on_click=lambda level_id=summary.id: self._open_level(scene, level_id)
+        )
 
-            if self._to_editor:
-                button.set_text("Edit")
-                self._add_delete_and_clear_button(
-                    i, level.id, level.name, time)
-            else:
-                if time is not None:
-                    button.set_above_text(
-                        f"Best Time: {time:.2f}", self._TEXT_COLOR_TIME)
-                else:
-                    button.set_above_text(
-                        "Best Time: --:--", self._TEXT_COLOR_NO_TIME)
+        time = summary.best_time
 
-            self._buttons.append((button, True))
-            self._scrollable_count += 1
+        if self._to_editor:
+            button.set_text("Edit")
+            return [button, *self._create_delete_and_clear_button(
+                index, summary.id, summary.name, time)]
+
+        if time is not None:
+            button.set_above_text(
+                f"Best Time: {time:.2f}", self._TEXT_COLOR_TIME)
+        else:
+            button.set_above_text(
+                "Best Time: --:--", self._TEXT_COLOR_NO_TIME)
 
-    def _add_delete_and_clear_button(self, index, level_id, level_name, time):
-        """Add scrolling delete and clear buttons to a single level entry in the list.
+        return [button]
+
+    def _open_level(self, scene, level_id):
+        """Load a level and move to the given scene with it.
+
+        Args:
+            scene (SceneName): The scene to move to.
+            level_id (int): The ID of the level.
+        """
+        level = load_level(level_id)
+        if level is not None:
+            self.set_next_scene(scene, level)
+
+    def _get_buttons(self):
+        """Iterate the static buttons and the buttons of the built list entries.
+
+        Yields:
+            tuple[Button, bool]: The button and whether it scrolls with the list.
+        """
+        yield from self._buttons
+
+        for index in sorted(self._entries):
+            for button in self._entries[index]:
+                yield button, True
+
+    def _create_delete_and_clear_button(self, index, level_id, level_name, time):
+        """Create the scrolling delete and clear buttons of a single level entry in the list.
 
         Args:
             index (int): The index of the level in the list.
             level_id (int): The ID of the level.
             level_name (str): The name of the level.
             time (float): The best time for the level, if available.
+
+        Returns:
+            list[Button]: The delete button, and the clear button if the level has times.
         """
         delete_button = Button(
             "Delete", self._font,
@@ -146,18 +227,19 @@ class LevelList(Scene):
         )
         delete_button.set_above_text(
             f"{level_name}", self._TEXT_COLOR_LEVEL_NAME)
-        self._buttons.append((delete_button, True))
 
-        if time is not None:
-            clear_button = Button(
-                "Clear Times", self._font,
-                self._get_element_offset(index, self._CLEAR_BUTTON_RECT),
-                text_color=self._TEXT_COLOR_CLEAR,
-                on_click=lambda level_id=level_id, level_name=level_name: self._confirm_clear_times(
-                    level_id, level_name)
-            )
+        if time is None:
+            return [delete_button]
 
-            self._buttons.append((clear_button, True))
+        clear_button = Button(
+            "Clear Times", self._font,
+            self._get_element_offset(index, self._CLEAR_BUTTON_RECT),
+            text_color=self._TEXT_COLOR_CLEAR,
+            on_click=lambda level_id=level_id, level_name=level_name: self._confirm_clear_times(
+                level_id, level_name)
+        )
+
+        return [delete_button, clear_button]
 
     def _get_element_offset(self, index, base_rect):
         """Calculate the offset for a scrollable element based on its index.
@@ -186,7 +268,7 @@ class LevelList(Scene):
         if self._confirm_box:
             self._confirm_box.draw(display)
 
-        for (button, scrollable) in self._buttons:
+        for (button, scrollable) in self._get_buttons():
             offset = 0 if not scrollable else self._scroll
             button.draw(display, offset)
 
@@ -200,7 +282,7 @@ class LevelList(Scene):
             pos (tuple[int, int]): The mouse position (x, y) on screen.
         """
         if click == InputAction.MOUSE_LEFT:
-            for (button, scrollable) in self._buttons:
+            for (button, scrollable) in self._get_buttons():
                 offset = 0 if not scrollable else self._scroll
                 if button.is_clicked(pos, offset):
                     button.click()
@@ -217,6 +299,9 @@ class LevelList(Scene):
                                Settings.SCREEN_HEIGHT - self._LIST_START_Y_OFFSET
                                )
 
+        if click in (InputAction.MOUSE_SCROLL_UP, InputAction.MOUSE_SCROLL_DOWN):
+            self._update_entries()
+
     def update(self, dt, mouse_pos):
         """Update button hover states and other dynamic elements in the scene.
 
@@ -224,7 +309,7 @@ class LevelList(Scene):
             dt (float): Time delta since the last frame.
             mouse_pos (tuple[int, int]): Current mouse position.
         """
-        for (button, scrollable) in self._buttons:
+        for (button, scrollable) in self._get_buttons():
             offset = 0 if not scrollable else self._scroll
             button.update(mouse_pos, offset)
 
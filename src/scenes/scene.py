@@ -51,6 +51,15 @@ class Scene():
             mouse_pos (tuple[int, int]): Current mouse position.
         """
 
+    def interpolate(self, alpha):
+        """Set how far the next draw is between the last two updates.
+
+        Only called when the scene is updated in fixed time steps.
+
+        Args:
+            alpha (float): Fraction of a time step passed since the last update (0.0 - 1.0).
+        """
+
     def draw(self, display):
         """Draw all scene elements onto the given display surface.
 
@@ -58,6 +67,20 @@ class Scene():
             display (pygame.Surface): The surface to draw on.
         """
 
+    def draw_dirty(self, display):
+        """Draw only the parts of the scene that changed since the last draw.
+
+        Scenes that do not support partial drawing return None without drawing,
+        and are drawn with draw on a cleared display instead.
+
+        Args:
+            display (pygame.Surface): The surface to draw on.
+
+        Returns:
+            list[pygame.Rect] or None: The areas of the display that were drawn,
+                or None if the whole display has to be drawn.
+        """
+
     def cleanup(self):
         """Clean up the scene before transitioning."""
 
@@ -93,3 +116,7 @@ class Scene():
             data (Any, optional): Additional data for the next scene.
         """
         self._next_scene = (scene, data)
+
+    def clear_next_scene(self):
+        """Cancel a scene change set with set_next_scene."""
+        self._next_scene = None
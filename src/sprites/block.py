@@ -10,23 +10,30 @@ class Block(pygame.sprite.Sprite):
 
     Does not have any special properties or behaviors.
     Collides with the player and other objects.
+    A single block can cover a rectangle of several tiles, used for merged colliders.
 
     Attributes:
-        image (pygame.Surface): The image representing the block.
+        image (pygame.Surface or None): The image representing the block,
+            None for merged blocks.
         rect (pygame.Rect): The rectangle representing the block's position and size.
     """
 
-    def __init__(self, x=0, y=0):
+    def __init__(self, x=0, y=0, columns=1, rows=1):
         """ Initialize the Block sprite.
 
+        A block covering more than one tile is only a collider and has no image,
+        its tiles are drawn by the tile layer.
+
         Args:
             x (int, optional): The x world coordinate of the block. Defaults to 0.
             y (int, optional): The y world coordinate of the block. Defaults to 0.
+            columns (int, optional): Width of the block in tiles. Defaults to 1.
+            rows (int, optional): Height of the block in tiles. Defaults to 1.
         """
         super().__init__()
 
-        self.image = load_image("pl_block.png")
-        self.rect = self.image.get_rect()
+        tile = load_image("pl_block.png", convert_alpha=True)
+        width, height = tile.get_size()
 
-        self.rect.x = x
-        self.rect.y = y
+        self.image = tile if columns == 1 and rows == 1 else None
+        self.rect = pygame.Rect(x, y, width * columns, height * rows)
@@ -25,7 +25,7 @@ class End(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        self.image = load_image("pl_end.png")
+        self.image = load_image("pl_end.png", convert_alpha=True)
         self.rect = self.image.get_rect()
 
         self.rect.x = x
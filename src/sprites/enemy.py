@@ -2,7 +2,6 @@
 
 import pygame
 
-from tools.asset_helpers import load_image
 from constants import Settings
 from game.body import Body
 from game.sprite_animation import SpriteAnimation
@@ -41,10 +40,8 @@ class Enemy(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        self._base = load_image("pl_enemy.png")
-        self._base.set_alpha(self._HITBOX_ALPHA)
-
-        self._animation = SpriteAnimation(fps=15, scale=self._SIZE)
+        self._animation = SpriteAnimation(
+            fps=15, scale=self._SIZE, base="pl_enemy.png", base_alpha=self._HITBOX_ALPHA)
         self._animation.add_image_set("move", *self._MOVE_ANIMATION)
 
         self.image = pygame.Surface(self._SIZE, pygame.SRCALPHA)
@@ -67,15 +64,11 @@ class Enemy(pygame.sprite.Sprite):
         """
         self._animation.update(dt)
 
-        frame = self._animation.get_frame("move")
-
         # flip if moving right
-        if self._dir == self._DIR_RIGHT:
-            frame = pygame.transform.flip(frame, True, False)
+        self._animation.set_flipped(self._dir == self._DIR_RIGHT)
 
-        self.image.fill((0, 0, 0, 0))
-        self.image.blit(self._base, (0, 0))
-        self.image.blit(frame, (0, 0))
+        # frames already have the base image
+        self.image = self._animation.get_frame("move")
 
     def update(self, dt, colliders, player_rect):
         """ Update the enemy's position and animation.
@@ -107,6 +100,39 @@ class Enemy(pygame.sprite.Sprite):
         self._body.add_input(self._dir, 0)
         self._body.move(dt, colliders)
 
+    def kill(self):
+        """ Remove the enemy from all groups and release its shared animation frames. """
+        super().kill()
+        self._animation.release()
+
+    def get_draw_position(self, alpha):
+        """ Get the position to draw the enemy at between two physics updates.
+
+        Args:
+            alpha (float): Fraction of a time step passed since the last update (0.0 - 1.0).
+
+        Returns:
+            tuple[int, int]: The interpolated top-left position of the enemy.
+        """
+        return self._body.get_interpolated_position(alpha)
+
+    def get_state(self):
+        """ Get a snapshot of the enemy's movement and behavior state.
+
+        Returns:
+            tuple: The state, to be restored with set_state.
+        """
+        return (self._body.get_state(), self._dir, self._touch_count, self._time_from_touch)
+
+    def set_state(self, state):
+        """ Restore the enemy's state from a snapshot made with get_state.
+
+        Args:
+            state (tuple): The state to restore.
+        """
+        body_state, self._dir, self._touch_count, self._time_from_touch = state
+        self._body.set_state(body_state)
+
     def _should_jump(self, player_rect):
         """ Determine if the enemy should jump towards the player.
 
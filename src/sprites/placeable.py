@@ -27,7 +27,7 @@ class Placeable(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        self.image = load_image("pl_block_placeable.png")
+        self.image = load_image("pl_block_placeable.png", convert_alpha=True)
         self.rect = self.image.get_rect()
 
         self.rect.x = x
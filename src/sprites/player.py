@@ -3,7 +3,6 @@
 import pygame
 
 from constants import Settings
-from tools.asset_helpers import load_image
 
 from game.body import Body
 from game.sprite_animation import SpriteAnimation
@@ -47,10 +46,8 @@ class Player(pygame.sprite.Sprite):
 
         super().__init__()
 
-        self._base = load_image("pl_player.png")
-        self._base.set_alpha(self._HITBOX_ALPHA)
-
-        self._animation = SpriteAnimation(fps=15, scale=self._SIZE)
+        self._animation = SpriteAnimation(
+            fps=15, scale=self._SIZE, base="pl_player.png", base_alpha=self._HITBOX_ALPHA)
         self._animation.add_image_set("move", *self._MOVE_ANIMATION)
         self._animation.add_image_set("idle", *self._IDLE_ANIMATION)
 
@@ -70,17 +67,12 @@ class Player(pygame.sprite.Sprite):
         """
         self._animation.update(dt)
 
-        # select frame based on movement type
-        frame = self._get_animation_frame()
-
         # flip frame if moving left
-        if self._body.last_direction == self._DIR_LEFT:
-            frame = pygame.transform.flip(frame, True, False)
+        self._animation.set_flipped(
+            self._body.last_direction == self._DIR_LEFT)
 
-        # overlay the frame on the base image
-        self.image.fill((0, 0, 0, 0))
-        self.image.blit(self._base, (0, 0))
-        self.image.blit(frame, (0, 0))
+        # select frame based on movement type, frames already have the base image
+        self.image = self._get_animation_frame()
 
     def move(self, dt, colliders):
         """ Move the player and update animation.
@@ -95,6 +87,22 @@ class Player(pygame.sprite.Sprite):
         self._body.move(dt, colliders)
         self._animate(dt)
 
+    def kill(self):
+        """ Remove the player from all groups and release its shared animation frames. """
+        super().kill()
+        self._animation.release()
+
+    def get_draw_position(self, alpha):
+        """ Get the position to draw the player at between two physics updates.
+
+        Args:
+            alpha (float): Fraction of a time step passed since the last update (0.0 - 1.0).
+
+        Returns:
+            tuple[int, int]: The interpolated top-left position of the player.
+        """
+        return self._body.get_interpolated_position(alpha)
+
     def add_input(self, dx, dy):
         """ Add movement input to be processed on the next move call.
 
@@ -104,6 +112,31 @@ class Player(pygame.sprite.Sprite):
         """
         self._body.add_input(dx, dy)
 
+    def get_state(self):
+        """ Get a snapshot of the player's movement state and charges.
+
+        Returns:
+            tuple: The state, to be restored with set_state.
+        """
+        return (self._body.get_state(), self.charges)
+
+    def set_state(self, state):
+        """ Restore the player's state from a snapshot made with get_state.
+
+        Args:
+            state (tuple): The state to restore.
+        """
+        body_state, self.charges = state
+        self._body.set_state(body_state)
+
+    def is_on_floor(self):
+        """ Check if the player is standing on the ground.
+
+        Returns:
+            bool: True if the player is on the floor, False otherwise.
+        """
+        return self._body.on_floor
+
     def _get_animation_frame(self):
         """ Get the current animation frame based on the player's state.
 
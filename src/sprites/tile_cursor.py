@@ -27,7 +27,8 @@ class TileCursor(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        self.image = load_image("pl_block_placeable.png")
+        # copy, the cached image is shared
+        self.image = load_image("pl_block_placeable.png").copy()
         self.image.set_alpha(128)
         self.rect = self.image.get_rect()
         self._max_range = max_range
@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from constants import TEST_LEVEL_DATA, TileType
+from game.array_map import ArrayMap
+from game.map import Map
+
+
+class TestArrayMap(unittest.TestCase):
+    def setUp(self):
+        self.map = Map([row[:] for row in TEST_LEVEL_DATA])
+        self.array_map = ArrayMap(TEST_LEVEL_DATA)
+
+    def test_init_copies_data(self):
+        self.assertEqual(self.array_map.data, TEST_LEVEL_DATA)
+        self.assertEqual(self.array_map.width, self.map.width)
+        self.assertEqual(self.array_map.height, self.map.height)
+        self.assertEqual(len(self.array_map.tiles), self.map.width * self.map.height)
+
+        self.array_map.set_tile_at_cell(0, 0, TileType.END)
+        self.assertNotEqual(self.array_map.data, TEST_LEVEL_DATA)
+
+    def test_iterate_cells(self):
+        self.assertEqual(list(self.array_map.iterate_cells()),
+                         list(self.map.iterate_cells()))
+
+    def test_expand_and_shrink_match_map(self):
+        self.map.expand_map()
+        self.array_map.expand_map()
+
+        self.assertEqual(self.array_map.data, self.map.data)
+        self.assertEqual((self.array_map.width, self.array_map.height),
+                         (self.map.width, self.map.height))
+
+        self.map.shrink_map()
+        self.array_map.shrink_map()
+
+        self.assertEqual(self.array_map.data, self.map.data)
+        self.assertEqual(self.array_map.data, TEST_LEVEL_DATA)
+
+    def test_shrink_uneven_map(self):
+        data = [[0] * 10 for _ in range(8)]
+        data[2][7] = TileType.BLOCK
+        data[5][3] = -TileType.ENEMY
+        map_data = Map([row[:] for row in data])
+        array_map = ArrayMap(data)
+
+        map_data.shrink_map()
+        array_map.shrink_map()
+
+        self.assertEqual(array_map.data, map_data.data)
+        self.assertEqual((array_map.width, array_map.height), (5, 4))
+
+    def test_shrink_empty_map(self):
+        array_map = ArrayMap([[0] * 5 for _ in range(5)])
+        array_map.shrink_map()
+
+        self.assertEqual(array_map.data, [[0]])
+
+    def test_random_edits_match_map(self):
+        rng = random.Random(5)
+        self.map.expand_map()
+        self.array_map.expand_map()
+
+        for _ in range(500):
+            x = rng.randrange(-2, self.map.width + 2)
+            y = rng.randrange(-2, self.map.height + 2)
+            depth = (rng.randint(1, 3), rng.randint(1, 3))
+            tile = rng.choice((TileType.BLOCK, TileType.ENEMY, TileType.SPAWN))
+
+            self.assertEqual(self.array_map.is_empty_area(x, y, depth),
+                             self.map.is_empty_area(x, y, depth))
+            self.assertEqual(self.array_map.is_area_in_bounds(x, y, depth),
+                             self.map.is_area_in_bounds(x, y, depth))
+
+            if rng.random() < 0.6:
+                self.assertEqual(self.array_map.add_multi_tile(x, y, tile, depth),
+                                 self.map.add_multi_tile(x, y, tile, depth))
+            else:
+                self.assertEqual(self.array_map.remove_multi_tile(x, y, depth),
+                                 self.map.remove_multi_tile(x, y, depth))
+
+            for tile_id in (TileType.SPAWN, TileType.END, -TileType.ENEMY):
+                self.assertEqual(self.array_map.contains_tile(tile_id),
+                                 self.map.contains_tile(tile_id))
+
+        self.assertEqual(self.array_map.data, self.map.data)
+        self.assertEqual(self.array_map.is_map_viable(), self.map.is_map_viable())
+
+        counts = self.array_map._counts
+        self.array_map._build_index()
+        self.assertEqual(+counts, +self.array_map._counts)
+        self.assertEqual(list(self.array_map.iterate_cells(TileType.SPAWN)),
+                         list(self.map.iterate_cells(TileType.SPAWN)))
@@ -0,0 +1,52 @@
+import unittest
+
+from tools.asset_helpers import ImageCache, load_image
+
+
+class TestImageCache(unittest.TestCase):
+    def setUp(self):
+        ImageCache.clear()
+        self.addCleanup(ImageCache.clear)
+        self.addCleanup(ImageCache.set_max_size, 64)
+
+    def test_load_image_cached(self):
+        image = load_image("pl_block.png")
+
+        self.assertIs(load_image("pl_block.png"), image)
+        self.assertIsNot(load_image("pl_block.png", cached=False), image)
+
+    def test_key_includes_scale(self):
+        image = load_image("pl_block.png")
+        scaled = load_image("pl_block.png", (32, 32))
+
+        self.assertIsNot(image, scaled)
+        self.assertEqual(scaled.get_size(), (32, 32))
+        self.assertIs(load_image("pl_block.png", (32, 32)), scaled)
+
+    def test_missing_image_cached(self):
+        image = load_image("missing.png", (20, 20))
+
+        self.assertEqual(image.get_size(), (20, 20))
+        self.assertIs(load_image("missing.png", (20, 20)), image)
+
+    def test_invalidate(self):
+        image = load_image("pl_block.png")
+        scaled = load_image("pl_block.png", (32, 32))
+        end = load_image("pl_end.png")
+
+        ImageCache.invalidate("pl_block.png")
+
+        self.assertIsNot(load_image("pl_block.png"), image)
+        self.assertIsNot(load_image("pl_block.png", (32, 32)), scaled)
+        self.assertIs(load_image("pl_end.png"), end)
+
+    def test_least_recently_used_evicted(self):
+        ImageCache.set_max_size(2)
+
+        block = load_image("pl_block.png")
+        end = load_image("pl_end.png")
+        load_image("pl_block.png")
+        load_image("pl_enemy.png")
+
+        self.assertIs(load_image("pl_block.png"), block)
+        self.assertIsNot(load_image("pl_end.png"), end)
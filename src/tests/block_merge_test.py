@@ -0,0 +1,39 @@
+import random
+import unittest
+
+from game.block_merge import merge_cells
+
+
+class TestBlockMerge(unittest.TestCase):
+    def covered(self, rects):
+        return [(x + i, y + j) for x, y, width, height in rects
+                for j in range(height) for i in range(width)]
+
+    def test_empty(self):
+        self.assertEqual(merge_cells([]), [])
+
+    def test_row_merged(self):
+        self.assertEqual(merge_cells([(x, 5) for x in range(80)]), [(0, 5, 80, 1)])
+
+    def test_rectangle_merged(self):
+        cells = [(x, y) for x in range(2, 6) for y in range(3, 10)]
+        self.assertEqual(merge_cells(cells), [(2, 3, 4, 7)])
+
+    def test_separate_runs(self):
+        cells = [(0, 0), (1, 0), (3, 0), (0, 1)]
+        self.assertEqual(merge_cells(cells), [(0, 0, 2, 1), (3, 0, 1, 1), (0, 1, 1, 1)])
+
+    def test_l_shape(self):
+        cells = [(0, y) for y in range(4)] + [(x, 3) for x in range(1, 4)]
+        self.assertEqual(merge_cells(cells), [(0, 0, 1, 4), (1, 3, 3, 1)])
+
+    def test_random_cells_covered_once(self):
+        rng = random.Random(3)
+        cells = {(rng.randrange(20), rng.randrange(20)) for _ in range(250)}
+
+        rects = merge_cells(cells)
+        covered = self.covered(rects)
+
+        self.assertEqual(len(covered), len(cells))
+        self.assertEqual(set(covered), cells)
+        self.assertLess(len(rects), len(cells))
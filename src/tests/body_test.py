@@ -0,0 +1,92 @@
+import unittest
+import pygame
+
+from constants import MoveResolver
+from game.body import Body
+from game.spatial_group import SpatialGroup
+from sprites.block import Block
+
+
+class TestBodyResolvers(unittest.TestCase):
+    def setUp(self):
+        # floor at y = 160 and a wall at x = 160
+        self.blocks = SpatialGroup(16)
+        for i in range(20):
+            self.blocks.add(Block(i * 16, 160))
+        for i in range(10):
+            self.blocks.add(Block(160, i * 16))
+
+    def create_body(self, resolver, x=0, y=0):
+        return Body(pygame.Rect(x, y, 32, 32), x, y, resolver)
+
+    def simulate(self, body, dt, frames, dx=0):
+        for _ in range(frames):
+            body.add_input(dx, 0)
+            body.move(dt, self.blocks)
+
+    def test_swept_lands_on_floor(self):
+        body = self.create_body(MoveResolver.SWEPT)
+        self.simulate(body, 0.05, 40)
+
+        self.assertEqual(body.rect.bottom, 160)
+        self.assertTrue(body.on_floor)
+
+    def test_swept_stops_at_wall(self):
+        body = self.create_body(MoveResolver.SWEPT, 0, 128)
+        self.simulate(body, 0.05, 40, dx=1)
+
+        self.assertEqual(body.rect.right, 160)
+        self.assertTrue(body.touching_wall)
+
+    def test_swept_does_not_tunnel_with_large_dt(self):
+        body = self.create_body(MoveResolver.SWEPT, 0, -2000)
+        body._gravity = body._TERMINAL_VELOCITY
+        self.simulate(body, 2.5, 1)
+
+        self.assertEqual(body.rect.bottom, 160)
+        self.assertTrue(body.on_floor)
+
+    def test_swept_hits_ceiling(self):
+        self.blocks.add(Block(0, 64))
+        body = self.create_body(MoveResolver.SWEPT, 0, 100)
+        body.on_floor = True
+        body.add_input(0, -1)
+        body.move(0.1, self.blocks)
+
+        self.assertEqual(body.rect.top, 80)
+        self.assertEqual(body._gravity, 0)
+
+    def test_resolvers_match(self):
+        step = self.create_body(MoveResolver.STEP, 0, 20)
+        swept = self.create_body(MoveResolver.SWEPT, 0, 20)
+
+        for frame in range(120):
+            for body in (step, swept):
+                body.add_input(1, -1 if frame % 40 == 0 else 0)
+                body.move(1 / 60, self.blocks)
+
+            self.assertEqual(step.rect, swept.rect)
+            self.assertEqual(step.on_floor, swept.on_floor)
+            self.assertEqual(step.touching_wall, swept.touching_wall)
+
+    def test_plain_group_colliders(self):
+        group = pygame.sprite.Group(Block(0, 64), Block(16, 64))
+        body = self.create_body(MoveResolver.SWEPT)
+        for _ in range(20):
+            body.move(0.05, group)
+
+        self.assertEqual(body.rect.bottom, 64)
+
+
+class TestBodyInterpolation(unittest.TestCase):
+    def test_interpolated_position(self):
+        body = Body(pygame.Rect(0, 0, 32, 32), 0, 0)
+        body.add_input(1, 0)
+        body.move(0.1, pygame.sprite.Group())
+
+        x, y = body._motion.position
+        self.assertEqual(body.get_interpolated_position(0.0), (0, 0))
+        self.assertEqual(body.get_interpolated_position(1.0),
+                         (round(x), round(y)))
+        self.assertEqual(body.get_interpolated_position(0.5),
+                         (round(x / 2), round(y / 2)))
@@ -0,0 +1,49 @@
+import unittest
+
+import pygame
+
+from game.camera import Camera
+
+
+class TestCamera(unittest.TestCase):
+    def setUp(self):
+        self.camera = Camera((1000, 600), (200, 100))
+
+    def test_starts_at_origin(self):
+        self.assertEqual(self.camera.offset, (0, 0))
+        self.assertEqual(self.camera.rect, pygame.Rect(0, 0, 200, 100))
+        self.assertEqual(self.camera.world_rect, pygame.Rect(0, 0, 1000, 600))
+
+    def test_follow_centers_on_target(self):
+        self.camera.follow(pygame.Rect(490, 290, 20, 20))
+        self.assertEqual(self.camera.rect.center, (500, 300))
+
+    def test_follow_stays_in_world(self):
+        self.camera.follow(pygame.Rect(-100, -100, 10, 10))
+        self.assertEqual(self.camera.offset, (0, 0))
+
+        self.camera.follow(pygame.Rect(990, 590, 10, 10))
+        self.assertEqual(self.camera.rect.bottomright, (1000, 600))
+
+    def test_world_size_of_view_does_not_scroll(self):
+        camera = Camera((200, 100), (200, 100))
+        camera.follow(pygame.Rect(150, 80, 10, 10))
+        self.assertEqual(camera.offset, (0, 0))
+
+    def test_screen_and_world_positions(self):
+        self.camera.follow(pygame.Rect(500, 300, 0, 0))
+        offset = self.camera.offset
+
+        self.assertEqual(self.camera.screen_to_world((10, 20)),
+                         (10 + offset[0], 20 + offset[1]))
+        self.assertEqual(self.camera.world_to_screen(self.camera.screen_to_world((10, 20))),
+                         (10, 20))
+
+    def test_draw_offset_interpolates(self):
+        self.camera.follow(pygame.Rect(300, 50, 0, 0))
+        self.camera.follow(pygame.Rect(400, 50, 0, 0))
+
+        self.assertEqual(self.camera.get_draw_offset(), (300, 0))
+        self.assertEqual(self.camera.get_draw_offset(0.0), (200, 0))
+        self.assertEqual(self.camera.get_draw_offset(0.5), (250, 0))
+        self.assertEqual(self.camera.get_draw_offset(1.0), (300, 0))
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+import pygame
+
+from constants import TEST_LEVEL_DATA, TileType
+from game.chunk_map import ChunkMap
+from game.map import Map
+
+
+class TestChunkMap(unittest.TestCase):
+    def setUp(self):
+        self.map = Map([row[:] for row in TEST_LEVEL_DATA])
+        self.chunk_map = ChunkMap(TEST_LEVEL_DATA, chunk_size=4)
+
+    def test_init_copies_data(self):
+        self.assertEqual(self.chunk_map.data, TEST_LEVEL_DATA)
+        self.assertEqual(self.chunk_map.width, self.map.width)
+        self.assertEqual(self.chunk_map.height, self.map.height)
+        self.assertEqual(self.chunk_map.chunk_size, 4)
+
+        self.chunk_map.set_tile_at_cell(0, 0, TileType.END)
+        self.assertNotEqual(self.chunk_map.data, TEST_LEVEL_DATA)
+
+    def test_empty_chunks_not_stored(self):
+        data = [[0] * 40 for _ in range(40)]
+        data[5][35] = TileType.BLOCK
+        chunk_map = ChunkMap(data, chunk_size=8)
+
+        self.assertEqual(list(chunk_map._chunks), [(4, 0)])
+        self.assertEqual(chunk_map._counts[TileType.EMPTY], 40 * 40 - 1)
+
+        chunk_map.set_tile_at_cell(0, 39, TileType.EMPTY)
+        self.assertEqual(list(chunk_map._chunks), [(4, 0)])
+
+    def test_iterate_cells(self):
+        self.assertEqual(list(self.chunk_map.iterate_cells()),
+                         list(self.map.iterate_cells()))
+
+    def test_iterate_chunk(self):
+        cells = [cell for chunk in self.chunk_map._chunks
+                 for cell in self.chunk_map.iterate_chunk(chunk)]
+        expected = [cell for cell in self.map.iterate_cells() if cell[2] != 0]
+
+        self.assertEqual(sorted(cells), sorted(expected))
+        self.assertEqual(list(self.chunk_map.iterate_chunk((100, 100))), [])
+
+    def test_chunk_of_cell(self):
+        self.assertEqual(self.chunk_map.chunk_of_cell(0, 0), (0, 0))
+        self.assertEqual(self.chunk_map.chunk_of_cell(3, 4), (0, 1))
+        self.assertEqual(self.chunk_map.chunk_of_cell(9, 13), (2, 3))
+
+    def test_get_chunk_rect_cut_to_map(self):
+        size = self.chunk_map.tile_size
+        self.assertEqual(self.chunk_map.get_chunk_rect((1, 1)),
+                         pygame.Rect(4 * size, 4 * size, 4 * size, 4 * size))
+
+        last = self.chunk_map.chunk_of_cell(self.map.width - 1, self.map.height - 1)
+        rect = self.chunk_map.get_chunk_rect(last)
+        self.assertEqual(rect.bottomright,
+                         (self.map.width * size, self.map.height * size))
+
+    def test_get_chunks_in_rect(self):
+        pixels = 4 * self.chunk_map.tile_size
+
+        self.assertEqual(self.chunk_map.get_chunks_in_rect(
+            pygame.Rect(pixels - 1, 0, 2, pixels + 1)), [(0, 0), (1, 0), (0, 1), (1, 1)])
+        self.assertEqual(self.chunk_map.get_chunks_in_rect(
+            pygame.Rect(pixels, pixels, pixels, pixels)), [(1, 1)])
+        self.assertEqual(self.chunk_map.get_chunks_in_rect(
+            pygame.Rect(-500, -500, 100, 100)), [])
+
+        everything = self.chunk_map.get_chunks_in_rect(pygame.Rect(-500, -500, 5000, 5000))
+        self.assertEqual(len(everything), 4 * 6)
+
+    def test_random_edits_match_map(self):
+        rng = random.Random(7)
+        self.map.expand_map()
+        self.chunk_map.expand_map()
+
+        for _ in range(500):
+            x = rng.randrange(-2, self.map.width + 2)
+            y = rng.randrange(-2, self.map.height + 2)
+            depth = (rng.randint(1, 3), rng.randint(1, 3))
+            tile = rng.choice((TileType.BLOCK, TileType.ENEMY, TileType.SPAWN))
+
+            self.assertEqual(self.chunk_map.is_empty_area(x, y, depth),
+                             self.map.is_empty_area(x, y, depth))
+
+            if rng.random() < 0.6:
+                self.assertEqual(self.chunk_map.add_multi_tile(x, y, tile, depth),
+                                 self.map.add_multi_tile(x, y, tile, depth))
+            else:
+                self.assertEqual(self.chunk_map.remove_multi_tile(x, y, depth),
+                                 self.map.remove_multi_tile(x, y, depth))
+
+        self.assertEqual(self.chunk_map.data, self.map.data)
+
+        counts = self.chunk_map._counts
+        self.chunk_map._build_index()
+        self.assertEqual(+counts, +self.chunk_map._counts)
+        self.assertEqual(list(self.chunk_map.iterate_cells(TileType.SPAWN)),
+                         list(self.map.iterate_cells(TileType.SPAWN)))
+
+        # loading the same tiles finds the same multi-tiles
+        self.assertEqual(ChunkMap(self.map.data, chunk_size=4)._areas,
+                         Map(self.map.data)._areas)
+
+        self.map.shrink_map()
+        self.chunk_map.shrink_map()
+        self.assertEqual(self.chunk_map.data, self.map.data)
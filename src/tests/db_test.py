@@ -1,9 +1,12 @@
+import json
 import unittest
 import tools.db as db
-from sqlalchemy import inspect
+from sqlalchemy import create_engine, inspect, text
 
 from constants import TEST_LEVEL_END_DATA
 from game.level_data import LevelData
+from tools.db_connection import DBConnection
+from tools.db_models import Level
 
 
 class TestDB(unittest.TestCase):
@@ -42,6 +45,44 @@ class TestDB(unittest.TestCase):
         best_time = db.get_best_time(12)
         self.assertEqual(best_time, 13)
 
+    def test_get_level_summaries(self):
+        for i in range(5):
+            db.save_level(LevelData(-1, f"page {i}", TEST_LEVEL_END_DATA))
+
+        levels = db.get_all_levels()
+        count = db.get_level_count()
+        self.assertEqual(count, len(levels))
+
+        summaries = db.get_level_summaries()
+        self.assertEqual([summary.id for summary in summaries],
+                         [level.id for level in levels])
+
+        level_id = db.get_level_id("page 2")
+        db.save_level_time(level_id, 30)
+        db.save_level_time(level_id, 20)
+
+        summary = next(summary for summary in db.get_level_summaries()
+                       if summary.id == level_id)
+        self.assertEqual(summary.name, "page 2")
+        self.assertEqual(summary.width, len(TEST_LEVEL_END_DATA[0]))
+        self.assertEqual(summary.height, len(TEST_LEVEL_END_DATA))
+        self.assertEqual(summary.best_time, 20)
+        self.assertIsNone(db.get_level_summaries()[0].best_time)
+
+    def test_get_level_summaries_page(self):
+        for i in range(5):
+            db.save_level(LevelData(-1, f"page {i}", TEST_LEVEL_END_DATA))
+
+        count = db.get_level_count()
+        ids = [summary.id for summary in db.get_level_summaries()]
+
+        page = db.get_level_summaries(1, 3)
+        self.assertEqual([summary.id for summary in page], ids[1:4])
+
+        self.assertEqual(len(db.get_level_summaries(count - 1, 3)), 1)
+        self.assertEqual(db.get_level_summaries(count, 3), [])
+        self.assertEqual(db.get_level_summaries(-1, 3), [])
+
     def test_save_and_load_level_time_invalid_input(self):
         db.save_level_time(-1, 12)
         db.save_level_time(12, -2)
@@ -64,6 +105,86 @@ class TestDB(unittest.TestCase):
         self.assertTrue(LevelData.is_valid(level_data))
         self.assertEqual(level_data.data, TEST_LEVEL_END_DATA)
 
+    def test_save_level_stores_binary_tiles(self):
+        db.save_level(LevelData(-1, "potato", TEST_LEVEL_END_DATA))
+
+        with DBConnection.get_session_scope() as session:
+            level = session.query(Level).filter_by(name="potato").first()
+            self.assertIsNone(level.data)
+            self.assertEqual(LevelData.decode_tiles(level.tiles), TEST_LEVEL_END_DATA)
+            self.assertEqual((level.width, level.height),
+                             (len(TEST_LEVEL_END_DATA[0]), len(TEST_LEVEL_END_DATA)))
+
+    def test_save_level_falls_back_to_json(self):
+        data = [[1000, 0], [0, 1]]
+        db.save_level(LevelData(-1, "potato", data))
+
+        with DBConnection.get_session_scope() as session:
+            level = session.query(Level).filter_by(name="potato").first()
+            self.assertIsNone(level.tiles)
+            self.assertEqual(json.loads(level.data), data)
+
+        self.assertEqual(db.load_level(db.get_level_id("potato")).data, data)
+
+    def test_load_legacy_json_level_and_migrate(self):
+        with DBConnection.get_session_scope() as session:
+            session.add(Level(name="legacy", data=json.dumps(TEST_LEVEL_END_DATA)))
+
+        level_id = db.get_level_id("legacy")
+        self.assertEqual(db.load_level(level_id).data, TEST_LEVEL_END_DATA)
+
+        summary = next(summary for summary in db.get_level_summaries()
+                       if summary.id == level_id)
+        self.assertEqual((summary.width, summary.height),
+                         (len(TEST_LEVEL_END_DATA[0]), len(TEST_LEVEL_END_DATA)))
+
+        self.assertEqual(db.migrate_legacy_levels(), 1)
+        self.assertEqual(db.migrate_legacy_levels(), 0)
+
+        with DBConnection.get_session_scope() as session:
+            level = session.query(Level).filter_by(id=level_id).first()
+            self.assertIsNone(level.data)
+            self.assertIsNotNone(level.tiles)
+
+        self.assertEqual(db.load_level(level_id).data, TEST_LEVEL_END_DATA)
+        self.assertTrue(db.compact_db())
+
+    def test_missing_columns_are_added(self):
+        DBConnection._engine = create_engine("sqlite:///:memory:")
+        with DBConnection._engine.begin() as connection:
+            connection.execute(
+                text("CREATE TABLE levels (id INTEGER PRIMARY KEY, name TEXT, data TEXT)"))
+
+        DBConnection._add_missing_columns()
+
+        columns = [col["name"] for col in inspect(DBConnection._engine).get_columns("levels")]
+        for col in ["tiles", "width", "height"]:
+            self.assertIn(col, columns)
+
+        db.close_connection()
+
+    def test_old_schema_with_not_null_data_migrated(self):
+        # levels table as created by the first versions of the game
+        DBConnection._engine = create_engine("sqlite:///:memory:")
+        with DBConnection._engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE levels (id INTEGER NOT NULL, name VARCHAR NOT NULL, "
+                "data TEXT NOT NULL, PRIMARY KEY (id), UNIQUE (name))"))
+            connection.execute(text(
+                "INSERT INTO levels (id, name, data) VALUES (5, 'legacy', :data)"),
+                {"data": json.dumps(TEST_LEVEL_END_DATA)})
+
+        DBConnection._migrate_schema()
+
+        self.assertTrue(db.save_level(LevelData(-1, "potato", TEST_LEVEL_END_DATA)))
+        self.assertEqual(db.load_level(db.get_level_id("potato")).data, TEST_LEVEL_END_DATA)
+        self.assertEqual(db.load_level(5).data, TEST_LEVEL_END_DATA)
+
+        self.assertEqual(db.migrate_legacy_levels(), 1)
+        self.assertEqual(db.load_level(5).data, TEST_LEVEL_END_DATA)
+
+        db.close_connection()
+
     def test_save_and_load_level_invalid_level_data(self):
         # test random id
         level_data = db.load_level(9999)
@@ -224,3 +345,49 @@ class TestDB(unittest.TestCase):
         self.assertEqual(len(best_times), 0)
         self.assertEqual(best_time1, None)
         self.assertEqual(best_time2, None)
+
+    def test_save_and_get_level_validation(self):
+        self.assertIsNone(db.get_level_validation(1))
+
+        self.assertTrue(db.save_level_validation(1, True, 4.5))
+        self.assertEqual(db.get_level_validation(1), (True, 4.5))
+
+        self.assertTrue(db.save_level_validation(1, False))
+        self.assertEqual(db.get_level_validation(1), (False, None))
+        self.assertEqual(db.get_all_level_validations(), {1: (False, None)})
+
+    def test_save_level_validation_invalid_level(self):
+        self.assertFalse(db.save_level_validation(-1, True, 1.0))
+        self.assertFalse(db.save_level_validation(9999, True, 1.0))
+        self.assertEqual(db.get_all_level_validations(), {})
+
+    def test_level_validation_cleared_on_save_and_delete(self):
+        db.save_level(LevelData(-1, "potato", TEST_LEVEL_END_DATA))
+        level_id = db.get_level_id("potato")
+
+        db.save_level_validation(level_id, True, 1.0)
+        db.save_level(LevelData(-1, "potato", TEST_LEVEL_END_DATA))
+        self.assertIsNone(db.get_level_validation(level_id))
+
+        db.save_level_validation(level_id, True, 1.0)
+        db.delete_level(level_id)
+        self.assertIsNone(db.get_level_validation(level_id))
+
+    def test_save_level_time_with_replay(self):
+        db.save_level_time(1, 20, b"slow")
+        db.save_level_time(1, 10)
+        db.save_level_time(1, 15, b"fast")
+
+        self.assertEqual(db.get_best_time(1), 10)
+        self.assertEqual(db.get_best_replay(1), (15, b"fast"))
+        self.assertIsNone(db.get_best_replay(2))
+        self.assertIsNone(db.get_best_replay(-1))
+
+    def test_replays_deleted_with_times(self):
+        db.save_level_time(1, 15, b"fast")
+        db.delete_times(1)
+        self.assertIsNone(db.get_best_replay(1))
+
+        db.save_level_time(1, 15, b"fast")
+        db.delete_level(1)
+        self.assertIsNone(db.get_best_replay(1))
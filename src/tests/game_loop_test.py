@@ -3,7 +3,7 @@ from unittest.mock import patch
 from collections import defaultdict
 
 import pygame
-from constants import SceneName, TEST_LEVEL_DATA, TEST_LEVEL_END_DATA, InputAction
+from constants import SceneName, TEST_LEVEL_DATA, TEST_LEVEL_END_DATA, InputAction, Settings
 from scenes.scene import Scene
 from scenes.main_menu import MainMenu
 from scenes.level_list import LevelList
@@ -91,6 +91,9 @@ class SimpleScene(Scene):
     def update(self, dt, mouse_pos):
         self.events.append(("update", dt, mouse_pos))
 
+    def interpolate(self, alpha):
+        self.events.append(("interpolate", alpha))
+
     def draw(self, display):
         self.events.append(("draw", display))
 
@@ -213,6 +216,44 @@ class TestGameLoop(unittest.TestCase):
             ("cleanup")
         ])
 
+    def test_fixed_timestep(self):
+        self.scene.one_loop = False
+
+        # two 0.1s frames with 0.125s ticks
+        game_loop = GameLoop(
+            self.scene,
+            self.renderer,
+            self.user_input,
+            self.clock,
+            tick_rate=8
+        )
+
+        game_loop.start()
+
+        self.assertEqual(self.scene.events[:4], [
+            ("interpolate", 0.8),
+            ("draw", self.renderer.display),
+            ("is_done"),
+            ("update", 0.125, (0, 0)),
+        ])
+        self.assertAlmostEqual(self.scene.events[5][1], 0.6)
+
+    def test_fixed_timestep_caps_frame_time(self):
+        self.clock.get_dt = lambda: 10.0
+
+        game_loop = GameLoop(
+            self.scene,
+            self.renderer,
+            self.user_input,
+            self.clock,
+            tick_rate=8
+        )
+
+        game_loop.start()
+
+        updates = [e for e in self.scene.events if e[0] == "update"]
+        self.assertEqual(len(updates), int(Settings.MAX_FRAME_TIME * 8))
+
     def test_invalid_scene(self):
         self.scene.set_next_scene("invalid_scene")
 
@@ -252,7 +293,7 @@ class TestGameLoop(unittest.TestCase):
         self.assertIsNone(game_loop._scene.get_next_scene())
         mock_button.assert_called()
 
-    @patch("scenes.level_list.generate_level_preview")
+    @patch("scenes.level_list.get_level_preview")
     @patch("scenes.level_list.Button")
     def test_scene_switch_to_level_list(self, mock_button, mock_preview):
         # pygame.font.init()
@@ -331,7 +372,7 @@ class TestGameLoop(unittest.TestCase):
         self.assertIsInstance(game_loop._scene, SimpleScene)
         self.assertIsInstance(game_loop._renderer.scene, SimpleScene)
 
-    @patch("scenes.level_editor.generate_level_preview")
+    @patch("scenes.level_editor.generate_tiles_preview")
     @patch("scenes.level_editor.EditorUI")
     def test_scene_switch_to_editor(self, mock_ui, mock_preview):
         self.scene.set_next_scene(
@@ -0,0 +1,98 @@
+import itertools
+import unittest
+
+from constants import InputAction, Settings, TEST_LEVEL_DATA, TEST_LEVEL_END_DATA
+from headless_loop import HeadlessLoop, TickInput, benchmark, verify_replay
+from game.level_data import LevelData
+from game.replay import Replay
+
+
+class TestHeadlessLoop(unittest.TestCase):
+    def setUp(self):
+        self.level = LevelData(1, "potato", TEST_LEVEL_DATA)
+        self.end_level = LevelData(2, "end", TEST_LEVEL_END_DATA)
+
+    def test_level_completes_without_input(self):
+        loop = HeadlessLoop(self.end_level, tick_rate=100, max_ticks=500)
+        result = loop.run(itertools.repeat(None))
+
+        self.assertTrue(result.completed)
+        self.assertFalse(result.failed)
+        self.assertLess(result.ticks, 500)
+        # timer only starts on keyboard input
+        self.assertEqual(result.time, 0.0)
+
+    def test_completion_time_counts_from_first_key(self):
+        loop = HeadlessLoop(self.end_level, tick_rate=100, max_ticks=500)
+        result = loop.run(itertools.repeat(TickInput(keys=(InputAction.DOWN,))))
+
+        self.assertTrue(result.completed)
+        self.assertAlmostEqual(result.time, result.ticks * loop.dt)
+
+    def test_max_ticks(self):
+        loop = HeadlessLoop(self.level, tick_rate=100, max_ticks=50)
+        result = loop.run(itertools.repeat(None))
+
+        self.assertFalse(result.completed)
+        self.assertEqual(result.ticks, 50)
+        self.assertIsNone(result.time)
+
+    def test_input_runs_out(self):
+        loop = HeadlessLoop(self.level)
+        result = loop.run([TickInput(keys=(InputAction.RIGHT,))] * 10)
+
+        self.assertFalse(result.completed)
+        self.assertEqual(result.ticks, 10)
+
+    def test_step_applies_input(self):
+        loop = HeadlessLoop(self.level)
+        scene = loop.create_scene()
+        start_x = scene._sprites.player.rect.x
+
+        for _ in range(20):
+            loop.step(scene, TickInput(keys=(InputAction.RIGHT,)))
+
+        self.assertGreater(scene._sprites.player.rect.x, start_x)
+        scene.cleanup()
+
+    def test_step_applies_clicks(self):
+        loop = HeadlessLoop(self.level)
+        scene = loop.create_scene()
+        loop.step(scene, TickInput(clicks=((InputAction.MOUSE_LEFT, (48, 48)),)))
+
+        self.assertIn((3, 3), scene._view.objects)
+        scene.cleanup()
+
+    def test_benchmark(self):
+        result = benchmark(self.level, ticks=100)
+        self.assertEqual(result.ticks, 100)
+        self.assertGreater(result.steps_per_second, 0)
+
+    def test_run_replay(self):
+        replay = Replay(2, 100)
+        for _ in range(30):
+            replay.add_key(InputAction.DOWN)
+            replay.end_tick()
+
+        loop = HeadlessLoop(self.end_level, tick_rate=100)
+        recorded = loop.run(TickInput(keys) for keys, _ in replay.iterate_ticks())
+
+        self.assertEqual(loop.run_replay(replay).ticks, recorded.ticks)
+
+    def test_replay_records_tick_rate(self):
+        scene = HeadlessLoop(self.end_level, tick_rate=100).create_scene()
+        self.assertEqual(scene.get_replay().tick_rate, 100)
+
+    def test_verify_replay(self):
+        scene = HeadlessLoop(self.end_level).create_scene()
+        while not scene.is_done():
+            scene.input_key(InputAction.DOWN)
+            scene.update(1 / Settings.TICK_RATE, (0, 0))
+
+        time = scene.get_next_scene_data().timer.get_time()
+        data = scene.get_replay().to_bytes()
+
+        self.assertTrue(verify_replay(self.end_level, data, time))
+        self.assertFalse(verify_replay(self.end_level, data, time - 0.5))
+        self.assertFalse(verify_replay(self.level, data, time))
+        self.assertFalse(verify_replay(self.end_level, b"", time))
@@ -0,0 +1,40 @@
+import json
+import unittest
+
+from constants import TEST_LEVEL_DATA
+from game.level_data import LevelData
+
+
+class TestLevelData(unittest.TestCase):
+    def test_encode_and_decode_tiles(self):
+        data = [row[:] for row in TEST_LEVEL_DATA]
+        data[0][0] = -3
+
+        encoded = LevelData.encode_tiles(data)
+
+        self.assertTrue(encoded.startswith(LevelData.TILES_MAGIC))
+        self.assertLess(len(encoded), len(json.dumps(data)))
+        self.assertEqual(LevelData.decode_tiles(encoded), data)
+
+    def test_encode_tiles_unsupported_data(self):
+        self.assertIsNone(LevelData.encode_tiles([]))
+        self.assertIsNone(LevelData.encode_tiles([[]]))
+        self.assertIsNone(LevelData.encode_tiles([[1, 2], [3]]))
+        self.assertIsNone(LevelData.encode_tiles([[128]]))
+
+    def test_decode_tiles_invalid_data(self):
+        encoded = LevelData.encode_tiles(TEST_LEVEL_DATA)
+
+        self.assertIsNone(LevelData.decode_tiles(b""))
+        self.assertIsNone(LevelData.decode_tiles(b"XXXX" + encoded[4:]))
+        self.assertIsNone(LevelData.decode_tiles(encoded[:-4]))
+
+    def test_from_db_row(self):
+        encoded = LevelData.encode_tiles(TEST_LEVEL_DATA)
+
+        from_bytes = LevelData.from_db_row((1, "potato", encoded))
+        from_json = LevelData.from_db_row((1, "potato", json.dumps(TEST_LEVEL_DATA)))
+
+        self.assertEqual(from_bytes, from_json)
+        self.assertEqual(from_bytes.data, TEST_LEVEL_DATA)
+        self.assertIsNone(LevelData.from_db_row((1, "potato", b"invalid")))
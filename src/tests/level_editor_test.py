@@ -10,11 +10,14 @@ from game.level_data import LevelData
 class TestLevelEditor(unittest.TestCase):
     def setUp(self):
         patch_ui = patch("scenes.level_editor.EditorUI")
-        patch_preview = patch("scenes.level_editor.generate_level_preview")
+        patch_preview = patch("scenes.level_editor.generate_tiles_preview")
+        patch_patch_preview = patch("scenes.level_editor.patch_level_preview")
         self.ui = patch_ui.start()
         self.preview = patch_preview.start()
+        self.patch_preview = patch_patch_preview.start()
         self.addCleanup(patch_ui.stop)
         self.addCleanup(patch_preview.stop)
+        self.addCleanup(patch_patch_preview.stop)
 
         ui_instance = self.ui.return_value
         ui_instance.is_save_clicked.return_value = False
@@ -22,7 +25,7 @@ class TestLevelEditor(unittest.TestCase):
         self.data = TEST_LEVEL_DATA
         self.editor = LevelEditor(LevelData(1, "potato", TEST_LEVEL_DATA))
 
-        data = self.editor._map._data
+        data = self.editor._map.data
 
         self.spawn_location = [(x, y) for y in range(len(data)) for x in range(
             len(data[0])) if data[y][x] == TileType.SPAWN]
@@ -156,3 +159,38 @@ class TestLevelEditor(unittest.TestCase):
         self.assertEqual(self.editor._map.get_tile_at_cell(x + 1, y + 1), 0)
         self.assertEqual(self.editor._has_required, {
                          "spawn": False, "end": True})
+
+    def test_edit_patches_preview(self):
+        self.preview.reset_mock()
+
+        self.editor.input_mouse_hold(
+            InputAction.MOUSE_LEFT, (4 * Settings.TILE_SIZE, 4 * Settings.TILE_SIZE))
+        self.editor.input_mouse_hold(
+            InputAction.MOUSE_RIGHT, (4 * Settings.TILE_SIZE, 4 * Settings.TILE_SIZE))
+
+        self.preview.assert_not_called()
+        self.assertEqual(self.patch_preview.call_count, 2)
+        self.patch_preview.assert_called_with(
+            self.editor._image, self.editor._map, (3, 3, 3, 3))
+
+        # nothing changed
+        self.editor.input_mouse_hold(
+            InputAction.MOUSE_RIGHT, (4 * Settings.TILE_SIZE, 4 * Settings.TILE_SIZE))
+        self.assertEqual(self.patch_preview.call_count, 2)
+
+    @patch("scenes.level_editor.save_level")
+    def test_save_level_larger_than_screen(self, save_level):
+        width = Settings.SCREEN_WIDTH // Settings.TILE_SIZE + 10
+        height = Settings.SCREEN_HEIGHT // Settings.TILE_SIZE + 4
+        data = [[TileType.BLOCK] * width for _ in range(height)]
+        data[1][1:3] = [TileType.SPAWN, -TileType.SPAWN]
+        data[2][1:3] = [-TileType.SPAWN, -TileType.SPAWN]
+        data[height - 2][width - 2] = TileType.END
+
+        editor = LevelEditor(LevelData(2, "large", data))
+        self.ui.return_value.is_save_clicked.return_value = True
+        editor.input_mouse(InputAction.MOUSE_LEFT, (0, 0))
+
+        saved = save_level.call_args.args[0]
+        self.assertEqual(saved.name, "large")
+        self.assertEqual(saved.data, data)
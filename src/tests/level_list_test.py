@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+from constants import InputAction, SceneName
+from scenes.level_list import LevelList
+from game.level_data import LevelData, LevelSummary
+
+
+class TestLevelList(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.levels = [LevelSummary(i, f"level {i}", 1, 1) for i in range(100)]
+
+        patches = {
+            "button": patch("scenes.level_list.Button"),
+            "preview": patch("scenes.level_list.get_level_preview"),
+            "count": patch("scenes.level_list.get_level_count", return_value=len(self.levels)),
+            "page": patch("scenes.level_list.get_level_summaries", side_effect=self._get_page),
+            "load": patch("scenes.level_list.load_level", side_effect=self._load_level),
+        }
+        self.mocks = {name: p.start() for name, p in patches.items()}
+        for p in patches.values():
+            self.addCleanup(p.stop)
+
+    def _get_page(self, offset, limit):
+        return self.levels[offset:offset + limit]
+
+    def _load_level(self, level_id):
+        return LevelData(level_id, self.levels[level_id].name, [[0]])
+
+    def test_only_entries_near_view_are_built(self):
+        level_list = LevelList(to_editor=False)
+
+        self.assertEqual(min(level_list._entries), 0)
+        self.assertLessEqual(len(level_list._entries), LevelList._PAGE_SIZE)
+        self.assertEqual(self.mocks["page"].call_count, 1)
+        self.assertEqual(self.mocks["preview"].call_count, len(level_list._entries))
+        self.mocks["load"].assert_not_called()
+
+    def test_scrolling_builds_and_releases_entries(self):
+        level_list = LevelList(to_editor=False)
+
+        for _ in range(100):
+            level_list.input_mouse(InputAction.MOUSE_SCROLL_DOWN, (0, 0))
+
+        first, last = level_list._get_visible_range()
+        self.assertGreater(first, LevelList._RELEASE_ROWS)
+        self.assertNotIn(0, level_list._entries)
+        for index in range(first, last + 1):
+            self.assertIn(index, level_list._entries)
+        self.assertLessEqual(
+            len(level_list._entries),
+            last - first + 1 + 2 * LevelList._RELEASE_ROWS)
+
+        for _ in range(100):
+            level_list.input_mouse(InputAction.MOUSE_SCROLL_UP, (0, 0))
+
+        self.assertIn(0, level_list._entries)
+
+    def test_editor_entries_have_delete_and_clear_buttons(self):
+        self.levels[0].best_time = 12.5
+        level_list = LevelList(to_editor=True)
+
+        self.assertEqual(len(level_list._entries[0]), 3)
+        self.assertEqual(len(level_list._entries[1]), 2)
+
+    def test_level_loaded_when_clicked(self):
+        level_list = LevelList(to_editor=False)
+
+        on_click = self.mocks["button"].call_args_list[1].kwargs["on_click"]
+        on_click()
+
+        self.mocks["load"].assert_called_once_with(0)
+        self.assertEqual(level_list.get_next_scene(), SceneName.LEVEL)
+        self.assertEqual(level_list.get_next_scene_data().id, 0)
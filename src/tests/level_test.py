@@ -1,9 +1,13 @@
 import unittest
 from unittest.mock import patch
 
-from constants import TileType, InputAction, TEST_LEVEL_DATA, Settings
+import pygame
+
+from constants import TileType, InputAction, TEST_LEVEL_DATA, Settings, CollisionMode
 from scenes.level import Level
 from game.level_data import LevelData
+from game.map import Map
+from game.tile_collider import TileCollider
 
 
 class TestLevel(unittest.TestCase):
@@ -12,7 +16,8 @@ class TestLevel(unittest.TestCase):
         self.ui = patch_ui.start()
         self.addCleanup(patch_ui.stop)
 
-        self.level = Level(LevelData(1, "potato", TEST_LEVEL_DATA))
+        # one block sprite per tile, merged blocks are tested separately
+        self.level = Level(LevelData(1, "potato", TEST_LEVEL_DATA), CollisionMode.SPRITES)
 
         self.enemies = sum(row.count(TileType.ENEMY)
                            for row in TEST_LEVEL_DATA)
@@ -40,7 +45,7 @@ class TestLevel(unittest.TestCase):
     def test_init(self):
         self.assertEqual(self.level._level.id, 1)
         self.assertEqual(self.level._level.name, "potato")
-        self.assertEqual(self.level._map._data, TEST_LEVEL_DATA)
+        self.assertEqual(self.level._map.data, TEST_LEVEL_DATA)
         self.assertEqual(self.level._map._width, len(TEST_LEVEL_DATA[0]))
         self.assertEqual(self.level._map._height, len(TEST_LEVEL_DATA))
         self.assertIsNotNone(self.level._timer)
@@ -52,7 +57,7 @@ class TestLevel(unittest.TestCase):
         self.assertIsNotNone(self.level._sprites.enemies)
         self.assertIsNotNone(self.level._sprites.world)
 
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.enemies), self.enemies)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
 
@@ -82,7 +87,7 @@ class TestLevel(unittest.TestCase):
 
     def test_input_mouse_add_placeable_valid(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
-        self.assertEqual(len(self.level._map_objects), self.placeable + 1)
+        self.assertEqual(len(self.level._view.objects), self.placeable + 1)
         self.assertEqual(len(self.level._sprites.blocks),
                          self.total_blocks + 1)
         self.assertEqual(len(self.level._sprites.world),
@@ -91,21 +96,21 @@ class TestLevel(unittest.TestCase):
 
     def test_input_mouse_add_placeable_out_of_bounds(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (-1, -1))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 3)
 
     def test_input_mouse_add_placeable_out_of_range(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (256, 256))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 3)
 
     def test_input_mouse_add_placeable_occupied(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (1, 1))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 3)
@@ -113,7 +118,7 @@ class TestLevel(unittest.TestCase):
     def test_input_mouse_add_placeable_no_charges(self):
         self.level._sprites.player.charges = 0
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 0)
@@ -121,16 +126,32 @@ class TestLevel(unittest.TestCase):
     def test_input_mouse_add_placeable_duplicate_placement(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
-        self.assertEqual(len(self.level._map_objects), self.placeable + 1)
+        self.assertEqual(len(self.level._view.objects), self.placeable + 1)
         self.assertEqual(len(self.level._sprites.blocks),
                          self.total_blocks + 1)
         self.assertEqual(len(self.level._sprites.world),
                          self.world_objects + 1)
 
+    def test_input_mouse_add_placeable_on_moved_enemy_spawn(self):
+        enemy_x, enemy_y = self.enemy_location[0]
+        self.level._sprites.enemies.sprites()[0].rect.topleft = (0, 0)
+        self.level._sprites.player.rect.topleft = ((enemy_x - 2) * Settings.TILE_SIZE,
+                                                   enemy_y * Settings.TILE_SIZE)
+
+        for x, y in ((enemy_x, enemy_y), (enemy_x + 1, enemy_y + 1)):
+            pos = (x * Settings.TILE_SIZE + 1, y * Settings.TILE_SIZE + 1)
+            self.level.input_mouse(InputAction.MOUSE_LEFT, pos)
+            self.level.input_mouse(InputAction.MOUSE_RIGHT, pos)
+
+        self.assertEqual(len(self.level._view.objects), self.placeable)
+        self.assertEqual(self.level._map.get_tile_at_cell(enemy_x, enemy_y), TileType.ENEMY)
+        self.assertEqual(self.level._map.get_tile_at_cell(enemy_x + 1, enemy_y + 1),
+                         -TileType.ENEMY)
+
     def test_input_mouse_remove_placeable_valid(self):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
         self.level.input_mouse(InputAction.MOUSE_RIGHT, (80, 80))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 3)
@@ -140,7 +161,7 @@ class TestLevel(unittest.TestCase):
         self.level._sprites.player.rect.x = 256
         self.level._sprites.player.rect.y = 256
         self.level.input_mouse(InputAction.MOUSE_RIGHT, (256, 256))
-        self.assertEqual(len(self.level._map_objects), self.placeable + 1)
+        self.assertEqual(len(self.level._view.objects), self.placeable + 1)
         self.assertEqual(len(self.level._sprites.blocks),
                          self.total_blocks + 1)
         self.assertEqual(len(self.level._sprites.world),
@@ -151,7 +172,7 @@ class TestLevel(unittest.TestCase):
         self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
         self.level.input_mouse(InputAction.MOUSE_RIGHT, (80, 80))
         self.level.input_mouse(InputAction.MOUSE_RIGHT, (80, 80))
-        self.assertEqual(len(self.level._map_objects), self.placeable)
+        self.assertEqual(len(self.level._view.objects), self.placeable)
         self.assertEqual(len(self.level._sprites.blocks), self.total_blocks)
         self.assertEqual(len(self.level._sprites.world), self.world_objects)
         self.assertEqual(self.level._sprites.player.charges, 3)
@@ -176,6 +197,20 @@ class TestLevel(unittest.TestCase):
         self.level._check_end_collisions()
         self.assertEqual(self.level.is_done(), True)
 
+    def test_variable_step_run_saved_without_replay(self):
+        level = Level(LevelData(1, "potato", TEST_LEVEL_DATA), save_times=False, tick_rate=0)
+        self.assertEqual(level.get_replay().tick_rate, 0)
+
+        level._sprites.player.rect.topleft = self.end_screen_location[0]
+        with patch.object(level._timer, "finish") as finish:
+            level._check_end_collisions()
+        finish.assert_called_once_with(None)
+
+        self.level._sprites.player.rect.topleft = self.end_screen_location[0]
+        with patch.object(self.level._timer, "finish") as finish:
+            self.level._check_end_collisions()
+        finish.assert_called_once_with(self.level.get_replay())
+
     def test_check_entities_in_bounds_player_horizontal(self):
         self.assertEqual(self.level.is_done(), False)
 
@@ -226,3 +261,310 @@ class TestLevel(unittest.TestCase):
         self.assertEqual(len(self.level._sprites.enemies), self.enemies - 1)
         self.assertEqual(len(self.level._sprites.world),
                          self.world_objects - 1)
+
+    def test_placeable_written_to_map(self):
+        self.level.input_mouse(InputAction.MOUSE_LEFT, (80, 80))
+        self.assertEqual(self.level._map.get_tile_at_cell(5, 5),
+                         TileType.PLACEABLE)
+
+        self.level.input_mouse(InputAction.MOUSE_RIGHT, (80, 80))
+        self.assertEqual(self.level._map.get_tile_at_cell(5, 5),
+                         TileType.EMPTY)
+
+        # level data is not modified
+        self.assertEqual(self.level._level.data, TEST_LEVEL_DATA)
+        self.assertEqual(TEST_LEVEL_DATA[5][5], TileType.EMPTY)
+
+    def test_tile_collision_mode(self):
+        level = Level(LevelData(1, "potato", TEST_LEVEL_DATA),
+                      CollisionMode.TILES)
+        self.assertIsInstance(level._colliders, TileCollider)
+        self.assertEqual(len(level._sprites.blocks), self.placeable)
+
+        for _ in range(100):
+            level.update(0.01, (0, 0))
+
+        for _ in range(99):
+            self.level.update(0.01, (0, 0))
+
+        # player falls to the floor the same way in both modes
+        player = level._sprites.player
+        self.assertTrue(player._body.on_floor)
+        self.assertEqual(player.rect.bottom,
+                         (len(TEST_LEVEL_DATA) - 1) * Settings.TILE_SIZE)
+        self.assertEqual(player.rect, self.level._sprites.player.rect)
+
+    def test_tile_collision_mode_blocks_not_replaced(self):
+        level = Level(LevelData(1, "potato", TEST_LEVEL_DATA),
+                      CollisionMode.TILES)
+        cell_x = TEST_LEVEL_DATA[-1].index(TileType.BLOCK)
+        cell_y = len(TEST_LEVEL_DATA) - 1
+
+        level._add_placeable_to_world(cell_x, cell_y)
+        self.assertNotIn((cell_x, cell_y), level._view.objects)
+        self.assertEqual(level._map.get_tile_at_cell(cell_x, cell_y), TileType.BLOCK)
+
+    def test_merged_collision_mode(self):
+        level = Level(LevelData(1, "potato", TEST_LEVEL_DATA),
+                      CollisionMode.MERGED)
+        self.assertLess(len(level._sprites.blocks), self.total_blocks // 4)
+
+        covered = sum(block.rect.width * block.rect.height
+                      for block in level._sprites.blocks)
+        self.assertEqual(covered, self.total_blocks * Settings.TILE_SIZE ** 2)
+
+        # merged blocks are only colliders, the tiles are drawn by the tile layer
+        merged = [block for block in level._sprites.blocks
+                  if block.rect.size != (Settings.TILE_SIZE, Settings.TILE_SIZE)]
+        self.assertTrue(merged)
+        self.assertTrue(all(block.image is None for block in merged))
+
+        for _ in range(100):
+            level.input_key(InputAction.RIGHT)
+            level.update(0.01, (0, 0))
+            self.level.input_key(InputAction.RIGHT)
+            self.level.update(0.01, (0, 0))
+
+        # player moves the same way as against single blocks
+        self.assertEqual(level._sprites.player.rect, self.level._sprites.player.rect)
+
+    def test_draw_interpolated(self):
+        display = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT))
+        self.level.interpolate(0.5)
+        self.level.draw(display)
+
+        player = self.level._sprites.player
+        self.assertEqual(player.get_draw_position(1.0),
+                         (player.rect.x, player.rect.y))
+
+    def test_get_and_set_state(self):
+        state = self.level.get_state()
+        player_rect = self.level.get_player_rect().copy()
+        enemy = self.level._sprites.enemies.sprites()[0]
+
+        self.level.input_key(InputAction.RIGHT)
+        for _ in range(20):
+            self.level.update(0.01, (0, 0))
+        enemy.kill()
+
+        self.assertNotEqual(self.level.get_player_rect(), player_rect)
+
+        self.level.set_state(state)
+
+        self.assertEqual(self.level.get_player_rect(), player_rect)
+        self.assertIn(enemy, self.level._sprites.enemies)
+        self.assertEqual(len(self.level._sprites.enemies), self.enemies)
+
+    def test_input_recorded_to_replay(self):
+        # setUp already ran one update
+        self.assertEqual(self.level.get_replay().ticks, 1)
+
+        self.level.input_mouse(InputAction.MOUSE_RIGHT, (0, 0))
+        self.level.input_key(InputAction.LEFT)
+        self.level.update(0.01, (0, 0))
+
+        ticks = list(self.level.get_replay().iterate_ticks())
+        self.assertEqual(ticks[-1], ((InputAction.LEFT,),
+                                     ((InputAction.MOUSE_RIGHT, (0, 0)),)))
+
+    def test_draw_dirty_matches_draw(self):
+        self.ui.return_value.render.return_value = (pygame.Rect(500, 20, 100, 30),)
+        size = (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)
+        dirty_display = pygame.Surface(size)
+        full_display = pygame.Surface(size)
+
+        rects = self.level.draw_dirty(dirty_display)
+        self.assertEqual(rects, [dirty_display.get_rect()])
+
+        player = self.level._sprites.player
+        pos = player.rect.topright
+        clicks = {5: (InputAction.MOUSE_LEFT, pos), 10: (InputAction.MOUSE_RIGHT, pos)}
+        charges = []
+
+        for frame in range(15):
+            self.level.input_key(InputAction.LEFT)
+            if frame in clicks:
+                self.level.input_mouse(*clicks[frame])
+                charges.append(player.charges)
+            self.level.update(0.02, (0, 0))
+            self.level.interpolate(0.5)
+
+            rects = self.level.draw_dirty(dirty_display)
+            self.assertLess(sum(r.width * r.height for r in rects), size[0] * size[1])
+
+            full_display.fill((0, 0, 0))
+            self.level.draw(full_display)
+
+            self.assertEqual(pygame.image.tobytes(dirty_display, "RGB"),
+                             pygame.image.tobytes(full_display, "RGB"))
+
+        # placeable was added and removed
+        self.assertEqual(charges, [2, 3])
+
+
+class TestLargeLevel(unittest.TestCase):
+    def setUp(self):
+        patch_ui = patch("scenes.level.LevelUI")
+        self.ui = patch_ui.start()
+        self.addCleanup(patch_ui.stop)
+
+        self.width = 400
+        self.height = Settings.SCREEN_HEIGHT // Settings.TILE_SIZE
+        tile_map = Map([[0] * self.width for _ in range(self.height)])
+        for x in range(self.width):
+            tile_map.set_tile_at_cell(x, self.height - 1, TileType.BLOCK)
+        tile_map.add_multi_tile(2, self.height - 3, TileType.SPAWN, (2, 2))
+        tile_map.add_multi_tile(380, self.height - 3, TileType.ENEMY, (2, 2))
+        tile_map.add_multi_tile(395, self.height - 3, TileType.END, (2, 2))
+
+        self.level = Level(LevelData(1, "long", tile_map.data), save_times=False)
+        self.level.update(0.01, (0, 0))
+
+    def move_player(self, x, y):
+        (body, charges), *rest = self.level.get_state()
+        body = ((x, y), (x, y), *body[2:])
+        self.level.set_state(((body, charges), *rest))
+
+    def test_only_chunks_near_view_loaded(self):
+        self.assertEqual(self.level._view.camera.offset, (0, 0))
+        self.assertLess(len(self.level._sprites.blocks), self.width // 2)
+        self.assertEqual(len(self.level._sprites.enemies), 0)
+        self.assertIsNotNone(self.level._sprites.end)
+
+    def test_chunks_follow_player(self):
+        blocks = len(self.level._sprites.blocks)
+        y = self.level.get_player_rect().y
+
+        self.move_player(3000, y)
+        self.level.update(0.01, (0, 0))
+
+        self.assertGreater(self.level._view.camera.offset[0], 0)
+        self.assertNotIn((0, 0), self.level._view.chunks.loaded_chunks)
+        self.assertEqual(self.level._view.chunks.loaded_chunks, self.level._view.tile_layer.loaded_chunks)
+        self.assertGreater(len(self.level._sprites.blocks), blocks)
+        self.assertLess(len(self.level._sprites.blocks), self.width // 2)
+        self.assertEqual(len(self.level._sprites.enemies), 0)
+
+        self.move_player(5800, y)
+        self.assertEqual(len(self.level._sprites.enemies), 1)
+
+        # enemies spawn once and are not released with their chunk
+        self.move_player(100, y)
+        self.assertEqual(len(self.level._sprites.enemies), 1)
+        self.move_player(5800, y)
+        self.assertEqual(len(self.level._sprites.enemies), 1)
+
+    def test_set_state_respawns_later_enemies(self):
+        y = self.level.get_player_rect().y
+        self.move_player(3000, y)
+        state = self.level.get_state()
+
+        self.move_player(5800, y)
+        self.assertEqual(len(self.level._sprites.enemies), 1)
+
+        # the enemy did not exist in the snapshot, but is spawned again with its chunk
+        self.level.set_state(state)
+        self.assertEqual(len(self.level._sprites.enemies), 0)
+        self.assertEqual(self.level._view.chunks.get_state(), state[2])
+
+        self.move_player(5800, y)
+        self.assertEqual(len(self.level._sprites.enemies), 1)
+
+    def test_world_bounds(self):
+        y = self.level.get_player_rect().y
+        self.move_player(3000, y)
+        self.level._check_entities_in_bounds()
+        self.assertFalse(self.level.is_done())
+
+        self.move_player(self.width * Settings.TILE_SIZE + 10, y)
+        self.level._check_entities_in_bounds()
+        self.assertTrue(self.level.is_done())
+
+    def test_mouse_uses_world_position(self):
+        y = self.level.get_player_rect().y
+        self.move_player(3000, y)
+        offset_x, offset_y = self.level._view.camera.offset
+
+        player = self.level.get_player_rect()
+        screen_pos = (player.right + 20 - offset_x, player.top - offset_y)
+        self.level.input_mouse(InputAction.MOUSE_LEFT, screen_pos)
+
+        cell = self.level._map.screen_to_cell_index((player.right + 20, player.top))
+        self.assertIn(cell, self.level._view.objects)
+        self.assertEqual(self.level._map.get_tile_at_cell(*cell), TileType.PLACEABLE)
+
+        # placed blocks are released and built again with their chunk
+        self.move_player(100, y)
+        self.assertNotIn(cell, self.level._view.objects)
+        self.move_player(3000, y)
+        self.assertIn(cell, self.level._view.objects)
+
+        self.level.input_mouse(InputAction.MOUSE_RIGHT, screen_pos)
+        self.assertNotIn(cell, self.level._view.objects)
+        self.assertEqual(self.level._map.get_tile_at_cell(*cell), TileType.EMPTY)
+
+    def test_sprites_out_of_view_not_drawn(self):
+        display = pygame.Surface((Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT))
+        sprites = self.level._sprites
+
+        in_view = sprites._get_sprites_in_view(display, self.level._view.camera.offset)
+        self.assertIn(sprites.player, in_view)
+        self.assertNotIn(sprites.end, in_view)
+
+        self.move_player(5800, self.level.get_player_rect().y)
+        in_view = sprites._get_sprites_in_view(display, self.level._view.camera.offset)
+        self.assertIn(sprites.player, in_view)
+        self.assertIn(sprites.end, in_view)
+        self.assertIn(sprites.enemies.sprites()[0], in_view)
+
+    def test_draw_dirty_matches_draw_while_scrolling(self):
+        self.ui.return_value.render.return_value = (pygame.Rect(500, 20, 100, 30),)
+        size = (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)
+        dirty_display = pygame.Surface(size)
+        full_display = pygame.Surface(size)
+
+        self.move_player(1500, self.level.get_player_rect().y)
+
+        for _ in range(10):
+            self.level.input_key(InputAction.RIGHT)
+            self.level.update(0.02, (0, 0))
+            self.level.interpolate(0.5)
+
+            self.level.draw_dirty(dirty_display)
+            full_display.fill((0, 0, 0))
+            self.level.draw(full_display)
+
+            self.assertEqual(pygame.image.tobytes(dirty_display, "RGB"),
+                             pygame.image.tobytes(full_display, "RGB"))
+
+    def test_placed_block_drawn_while_scrolling(self):
+        self.ui.return_value.render.return_value = (pygame.Rect(500, 20, 100, 30),)
+        size = (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)
+        dirty_display = pygame.Surface(size)
+        full_display = pygame.Surface(size)
+
+        self.move_player(1500, self.level.get_player_rect().y)
+        self.level.draw_dirty(dirty_display)
+        cell = None
+
+        for click in (InputAction.MOUSE_LEFT, InputAction.MOUSE_RIGHT) * 2:
+            self.level.input_key(InputAction.RIGHT)
+            self.level.update(0.02, (0, 0))
+            self.level.interpolate(0.5)
+
+            offset_x, offset_y = self.level._view.camera.offset
+            if click == InputAction.MOUSE_LEFT:
+                player = self.level.get_player_rect()
+                cell = self.level._map.screen_to_cell_index((player.right + 20, player.top))
+            x, y = self.level._map.cell_index_to_world_pos(cell)
+            self.level.input_mouse(click, (x + 1 - offset_x, y + 1 - offset_y))
+
+            placed = self.level._map.get_tile_at_cell(*cell) == TileType.PLACEABLE
+            self.assertEqual(placed, click == InputAction.MOUSE_LEFT)
+
+            self.level.draw_dirty(dirty_display)
+            full_display.fill((0, 0, 0))
+            self.level.draw(full_display)
+
+            self.assertEqual(pygame.image.tobytes(dirty_display, "RGB"),
+                             pygame.image.tobytes(full_display, "RGB"))
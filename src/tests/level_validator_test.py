@@ -0,0 +1,45 @@
+import unittest
+
+import tools.db as db
+from constants import TEST_LEVEL_END_DATA
+from level_validator import LevelSolver, validate_level, validate_levels
+from game.level_data import LevelData
+
+
+class TestLevelValidator(unittest.TestCase):
+    def setUp(self):
+        db.close_connection()
+        self.level = LevelData(1, "end", TEST_LEVEL_END_DATA)
+
+    def test_solver_finds_solution(self):
+        solver = LevelSolver(self.level, node_budget=50)
+        inputs = solver.solve()
+
+        self.assertIsNotNone(inputs)
+        self.assertTrue(solver.replay(inputs).completed)
+
+    def test_solver_no_solution(self):
+        # end is walled off from the spawn
+        data = [row[:] for row in TEST_LEVEL_END_DATA]
+        data[3] = [1] * 6
+        solver = LevelSolver(LevelData(1, "walled", data), node_budget=50)
+
+        self.assertIsNone(solver.solve())
+
+    def test_validate_level(self):
+        level_id, passed, time = validate_level(self.level, node_budget=50)
+
+        self.assertEqual(level_id, 1)
+        self.assertTrue(passed)
+        self.assertIsNotNone(time)
+
+    def test_validate_level_not_viable(self):
+        data = [[0, 0], [1, 1]]
+        self.assertEqual(validate_level(
+            LevelData(3, "empty", data)), (3, False, None))
+
+    def test_validate_levels_saves_results(self):
+        results = validate_levels([self.level], workers=1, node_budget=50)
+
+        self.assertTrue(results[1][0])
+        self.assertEqual(db.get_level_validation(1), results[1])
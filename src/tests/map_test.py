@@ -231,3 +231,127 @@ class TestMap(unittest.TestCase):
 
         # map should not have changed
         self.assertEqual(self.map._data, start_map_data)
+
+    def test_tile_counts_and_positions(self):
+        wall_count = 2 * self.width + 2 * self.height - 4
+        self.assertEqual(self.map._counts[1], wall_count)
+        self.assertEqual(list(self.map.iterate_cells(TileType.SPAWN)), [])
+        self.assertEqual(list(self.map.iterate_cells(TileType.BLOCK)),
+                         [cell for cell in self.map.iterate_cells() if cell[2] == TileType.BLOCK])
+
+        self.map.add_multi_tile(5, 5, TileType.SPAWN, (2, 2))
+        self.map.set_tile_at_cell(10, 5, TileType.END)
+        self.map.set_tile_at_cell(0, 0, 0)
+
+        self.assertEqual(self.map._counts[1], wall_count - 1)
+        self.assertEqual(self.map._counts[-TileType.SPAWN], 3)
+        self.assertEqual(list(self.map.iterate_cells(TileType.SPAWN)), [(5, 5, TileType.SPAWN)])
+        self.assertEqual(list(self.map.iterate_cells(TileType.END)), [(10, 5, TileType.END)])
+
+        self.map.remove_multi_tile(5, 5, (2, 2))
+
+        self.assertEqual(self.map._counts[-TileType.SPAWN], 0)
+        self.assertEqual(list(self.map.iterate_cells(TileType.SPAWN)), [])
+
+        # the index follows the tiles when the map is resized
+        self.map.expand_map(self.width * 2 * self.test_tilesize,
+                            self.height * 2 * self.test_tilesize)
+        end = next(self.map.iterate_cells(TileType.END))[:2]
+        self.assertEqual(self.map.get_tile_at_cell(*end), TileType.END)
+        self.assertEqual(self.map._counts[1], wall_count - 1)
+
+        self.map.shrink_map()
+        self.assertEqual(list(self.map.iterate_cells(TileType.END)), [(10, 5, TileType.END)])
+
+    def test_shrink_empty_map(self):
+        test_map = Map([[0] * 5 for _ in range(4)], self.test_tilesize)
+        test_map.shrink_map()
+
+        self.assertEqual(test_map.data, [[0]])
+        self.assertEqual((test_map.width, test_map.height), (1, 1))
+        self.assertEqual(test_map._counts[0], 1)
+
+    def test_shrink_map_keeps_uneven_bounds(self):
+        map_data = [[0] * 10 for _ in range(8)]
+        map_data[2][7] = 1
+        map_data[5][3] = -TileType.ENEMY
+        test_map = Map(map_data, self.test_tilesize)
+
+        test_map.shrink_map()
+
+        self.assertEqual(test_map.data, [
+            [0, 0, 0, 0, 1],
+            [0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0],
+            [-TileType.ENEMY, 0, 0, 0, 0],
+        ])
+        self.assertEqual(test_map._counts[0], 18)
+
+    def test_expand_map_smaller_than_map(self):
+        self.map.set_tile_at_cell(1, 1, TileType.END)
+        old_data = [row.copy() for row in self.map.data]
+        old_counts = self.map._counts.copy()
+        self.map.expand_map(10 * self.test_tilesize, 6 * self.test_tilesize)
+
+        # the map is not cut to the screen, only padded on the shorter axis
+        self.assertEqual((self.map.width, self.map.height), (self.width, self.height))
+        self.assertEqual(self.map.data, old_data)
+        self.assertEqual(self.map._counts, old_counts)
+
+        self.map.expand_map(self.width * 2 * self.test_tilesize, 6 * self.test_tilesize)
+        pad_x = self.width // 2
+        self.assertEqual((self.map.width, self.map.height), (self.width * 2, self.height))
+        self.assertEqual(self.map.get_tile_at_cell(1 + pad_x, 1), TileType.END)
+        self.assertEqual(self.map._positions[TileType.END], {(1 + pad_x, 1)})
+
+    def test_find_corner_of_large_multi_tile(self):
+        self.assertTrue(self.map.add_multi_tile(2, 2, TileType.ENEMY, (6, 5)))
+        self.assertEqual(self.map._areas[(2, 2)], (6, 5))
+
+        # the recorded corner is found regardless of the search depth
+        self.assertEqual(self.map.find_nearest_tile_corner(
+            7, 6, -TileType.ENEMY, (1, 1)), (2, 2))
+
+        # the corner moves with the map
+        self.map.expand_map(self.width * 2 * self.test_tilesize,
+                            self.height * 2 * self.test_tilesize)
+        pad_x, pad_y = self.width // 2, self.height // 2
+        self.assertEqual(self.map.find_nearest_tile_corner(
+            7 + pad_x, 6 + pad_y, -TileType.ENEMY, (1, 1)), (2 + pad_x, 2 + pad_y))
+        self.assertEqual(self.map._areas[(2 + pad_x, 2 + pad_y)], (6, 5))
+
+        self.assertTrue(self.map.remove_multi_tile(2 + pad_x, 2 + pad_y))
+        self.assertNotIn((2 + pad_x, 2 + pad_y), self.map._areas)
+        self.assertFalse(self.map.contains_tile(-TileType.ENEMY))
+        self.assertIsNone(self.map.find_nearest_tile_corner(
+            7 + pad_x, 6 + pad_y, -TileType.ENEMY, (1, 1)))
+
+    def test_find_corner_of_incomplete_multi_tile(self):
+        # filler cells that do not form a complete multi-tile fall back to searching
+        self.map.set_tile_at_cell(5, 5, TileType.SPAWN)
+        self.map.set_tile_at_cell(6, 6, -TileType.SPAWN)
+
+        self.assertNotIn((5, 5), self.map._areas)
+        self.assertEqual(self.map.find_nearest_tile_corner(
+            6, 6, -TileType.SPAWN, (1, 1)), (5, 5))
+
+    def test_multi_tiles_of_loaded_map_are_indexed(self):
+        source = Map(self.map_data, self.test_tilesize)
+        source.add_multi_tile(2, 2, TileType.ENEMY, (6, 5))
+        source.add_multi_tile(8, 2, TileType.ENEMY, (2, 2))
+        source.add_multi_tile(12, 3, TileType.SPAWN, (3, 1))
+
+        loaded = Map(source.data, self.test_tilesize)
+
+        self.assertEqual(loaded._areas, source._areas)
+        self.assertEqual(loaded._anchors, source._anchors)
+        self.assertEqual(loaded.find_nearest_tile_corner(
+            7, 6, -TileType.ENEMY, (1, 1)), (2, 2))
+
+        self.assertTrue(loaded.remove_multi_tile(2, 2))
+        self.assertEqual(loaded.get_tile_at_cell(7, 6), 0)
+        self.assertEqual(loaded.get_tile_at_cell(8, 2), TileType.ENEMY)
+
+        # the index is kept when the map is not padded
+        loaded.expand_map(10 * self.test_tilesize, 6 * self.test_tilesize)
+        self.assertEqual(loaded._areas, {(8, 2): (2, 2), (12, 3): (3, 1)})
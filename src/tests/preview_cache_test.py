@@ -0,0 +1,90 @@
+import os
+import unittest
+from unittest.mock import patch
+import pygame
+
+import tools.db as db
+from constants import TEST_LEVEL_END_DATA
+from game.level_data import LevelData
+from tools.db_models import Level
+from tools.db_utils import run_db_query
+from tools.preview_cache import get_level_preview
+from tools.preview_generator import generate_level_preview
+
+
+class TestPreviewCache(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.addCleanup(pygame.display.quit)
+
+        db.close_connection()
+        db.save_level(LevelData(-1, "potato", TEST_LEVEL_END_DATA))
+        self.level = LevelData(db.get_level_id(
+            "potato"), "potato", TEST_LEVEL_END_DATA)
+
+    def test_cached_preview_matches_generated(self):
+        generated = get_level_preview(self.level.id)
+        self.assertIsNotNone(db.load_level_preview(self.level.id))
+
+        with patch("tools.preview_cache.generate_level_preview") as generate:
+            cached = get_level_preview(self.level.id)
+            generate.assert_not_called()
+
+        self.assertEqual(pygame.image.tobytes(cached, "RGBA"),
+                         pygame.image.tobytes(generated, "RGBA"))
+        self.assertEqual(pygame.image.tobytes(cached, "RGBA"), pygame.image.tobytes(
+            generate_level_preview(self.level.data), "RGBA"))
+
+    def test_changed_size_regenerated(self):
+        get_level_preview(self.level.id)
+
+        with patch("tools.preview_cache.generate_level_preview",
+                   wraps=generate_level_preview) as generate:
+            get_level_preview(self.level.id, (100, 50))
+            get_level_preview(self.level.id, (100, 50))
+            self.assertEqual(generate.call_count, 1)
+
+    def test_cached_preview_does_not_load_level(self):
+        get_level_preview(self.level.id)
+
+        with patch("tools.preview_cache.load_level") as load:
+            get_level_preview(self.level.id)
+            load.assert_not_called()
+
+    def test_saved_level_regenerated(self):
+        get_level_preview(self.level.id)
+
+        changed = [[1] * len(row) for row in TEST_LEVEL_END_DATA]
+        db.save_level(LevelData(self.level.id, "potato", changed))
+
+        self.assertEqual(pygame.image.tobytes(get_level_preview(self.level.id), "RGBA"),
+                         pygame.image.tobytes(generate_level_preview(changed), "RGBA"))
+
+    def test_level_changed_outside_save_regenerated(self):
+        get_level_preview(self.level.id)
+
+        changed = [[1] * len(row) for row in TEST_LEVEL_END_DATA]
+        columns = db._get_level_columns(changed)
+
+        def query(session):
+            session.query(Level).filter_by(id=self.level.id).update(columns)
+        run_db_query(query)
+
+        self.assertIsNotNone(db.load_level_preview(self.level.id))
+        self.assertEqual(pygame.image.tobytes(get_level_preview(self.level.id), "RGBA"),
+                         pygame.image.tobytes(generate_level_preview(changed), "RGBA"))
+
+    def test_invalidated_on_save_and_delete(self):
+        get_level_preview(self.level.id)
+        db.save_level(self.level)
+        self.assertIsNone(db.load_level_preview(self.level.id))
+
+        get_level_preview(self.level.id)
+        db.delete_level(self.level.id)
+        self.assertIsNone(db.load_level_preview(self.level.id))
+
+    def test_missing_level(self):
+        self.assertIsNone(get_level_preview(-1))
+        self.assertIsNone(db.load_level_preview(-1))
@@ -0,0 +1,68 @@
+import os
+import unittest
+import pygame
+
+import constants
+from constants import TEST_LEVEL_DATA, Settings
+from game.array_map import ArrayMap
+from tools.preview_generator import generate_level_preview, generate_tiles_preview, \
+    patch_level_preview
+
+
+def generate_reference_preview(level_data, size):
+    width = len(level_data[0])
+    height = len(level_data)
+
+    surface = pygame.Surface((width, height)).convert_alpha()
+    for y in range(height):
+        for x in range(width):
+            color = constants.TILE_COLORS.get(abs(level_data[y][x]), (0, 0, 0))
+            surface.set_at((x, y), color)
+
+    scaler = min(size[0] / width, size[1] / height)
+    return pygame.transform.scale(surface, (int(width * scaler), int(height * scaler)))
+
+
+class TestPreviewGenerator(unittest.TestCase):
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.addCleanup(pygame.display.quit)
+
+    def assert_same_as_reference(self, level_data, size=(300, 150)):
+        preview = generate_level_preview(level_data, size)
+        reference = generate_reference_preview(level_data, size)
+
+        self.assertEqual(preview.get_size(), reference.get_size())
+        self.assertEqual(pygame.image.tobytes(preview, "RGBA"),
+                         pygame.image.tobytes(reference, "RGBA"))
+
+    def test_matches_reference(self):
+        self.assert_same_as_reference(TEST_LEVEL_DATA)
+        self.assert_same_as_reference(TEST_LEVEL_DATA, (1280, 720))
+
+    def test_filler_and_unknown_tiles(self):
+        data = [[0, 1, -1, 2, -2, 3], [-3, 4, -4, 5, -5, 9], [-9, 100, -100, 0, 0, 0]]
+        self.assert_same_as_reference(data, (60, 30))
+
+    def test_patch_matches_regenerated(self):
+        tile_map = ArrayMap([[0] * 80 for _ in range(45)])
+        size = (Settings.SCREEN_WIDTH, Settings.SCREEN_HEIGHT)
+        preview = generate_level_preview(tile_map.data, size)
+
+        # 2x2 enemy at the edge of the level
+        tile_map.add_multi_tile(78, 43, 3, (2, 2))
+        patch_level_preview(preview, tile_map, (77, 42, 3, 3))
+        tile_map.set_tile_at_cell(10, 10, 1)
+        patch_level_preview(preview, tile_map, (10, 10, 1, 1))
+
+        self.assertEqual(pygame.image.tobytes(preview, "RGBA"), pygame.image.tobytes(
+            generate_level_preview(tile_map.data, size), "RGBA"))
+
+    def test_tiles_preview_matches_level_preview(self):
+        tile_map = ArrayMap(TEST_LEVEL_DATA)
+
+        self.assertEqual(pygame.image.tobytes(generate_tiles_preview(
+            tile_map.tiles, (tile_map.width, tile_map.height), (640, 360)), "RGBA"),
+            pygame.image.tobytes(generate_level_preview(TEST_LEVEL_DATA, (640, 360)), "RGBA"))
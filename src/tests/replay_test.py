@@ -0,0 +1,67 @@
+import unittest
+
+from constants import InputAction
+from game.replay import Replay
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.replay = Replay(7, 120)
+
+        for _ in range(3):
+            self.replay.add_key(InputAction.RIGHT)
+            self.replay.end_tick()
+
+        self.replay.add_click(InputAction.MOUSE_LEFT, (40, 50))
+        self.replay.add_key(InputAction.JUMP)
+        self.replay.add_key(InputAction.LEFT)
+        self.replay.end_tick()
+        self.replay.end_tick()
+
+    def test_iterate_ticks(self):
+        ticks = list(self.replay.iterate_ticks())
+
+        self.assertEqual(self.replay.ticks, 5)
+        self.assertEqual(ticks[:3], [((InputAction.RIGHT,), ())] * 3)
+        self.assertEqual(ticks[3], ((InputAction.LEFT, InputAction.JUMP),
+                                    ((InputAction.MOUSE_LEFT, (40, 50)),)))
+        self.assertEqual(ticks[4], ((), ()))
+
+    def test_held_keys_are_run_length_encoded(self):
+        replay = Replay(1)
+        for _ in range(1000):
+            replay.add_key(InputAction.RIGHT)
+            replay.end_tick()
+
+        self.assertEqual(len(replay.to_bytes()), len(Replay(1).to_bytes()) + 3)
+
+    def test_long_runs_are_split(self):
+        replay = Replay(1)
+        for _ in range(0x10000 + 5):
+            replay.end_tick()
+
+        decoded = Replay.from_bytes(replay.to_bytes())
+        self.assertEqual(decoded.ticks, 0x10000 + 5)
+        self.assertEqual(sum(1 for _ in decoded.iterate_ticks()), 0x10000 + 5)
+
+    def test_to_bytes_and_from_bytes(self):
+        decoded = Replay.from_bytes(self.replay.to_bytes())
+
+        self.assertEqual(decoded.level_id, 7)
+        self.assertEqual(decoded.tick_rate, 120)
+        self.assertEqual(list(decoded.iterate_ticks()),
+                         list(self.replay.iterate_ticks()))
+
+    def test_clicks_after_last_tick_are_not_saved(self):
+        self.replay.add_click(InputAction.MOUSE_RIGHT, (1, 1))
+        decoded = Replay.from_bytes(self.replay.to_bytes())
+
+        self.assertEqual(len(decoded.to_bytes()), len(self.replay.to_bytes()))
+
+    def test_from_bytes_invalid(self):
+        data = self.replay.to_bytes()
+
+        self.assertIsNone(Replay.from_bytes(b""))
+        self.assertIsNone(Replay.from_bytes(b"XXXX" + data[4:]))
+        self.assertIsNone(Replay.from_bytes(data[:-1]))
+        self.assertIsNone(Replay.from_bytes(data + b"\0"))
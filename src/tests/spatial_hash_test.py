@@ -0,0 +1,103 @@
+import unittest
+import pygame
+
+from game.spatial_hash import SpatialHash
+from game.spatial_group import SpatialGroup, SpatialDrawGroup
+from sprites.block import Block
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        self.index = SpatialHash(16)
+
+    def test_insert_and_query(self):
+        self.index.insert("a", pygame.Rect(0, 0, 16, 16))
+        self.index.insert("b", pygame.Rect(64, 64, 16, 16))
+
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.query(pygame.Rect(8, 8, 16, 16)), ["a"])
+        self.assertEqual(self.index.query(pygame.Rect(60, 60, 8, 8)), ["b"])
+        self.assertEqual(self.index.query(pygame.Rect(20, 20, 8, 8)), [])
+
+    def test_touching_edges_do_not_collide(self):
+        self.index.insert("a", pygame.Rect(0, 0, 16, 16))
+        self.assertEqual(self.index.query(pygame.Rect(16, 0, 16, 16)), [])
+        self.assertEqual(self.index.query(pygame.Rect(0, 16, 16, 16)), [])
+
+    def test_large_item_returned_once(self):
+        self.index.insert("big", pygame.Rect(0, 0, 64, 64))
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 64, 64)), ["big"])
+
+    def test_negative_coordinates(self):
+        self.index.insert("a", pygame.Rect(-20, -20, 16, 16))
+        self.assertEqual(self.index.query(pygame.Rect(-10, -10, 4, 4)), ["a"])
+
+    def test_remove(self):
+        self.index.insert("a", pygame.Rect(0, 0, 16, 16))
+        self.assertTrue(self.index.remove("a"))
+        self.assertFalse(self.index.remove("a"))
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 16, 16)), [])
+
+    def test_insert_existing_moves_item(self):
+        self.index.insert("a", pygame.Rect(0, 0, 16, 16))
+        self.index.insert("a", pygame.Rect(100, 100, 16, 16))
+        self.assertEqual(len(self.index), 1)
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 16, 16)), [])
+        self.assertEqual(self.index.query(
+            pygame.Rect(100, 100, 16, 16)), ["a"])
+
+
+class TestSpatialGroup(unittest.TestCase):
+    def setUp(self):
+        self.group = SpatialGroup(16)
+        self.block = Block(32, 32)
+        self.group.add(self.block, Block(128, 32))
+
+    def test_collide_rect(self):
+        self.assertEqual(self.group.collide_rect(
+            pygame.Rect(24, 24, 16, 16)), [self.block.rect])
+        self.assertEqual(self.group.collide_rect(
+            pygame.Rect(64, 64, 16, 16)), [])
+
+    def test_kill_removes_from_index(self):
+        self.block.kill()
+        self.assertEqual(len(self.group), 1)
+        self.assertEqual(self.group.collide_rect(
+            pygame.Rect(24, 24, 16, 16)), [])
+
+    def test_empty_clears_index(self):
+        self.group.empty()
+        self.assertEqual(self.group.collide_rect(
+            pygame.Rect(0, 0, 256, 256)), [])
+
+
+class TestSpatialDrawGroup(unittest.TestCase):
+    def setUp(self):
+        self.group = SpatialDrawGroup(64)
+        self.near = Block(32, 32)
+        self.far = Block(1000, 32)
+        self.group.add(self.far, layer=20)
+        self.group.add(self.near, layer=10)
+
+    def test_sprites_in_rect(self):
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(0, 0, 100, 100)), [self.near])
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(500, 0, 100, 100)), [])
+
+    def test_sprites_in_drawing_order(self):
+        above = Block(40, 40)
+        self.group.add(above, layer=10)
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(0, 0, 2000, 100)),
+                         self.group.sprites())
+
+    def test_refresh_moved_sprite(self):
+        self.far.rect.topleft = (40, 40)
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(0, 0, 100, 100)), [self.near])
+
+        self.group.refresh(self.far, Block(0, 0))
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(0, 0, 100, 100)),
+                         [self.near, self.far])
+
+    def test_kill_removes_from_index(self):
+        self.near.kill()
+        self.assertEqual(self.group.get_sprites_in_rect(pygame.Rect(0, 0, 100, 100)), [])
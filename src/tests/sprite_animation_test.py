@@ -0,0 +1,103 @@
+import unittest
+import pygame
+
+from game.sprite_animation import SpriteAnimation, FrameSetRegistry
+from sprites.enemy import Enemy
+from tools.asset_helpers import load_image, get_spritesheet_frames
+
+
+class TestSpriteAnimation(unittest.TestCase):
+    def setUp(self):
+        FrameSetRegistry.clear()
+        self.addCleanup(FrameSetRegistry.clear)
+
+        self.base = load_image("pl_enemy.png").copy()
+        self.base.set_alpha(100)
+
+        self.animation = SpriteAnimation(
+            fps=10, scale=(32, 32), base="pl_enemy.png", base_alpha=100)
+        self.animation.add_image_set("move", "enemy_spritesheet.png", (72, 51), 5)
+
+        self.frames = get_spritesheet_frames(
+            load_image("enemy_spritesheet.png"), 72, 51, 5, (32, 32))
+
+    def render(self, frame):
+        # how the sprites used to draw each frame
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        image.blit(self.base, (0, 0))
+        image.blit(frame, (0, 0))
+        return pygame.image.tobytes(image, "RGBA")
+
+    def test_frames_composited_on_base(self):
+        for i, frame in enumerate(self.frames):
+            self.assertEqual(pygame.image.tobytes(
+                self.animation.get_frame("move", i), "RGBA"), self.render(frame))
+
+    def test_flipped_frames(self):
+        self.animation.set_flipped(True)
+
+        for i, frame in enumerate(self.frames):
+            flipped = pygame.transform.flip(frame, True, False)
+            self.assertEqual(pygame.image.tobytes(
+                self.animation.get_frame("move", i), "RGBA"), self.render(flipped))
+
+    def test_get_frame_returns_same_surface(self):
+        frame = self.animation.get_frame("move")
+        self.assertIs(self.animation.get_frame("move"), frame)
+
+        self.animation.update(0.1)
+        self.assertIs(self.animation.get_frame("move"),
+                      self.animation.get_frame("move", 1))
+
+    def test_get_frame_missing_set(self):
+        self.assertEqual(self.animation.get_frame("idle").get_size(), (1, 1))
+
+
+class TestFrameSetRegistry(unittest.TestCase):
+    def setUp(self):
+        FrameSetRegistry.clear()
+        self.addCleanup(FrameSetRegistry.clear)
+
+    def test_acquire_and_release(self):
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return ("frames",)
+
+        self.assertEqual(FrameSetRegistry.acquire("a", loader), ("frames",))
+        FrameSetRegistry.acquire("a", loader)
+
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(FrameSetRegistry.get_ref_count("a"), 2)
+
+        FrameSetRegistry.release("a")
+        self.assertEqual(FrameSetRegistry.get_ref_count("a"), 1)
+        FrameSetRegistry.release("a")
+        self.assertEqual(FrameSetRegistry.get_ref_count("a"), 0)
+
+        FrameSetRegistry.acquire("a", loader)
+        self.assertEqual(len(loads), 2)
+
+    def test_release_unknown_key(self):
+        FrameSetRegistry.release("missing")
+        self.assertEqual(FrameSetRegistry.get_ref_count("missing"), 0)
+
+    def test_enemies_share_frames(self):
+        first = Enemy(0, 0)
+        second = Enemy(64, 0)
+        key = first._animation._frame_sets["move"].key
+
+        self.assertIs(first._animation.get_frame("move"),
+                      second._animation.get_frame("move"))
+        self.assertEqual(FrameSetRegistry.get_ref_count(key), 2)
+
+        first.kill()
+        first.kill()
+        self.assertEqual(FrameSetRegistry.get_ref_count(key), 1)
+
+        # killed sprites can still be drawn
+        self.assertEqual(first._animation.get_frame("move").get_size(), (32, 32))
+
+        second.kill()
+        self.assertEqual(FrameSetRegistry.get_ref_count(key), 0)
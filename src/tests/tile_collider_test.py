@@ -0,0 +1,51 @@
+import unittest
+import pygame
+
+from constants import TileType
+from game.map import Map
+from game.tile_collider import TileCollider
+from sprites.player import Player
+
+
+class TestTileCollider(unittest.TestCase):
+    def setUp(self):
+        # floor of blocks at the bottom row
+        self.data = [[0] * 10 for _ in range(10)]
+        self.data[9] = [TileType.BLOCK] * 10
+        self.map = Map(self.data, 16)
+        self.collider = TileCollider(self.map)
+
+    def test_collide_rect_hits_floor(self):
+        rects = self.collider.collide_rect(pygame.Rect(0, 140, 32, 8))
+        self.assertEqual(rects, [pygame.Rect(0, 144, 16, 16),
+                                 pygame.Rect(16, 144, 16, 16)])
+
+    def test_collide_rect_empty_area(self):
+        self.assertEqual(self.collider.collide_rect(
+            pygame.Rect(0, 0, 32, 32)), [])
+
+    def test_collide_rect_out_of_bounds(self):
+        self.assertEqual(self.collider.collide_rect(
+            pygame.Rect(-64, -64, 32, 32)), [])
+
+    def test_map_changes_are_visible(self):
+        rect = pygame.Rect(32, 32, 16, 16)
+        self.map.set_tile_at_cell(2, 2, TileType.PLACEABLE)
+        self.assertEqual(self.collider.collide_rect(rect), [rect])
+
+        self.map.set_tile_at_cell(2, 2, TileType.EMPTY)
+        self.assertEqual(self.collider.collide_rect(rect), [])
+
+    def test_non_solid_tiles_ignored(self):
+        self.map.set_tile_at_cell(2, 2, TileType.END)
+        self.map.set_tile_at_cell(3, 2, -TileType.ENEMY)
+        self.assertEqual(self.collider.collide_rect(
+            pygame.Rect(32, 32, 32, 16)), [])
+
+    def test_player_lands_on_tiles(self):
+        player = Player(0, 100)
+        for _ in range(20):
+            player.move(0.05, self.collider)
+
+        self.assertEqual(player.rect.bottom, 144)
+        self.assertTrue(player._body.on_floor)
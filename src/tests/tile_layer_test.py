@@ -0,0 +1,100 @@
+import unittest
+import pygame
+
+from constants import TileType, TEST_LEVEL_DATA
+from game.chunk_map import ChunkMap
+from game.tile_layer import TileLayer
+from sprites.block import Block
+from sprites.placeable import Placeable
+
+
+class TestTileLayer(unittest.TestCase):
+    def setUp(self):
+        self.map = ChunkMap([row[:] for row in TEST_LEVEL_DATA], chunk_size=8)
+        self.layer = TileLayer(self.map)
+        for chunk in self.map.get_chunks_in_rect(self.world_rect()):
+            self.layer.load_chunk(chunk)
+
+    def world_rect(self):
+        size = self.map.tile_size
+        return pygame.Rect(0, 0, self.map.width * size, self.map.height * size)
+
+    def draw_layer(self, offset=(0, 0)):
+        display = pygame.Surface(self.world_rect().size)
+        self.layer.draw(display, offset)
+        return display
+
+    def draw_sprites(self, offset=(0, 0)):
+        size = self.map.tile_size
+        display = pygame.Surface(self.world_rect().size)
+        for cell_x, cell_y, tile_id in self.map.iterate_cells():
+            if tile_id == TileType.BLOCK:
+                sprite = Block(cell_x * size, cell_y * size)
+            elif tile_id == TileType.PLACEABLE:
+                sprite = Placeable(cell_x * size, cell_y * size)
+            else:
+                continue
+            display.blit(sprite.image, sprite.rect.move(-offset[0], -offset[1]))
+        return display
+
+    def assert_matches_sprites(self, offset=(0, 0)):
+        self.assertEqual(pygame.image.tobytes(self.draw_layer(offset), "RGB"),
+                         pygame.image.tobytes(self.draw_sprites(offset), "RGB"))
+
+    def test_loads_all_chunks(self):
+        self.assertEqual(self.layer.loaded_chunks,
+                         set(self.map.get_chunks_in_rect(self.world_rect())))
+
+    def test_matches_sprites(self):
+        self.assert_matches_sprites()
+
+    def test_matches_sprites_with_offset(self):
+        self.assert_matches_sprites((37, -21))
+
+    def test_draw_area(self):
+        area = pygame.Rect(40, 100, 150, 60)
+        display = pygame.Surface(self.world_rect().size)
+        self.layer.draw(display, area=area)
+
+        expected = self.draw_sprites()
+        self.assertEqual(pygame.image.tobytes(display.subsurface(area), "RGB"),
+                         pygame.image.tobytes(expected.subsurface(area), "RGB"))
+        self.assertEqual(display.get_at((area.right + 5, area.bottom + 5)), (0, 0, 0, 255))
+
+    def test_release_chunk(self):
+        self.layer.release_chunk((0, 0))
+        self.assertNotIn((0, 0), self.layer.loaded_chunks)
+
+        display = self.draw_layer()
+        chunk = self.map.get_chunk_rect((0, 0))
+        blank = pygame.Surface(chunk.size)
+        self.assertEqual(pygame.image.tobytes(display.subsurface(chunk), "RGB"),
+                         pygame.image.tobytes(blank, "RGB"))
+
+    def test_patch_cell(self):
+        self.map.set_tile_at_cell(1, 1, TileType.PLACEABLE)
+        self.layer.patch_cell(1, 1)
+        self.assert_matches_sprites()
+
+        self.map.set_tile_at_cell(1, 1, TileType.EMPTY)
+        self.layer.patch_cell(1, 1)
+        self.assert_matches_sprites()
+
+        size = self.map.tile_size
+        self.assertEqual(self.layer.pop_changed(),
+                         [pygame.Rect(size, size, size, size)] * 2)
+        self.assertEqual(self.layer.pop_changed(), [])
+
+    def test_patch_cell_in_released_chunk(self):
+        self.layer.release_chunk((0, 0))
+        self.map.set_tile_at_cell(1, 1, TileType.PLACEABLE)
+        self.layer.patch_cell(1, 1)
+        self.assertEqual(self.layer.pop_changed(), [])
+
+        self.layer.load_chunk((0, 0))
+        self.assert_matches_sprites()
+
+    def test_patch_cell_out_of_bounds(self):
+        self.layer.patch_cell(-1, 0)
+        self.layer.patch_cell(self.map.width, 0)
+        self.assertEqual(self.layer.pop_changed(), [])
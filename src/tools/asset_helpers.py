@@ -1,12 +1,81 @@
 """Utility functions for loading assets and creating fallback textures."""
 
 import os
+from collections import OrderedDict
+
 import pygame
 from constants import Settings
 
 _ASSET_DIR = os.path.dirname(__file__)
 
 
+class ImageCache:
+    """A utility class for caching loaded images.
+
+    Images are keyed by path, scale and convert mode. When the cache is full,
+    the least recently used image is evicted.
+    Cached surfaces are shared, so they must be copied before being modified.
+    """
+    _image_cache = OrderedDict()
+    _max_size = 64
+
+    @classmethod
+    def get(cls, key):
+        """Get a cached image and mark it as recently used.
+
+        Args:
+            key (tuple): The cache key (path, scale, convert_alpha).
+
+        Returns:
+            pygame.Surface or None: The cached image, or None if not cached.
+        """
+        image = cls._image_cache.get(key)
+        if image is not None:
+            cls._image_cache.move_to_end(key)
+        return image
+
+    @classmethod
+    def add(cls, key, image):
+        """Add an image to the cache, evicting the least recently used image if full.
+
+        Args:
+            key (tuple): The cache key (path, scale, convert_alpha).
+            image (pygame.Surface): The image to cache.
+        """
+        cls._image_cache[key] = image
+        cls._image_cache.move_to_end(key)
+
+        while len(cls._image_cache) > cls._max_size:
+            cls._image_cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, image_path):
+        """Remove all cached versions of an image, so it is loaded again on next use.
+
+        Args:
+            image_path (str): The filename of the image (relative to assets).
+        """
+        for key in [key for key in cls._image_cache if key[0] == image_path]:
+            del cls._image_cache[key]
+
+    @classmethod
+    def set_max_size(cls, max_size):
+        """Set the maximum number of cached images.
+
+        Args:
+            max_size (int): The maximum number of images.
+        """
+        cls._max_size = max_size
+
+        while len(cls._image_cache) > cls._max_size:
+            cls._image_cache.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        """Clear all cached images."""
+        cls._image_cache.clear()
+
+
 def get_asset_path(asset_name):
     """Get the absolute path to an asset.
 
@@ -24,10 +93,12 @@ def get_asset_path(asset_name):
     return asset_path
 
 
-def load_image(image_path, scale=(0, 0)):
+def load_image(image_path, scale=(0, 0), convert_alpha=False, cached=True):
     """Load an image from the assets folder and optionally scale it.
 
     If the image is not found, a fallback checkerboard texture is returned.
+    Images are cached by default, the returned surface is then shared
+    and must be copied before it is modified.
 
     Args:
         image_path (str): The filename of the image to load (relative to assets).
@@ -35,6 +106,37 @@ def load_image(image_path, scale=(0, 0)):
             Desired image size. If (0, 0), no scaling is applied.
             If image is missing, this sets fallback size.
             Defaults to (0, 0).
+        convert_alpha (bool, optional): Convert the image to the display's pixel format
+            for faster drawing. Ignored if the display is not initialized. Defaults to False.
+        cached (bool, optional): Use the shared image cache. Defaults to True.
+
+    Returns:
+        pygame.Surface: The loaded and scaled image surface.
+    """
+    convert_alpha = convert_alpha and pygame.display.get_surface() is not None
+    key = (image_path, tuple(scale), convert_alpha)
+
+    if cached:
+        image = ImageCache.get(key)
+        if image is not None:
+            return image
+
+    image = _load_image(image_path, scale)
+    if convert_alpha:
+        image = image.convert_alpha()
+
+    if cached:
+        ImageCache.add(key, image)
+
+    return image
+
+
+def _load_image(image_path, scale):
+    """Load and scale an image from the assets folder without caching.
+
+    Args:
+        image_path (str): The filename of the image to load (relative to assets).
+        scale (tuple[int, int]): Desired image size, (0, 0) for no scaling.
 
     Returns:
         pygame.Surface: The loaded and scaled image surface.
@@ -2,11 +2,12 @@
 
 import json
 
-from sqlalchemy import func
+from sqlalchemy import func, text
+from sqlalchemy.exc import SQLAlchemyError
 
-from game.level_data import LevelData
+from game.level_data import LevelData, LevelSummary
 from tools.db_connection import DBConnection
-from tools.db_models import Level, LevelTime
+from tools.db_models import Level, LevelTime, LevelReplay, LevelValidation, LevelPreview
 from tools.db_utils import run_db_query
 
 
@@ -33,14 +34,30 @@ def get_engine():
     return DBConnection.get_engine()
 
 
+def compact_db() -> bool:
+    """Rebuild the database file to free the space left by deleted and converted data.
+
+    Returns:
+        bool: True if the database was compacted successfully, False otherwise.
+    """
+    try:
+        with get_engine().connect().execution_options(
+                isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("VACUUM"))
+        return True
+    except SQLAlchemyError:
+        return False
+
+
 #### level times ####
 
-def save_level_time(level_id: int, time: float) -> bool:
+def save_level_time(level_id: int, time: float, replay: bytes | None = None) -> bool:
     """Save the level time for a specific level.
 
     Args:
         level_id (int): The ID of the level.
         time (float): The time to save.
+        replay (bytes, optional): Encoded input recording of the run. Defaults to None.
 
     Returns:
         bool: True if the time was saved successfully, False otherwise.
@@ -49,7 +66,10 @@ def save_level_time(level_id: int, time: float) -> bool:
         return False
 
     def query(session):
-        session.add(LevelTime(level_id=level_id, time=time))
+        level_time = LevelTime(level_id=level_id, time=time)
+        if replay is not None:
+            level_time.replay = LevelReplay(data=replay)
+        session.add(level_time)
         return True
 
     return run_db_query(query, error_return=False)
@@ -73,6 +93,32 @@ def get_best_time(level_id: int) -> float | None:
     return run_db_query(query)
 
 
+def get_best_replay(level_id: int) -> tuple[float, bytes] | None:
+    """Get the best time with a saved replay for a specific level.
+
+    Args:
+        level_id (int): The ID of the level.
+
+    Returns:
+        tuple[float, bytes] or None: The time and the encoded replay,
+            or None if the level has no times with replays.
+    """
+    if level_id < 0:
+        return None
+
+    def query(session):
+        row = (
+            session.query(LevelTime.time, LevelReplay.data)
+            .join(LevelReplay)
+            .filter(LevelTime.level_id == level_id)
+            .order_by(LevelTime.time)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    return run_db_query(query)
+
+
 def get_all_best_times() -> dict[int, float]:
     """Get best times for all levels.
 
@@ -100,11 +146,25 @@ def delete_times(level_id: int) -> bool:
         bool: True if the times were deleted successfully, False otherwise.
     """
     def query(session):
+        _delete_replays(session, level_id)
         session.query(LevelTime).filter_by(level_id=level_id).delete()
         return True
     return run_db_query(query, error_return=False)
 
 
+def _delete_replays(session, level_id: int):
+    """Delete the replays of all times for a specific level.
+
+    Args:
+        session (Session): The database session.
+        level_id (int): The ID of the level.
+    """
+    time_ids = session.query(LevelTime.id).filter_by(level_id=level_id)
+    session.query(LevelReplay).filter(
+        LevelReplay.level_time_id.in_(time_ids.scalar_subquery())
+    ).delete(synchronize_session=False)
+
+
 #### level data ####
 
 def save_level(level_data: LevelData) -> bool:
@@ -124,19 +184,84 @@ def save_level(level_data: LevelData) -> bool:
     if all(len(row) == 0 for row in level_data.data):
         return False
 
-    json_data = json.dumps(level_data.data)
+    columns = _get_level_columns(level_data.data)
 
     def query(session):
         exists = session.query(Level).filter_by(name=level_data.name).first()
         if exists:
-            exists.data = json_data
+            for column, value in columns.items():
+                setattr(exists, column, value)
+            # changed levels have to be validated again
+            session.query(LevelValidation).filter_by(
+                level_id=exists.id).delete()
+            session.query(LevelPreview).filter_by(level_id=exists.id).delete()
         else:
-            session.add(Level(name=level_data.name, data=json_data))
+            session.add(Level(name=level_data.name, **columns))
         return True
 
     return run_db_query(query, error_return=False)
 
 
+def _get_level_columns(data) -> dict:
+    """Get the stored column values of level data.
+
+    The data is stored in the binary tile format,
+    and as JSON only if the binary format cannot store it.
+
+    Args:
+        data (list[list[int]]): 2D grid data representing the level layout.
+
+    Returns:
+        dict: The values of the data, tiles, width and height columns.
+    """
+    tiles = LevelData.encode_tiles(data)
+
+    return {
+        "data": json.dumps(data) if tiles is None else None,
+        "tiles": tiles,
+        "width": len(data[0]),
+        "height": len(data),
+    }
+
+
+def _level_from_row(level: Level) -> LevelData | None:
+    """Create a LevelData from a level row, reading either the binary or the JSON data.
+
+    Args:
+        level (Level): The level row.
+
+    Returns:
+        LevelData or None: The level data, or None if the stored data is not valid.
+    """
+    stored = level.tiles if level.tiles is not None else level.data
+    return LevelData.from_db_row((level.id, level.name, stored))
+
+
+def migrate_legacy_levels() -> int | None:
+    """Convert levels stored as JSON to the binary tile format.
+
+    Levels the binary format cannot store are kept as JSON.
+
+    Returns:
+        int or None: The number of converted levels, None if the migration failed.
+    """
+    def query(session):
+        converted = 0
+
+        for level in session.query(Level).filter(Level.tiles.is_(None)).all():
+            data = json.loads(level.data)
+            if not data or LevelData.encode_tiles(data) is None:
+                continue
+
+            for column, value in _get_level_columns(data).items():
+                setattr(level, column, value)
+            converted += 1
+
+        return converted
+
+    return run_db_query(query)
+
+
 def load_level(level_id: int) -> LevelData | None:
     """Load level data from the database.
 
@@ -152,7 +277,30 @@ def load_level(level_id: int) -> LevelData | None:
         if not level:
             return None
 
-        return LevelData.from_db_row((level.id, level.name, level.data))
+        return _level_from_row(level)
+
+    return run_db_query(query)
+
+
+def get_level_content(level_id: int) -> bytes | None:
+    """Get the stored content of a level without decoding it into level data.
+
+    Args:
+        level_id (int): The ID of the level.
+
+    Returns:
+        bytes or None: The size, binary tiles and JSON data of the level joined together,
+            or None if the level does not exist.
+    """
+    def query(session):
+        row = session.query(Level.width, Level.height, Level.tiles, Level.data).filter_by(
+            id=level_id).first()
+
+        if not row:
+            return None
+
+        width, height, tiles, data = row
+        return b"|".join((f"{width}x{height}".encode(), tiles or b"", (data or "").encode()))
 
     return run_db_query(query)
 
@@ -165,7 +313,61 @@ def get_all_levels() -> list[LevelData]:
     """
     def query(session):
         rows = session.query(Level).order_by(Level.id).all()
-        return [LevelData.from_db_row((l.id, l.name, l.data)) for l in rows]
+        levels = [_level_from_row(level) for level in rows]
+        return [level for level in levels if level is not None]
+
+    return run_db_query(query, error_return=[])
+
+
+def get_level_count() -> int:
+    """Get the number of levels in the database.
+
+    Returns:
+        int: The number of levels.
+    """
+    def query(session):
+        return session.query(func.count(Level.id)).scalar()
+
+    return run_db_query(query, error_return=0)
+
+
+def get_level_summaries(offset: int = 0, limit: int | None = None) -> list[LevelSummary]:
+    """Get the listing information of levels ordered by ID, without the level layouts.
+
+    The dimensions and best times are resolved in the same query,
+    so the level data is never sent to or parsed by Python.
+    Dimensions of legacy JSON levels are read from the JSON in SQLite.
+    Use load_level to fetch the full data of a level when it is needed.
+
+    Args:
+        offset (int, optional): Number of levels to skip. Defaults to 0.
+        limit (int, optional): Maximum number of levels to return. Defaults to all.
+
+    Returns:
+        list[LevelSummary]: A list of LevelSummary objects.
+    """
+    if offset < 0 or (limit is not None and limit <= 0):
+        return []
+
+    def query(session):
+        best_times = (
+            session.query(LevelTime.level_id, func.min(LevelTime.time).label("time"))
+            .group_by(LevelTime.level_id)
+            .subquery()
+        )
+        rows = (
+            session.query(
+                Level.id, Level.name,
+                func.coalesce(Level.width, func.json_array_length(Level.data, "$[0]")),
+                func.coalesce(Level.height, func.json_array_length(Level.data)),
+                best_times.c.time)
+            .outerjoin(best_times, best_times.c.level_id == Level.id)
+            .order_by(Level.id)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        return [LevelSummary(*row) for row in rows]
 
     return run_db_query(query, error_return=[])
 
@@ -211,7 +413,7 @@ def get_level_id(name: str) -> int | None:
 def delete_level(level_id: int) -> bool:
     """Delete a level from the database.
 
-    Deletes the level and all associated times.
+    Deletes the level and all associated times, replays, validations and previews.
 
     Args:
         level_id (int): The ID of the level to delete.
@@ -220,8 +422,132 @@ def delete_level(level_id: int) -> bool:
         bool: True if the level was deleted successfully, False otherwise.
     """
     def query(session):
+        _delete_replays(session, level_id)
         session.query(LevelTime).filter_by(level_id=level_id).delete()
+        session.query(LevelValidation).filter_by(level_id=level_id).delete()
+        session.query(LevelPreview).filter_by(level_id=level_id).delete()
         session.query(Level).filter_by(id=level_id).delete()
         return True
 
     return run_db_query(query, error_return=False)
+
+
+#### level validations ####
+
+def save_level_validation(level_id: int, passed: bool, time: float | None = None) -> bool:
+    """Save the validation result for a specific level.
+
+    Replaces any earlier result for the level.
+
+    Args:
+        level_id (int): The ID of the level.
+        passed (bool): True if the level was found to be completable.
+        time (float, optional): Completion time of the found solution. Defaults to None.
+
+    Returns:
+        bool: True if the result was saved successfully, False otherwise.
+    """
+    if level_id < 0:
+        return False
+
+    def query(session):
+        if session.query(Level.id).filter_by(id=level_id).scalar() is None:
+            return False
+
+        exists = session.query(LevelValidation).filter_by(
+            level_id=level_id).first()
+        if exists:
+            exists.passed = passed
+            exists.time = time
+        else:
+            session.add(LevelValidation(
+                level_id=level_id, passed=passed, time=time))
+        return True
+
+    return run_db_query(query, error_return=False)
+
+
+def get_level_validation(level_id: int) -> tuple[bool, float | None] | None:
+    """Get the validation result for a specific level.
+
+    Args:
+        level_id (int): The ID of the level.
+
+    Returns:
+        tuple[bool, float or None] or None: (passed, time) if the level has been validated,
+            None otherwise.
+    """
+    def query(session):
+        result = session.query(LevelValidation).filter_by(
+            level_id=level_id).first()
+        return (result.passed, result.time) if result else None
+
+    return run_db_query(query)
+
+
+def get_all_level_validations() -> dict[int, tuple[bool, float | None]]:
+    """Get the validation results for all validated levels.
+
+    Returns:
+        dict[int, tuple[bool, float or None]]: A dictionary mapping level IDs to (passed, time).
+    """
+    def query(session):
+        rows = session.query(LevelValidation).all()
+        return {row.level_id: (row.passed, row.time) for row in rows}
+
+    return run_db_query(query, error_return={})
+
+
+#### level previews ####
+
+def save_level_preview(level_id: int, data_hash: str, size: tuple[int, int],
+                       pixels: bytes) -> bool:
+    """Save the cached preview of a level, replacing any previous preview.
+
+    Args:
+        level_id (int): The ID of the level.
+        data_hash (str): Hash of the level content and size the preview was made for.
+        size (tuple[int, int]): Width and height of the preview in pixels.
+        pixels (bytes): Compressed pixels of the preview.
+
+    Returns:
+        bool: True if the preview was saved successfully, False otherwise.
+    """
+    if level_id < 0:
+        return False
+
+    def query(session):
+        preview = session.query(LevelPreview).filter_by(
+            level_id=level_id).first()
+        if not preview:
+            preview = LevelPreview(level_id=level_id)
+            session.add(preview)
+
+        preview.data_hash = data_hash
+        preview.width, preview.height = size
+        preview.pixels = pixels
+        return True
+
+    return run_db_query(query, error_return=False)
+
+
+def load_level_preview(level_id: int) -> tuple[str, tuple[int, int], bytes] | None:
+    """Load the cached preview of a level.
+
+    Args:
+        level_id (int): The ID of the level.
+
+    Returns:
+        tuple[str, tuple[int, int], bytes] or None: (data hash, size, compressed pixels)
+            if a preview is cached, None otherwise.
+    """
+    def query(session):
+        preview = session.query(LevelPreview).filter_by(
+            level_id=level_id).first()
+
+        if not preview:
+            return None
+
+        return preview.data_hash, (preview.width, preview.height), preview.pixels
+
+    return run_db_query(query)
@@ -1,12 +1,12 @@
 """Database connection and session management for SQLAlchemy."""
 
-import json
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import MetaData, create_engine, inspect, text
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 import constants
+from game.level_data import LevelData
 from tools.db_models import Base, Level
 
 
@@ -15,6 +15,11 @@ class DBConnection:
 
     _engine = None
 
+    # columns added to existing tables after their first release
+    _ADDED_COLUMNS = {
+        "levels": (("tiles", "BLOB"), ("width", "INTEGER"), ("height", "INTEGER")),
+    }
+
     @classmethod
     def init_db(cls, add_test_level=False):
         """Initialize the database connection and create tables.
@@ -26,7 +31,7 @@ class DBConnection:
             cls._engine.dispose()
 
         cls._engine = create_engine("sqlite:///data.db")
-        Base.metadata.create_all(bind=cls._engine)
+        cls._migrate_schema()
 
         if add_test_level:
             cls._add_test_level()
@@ -89,6 +94,51 @@ class DBConnection:
         finally:
             session.close()
 
+    @classmethod
+    def _migrate_schema(cls):
+        """Create the missing tables and update the tables created by older versions of the game."""
+        Base.metadata.create_all(bind=cls._engine)
+        cls._add_missing_columns()
+        cls._make_level_data_nullable()
+
+    @classmethod
+    def _add_missing_columns(cls):
+        """Add the columns missing from tables created by older versions of the game."""
+        inspector = inspect(cls._engine)
+
+        with cls._engine.begin() as connection:
+            for table, columns in cls._ADDED_COLUMNS.items():
+                existing = {column["name"] for column in inspector.get_columns(table)}
+
+                for name, sql_type in columns:
+                    if name not in existing:
+                        connection.execute(
+                            text(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}"))
+
+    @classmethod
+    def _make_level_data_nullable(cls):
+        """Rebuild a levels table where the data column is NOT NULL.
+
+        Older versions of the game created the data column as NOT NULL, but levels in the
+        binary tile format have no JSON data. SQLite cannot change a column constraint,
+        so the table is created again under a new name, the levels are copied to it,
+        and the old table is replaced with it.
+        """
+        data = next(column for column in inspect(cls._engine).get_columns("levels")
+                    if column["name"] == "data")
+        if data["nullable"]:
+            return
+
+        rebuilt = Level.__table__.to_metadata(MetaData(), name="levels_rebuilt")
+        columns = ", ".join(column.name for column in Level.__table__.columns)
+
+        with cls._engine.begin() as connection:
+            rebuilt.create(connection)
+            connection.execute(text(
+                f"INSERT INTO levels_rebuilt ({columns}) SELECT {columns} FROM levels"))
+            connection.execute(text("DROP TABLE levels"))
+            connection.execute(text("ALTER TABLE levels_rebuilt RENAME TO levels"))
+
     @classmethod
     def _add_test_level(cls):
         """Add a test level to the database if it doesn't exist."""
@@ -98,7 +148,9 @@ class DBConnection:
             if not exists:
                 session.add(Level(
                     name="test_level",
-                    data=json.dumps(constants.TEST_LEVEL_DATA)
+                    tiles=LevelData.encode_tiles(constants.TEST_LEVEL_DATA),
+                    width=len(constants.TEST_LEVEL_DATA[0]),
+                    height=len(constants.TEST_LEVEL_DATA)
                 ))
 
     @classmethod
@@ -1,6 +1,6 @@
-"""SQLAlchemy ORM models for the levels and level times."""
+"""SQLAlchemy ORM models for the levels, level times, replays, validations and previews."""
 
-from sqlalchemy import Text, ForeignKey
+from sqlalchemy import Text, ForeignKey, LargeBinary
 from sqlalchemy.orm import DeclarativeBase, relationship, mapped_column, Mapped
 
 
@@ -14,14 +14,21 @@ class Level(Base):
     Attributes:
         id (int): Unique identifier for the level.
         name (str): Name of the level.
-        data (str): Level data in string format.
+        data (str or None): Level data as a JSON string, only used by levels saved
+            before the binary format and levels the binary format cannot store.
+        tiles (bytes or None): Level data in the binary tile format, see game.level_data.
+        width (int or None): Width of the level in cells.
+        height (int or None): Height of the level in cells.
         times (list[LevelTime]): List of level times associated with this level.
     """
     __tablename__ = "levels"
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(unique=True)
-    data: Mapped[str] = mapped_column(Text)
+    data: Mapped[str | None] = mapped_column(Text)
+    tiles: Mapped[bytes | None] = mapped_column(LargeBinary)
+    width: Mapped[int | None]
+    height: Mapped[int | None]
 
     times: Mapped[list["LevelTime"]] = relationship(back_populates="level")
 
@@ -34,6 +41,7 @@ class LevelTime(Base):
         level_id (int): Foreign key referencing the associated level.
         time (float): Time taken to complete the level.
         level (Level): The level associated with this time.
+        replay (LevelReplay or None): The input recording of the run, if saved.
     """
     __tablename__ = "level_times"
 
@@ -42,3 +50,63 @@ class LevelTime(Base):
     time: Mapped[float]
 
     level: Mapped[Level] = relationship(back_populates="times")
+    replay: Mapped["LevelReplay | None"] = relationship(back_populates="level_time")
+
+
+class LevelReplay(Base):
+    """Model representing the input recording of a level run.
+
+    Attributes:
+        id (int): Unique identifier for the replay.
+        level_time_id (int): Foreign key referencing the time the run achieved.
+        data (bytes): The replay in its binary format, see game.replay.Replay.
+        level_time (LevelTime): The time associated with this replay.
+    """
+    __tablename__ = "level_replays"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    level_time_id: Mapped[int] = mapped_column(
+        ForeignKey("level_times.id"), unique=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+
+    level_time: Mapped[LevelTime] = relationship(back_populates="replay")
+
+
+class LevelValidation(Base):
+    """Model representing the result of automatically validating a level.
+
+    Attributes:
+        id (int): Unique identifier for the validation.
+        level_id (int): Foreign key referencing the validated level.
+        passed (bool): True if the level was found to be completable.
+        time (float or None): Completion time of the found solution, None if not passed.
+    """
+    __tablename__ = "level_validations"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    level_id: Mapped[int] = mapped_column(
+        ForeignKey("levels.id"), unique=True)
+    passed: Mapped[bool]
+    time: Mapped[float | None]
+
+
+class LevelPreview(Base):
+    """Model representing a cached preview image of a level.
+
+    Attributes:
+        id (int): Unique identifier for the preview.
+        level_id (int): Foreign key referencing the level.
+        data_hash (str): Hash of the level content and size the preview was made for.
+        width (int): Width of the preview in pixels.
+        height (int): Height of the preview in pixels.
+        pixels (bytes): Compressed RGB pixels of the preview.
+    """
+    __tablename__ = "level_previews"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    level_id: Mapped[int] = mapped_column(
+        ForeignKey("levels.id"), unique=True)
+    data_hash: Mapped[str]
+    width: Mapped[int]
+    height: Mapped[int]
+    pixels: Mapped[bytes] = mapped_column(LargeBinary)
@@ -0,0 +1,63 @@
+"""Function for getting level previews through a persistent cache in the database."""
+
+import hashlib
+import zlib
+
+import pygame
+
+from tools.db import get_level_content, load_level, load_level_preview, save_level_preview
+from tools.preview_generator import generate_level_preview
+
+
+def get_level_data_hash(content, size):
+    """Get a hash identifying a preview made from the given stored level content.
+
+    Args:
+        content (bytes): The stored content of the level, see get_level_content.
+        size (tuple[int, int]): Maximum size (width, height) of the preview.
+
+    Returns:
+        str: The hash as a hex string.
+    """
+    return hashlib.sha1(content + f"|{size[0]}x{size[1]}".encode()).hexdigest()
+
+
+def get_level_preview(level_id: int, size=(300, 150)):
+    """Get the preview of a saved level, loading it from the cache if the level has not changed.
+
+    The cached preview is checked against a hash of the stored level content,
+    so the level data is only decoded when the preview is missing or outdated.
+    The generated preview is then saved to the cache.
+
+    Args:
+        level_id (int): The ID of the level.
+        size (tuple[int, int]): Maximum size (width, height) of the output preview image.
+
+    Returns:
+        pygame.Surface or None: The scaled surface visualizing the level layout,
+            or None if the level does not exist.
+    """
+    content = get_level_content(level_id)
+    if content is None:
+        return None
+
+    data_hash = get_level_data_hash(content, size)
+
+    cached = load_level_preview(level_id)
+
+    if cached is not None:
+        cached_hash, cached_size, pixels = cached
+        if cached_hash == data_hash:
+            return pygame.image.frombytes(
+                zlib.decompress(pixels), cached_size, "RGB").convert_alpha()
+
+    level = load_level(level_id)
+    if level is None:
+        return None
+
+    preview = generate_level_preview(level.data, size)
+
+    pixels = zlib.compress(pygame.image.tobytes(preview, "RGB"))
+    save_level_preview(level_id, data_hash, preview.get_size(), pixels)
+
+    return preview
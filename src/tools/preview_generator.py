@@ -1,9 +1,35 @@
-"""Function for generating a level preview surface from raw tile data."""
+"""Functions for generating and updating level preview surfaces from raw tile data."""
+
+from array import array
 
 import pygame
 import constants
 
 
+def _build_palette():
+    """Build the preview palette and a lookup table from tile bytes to palette indices.
+
+    Tiles are stored as signed bytes, the lookup maps each byte value to the palette index
+    of the tile's absolute value. Unknown tiles map to a black fallback entry.
+
+    Returns:
+        tuple[list[tuple[int, int, int]], bytes]: The palette and the 256-entry lookup table.
+    """
+    tiles = sorted(constants.TILE_COLORS)
+    palette = [constants.TILE_COLORS[tile] for tile in tiles] + [(0, 0, 0)]
+    fallback = len(palette) - 1
+
+    lookup = bytearray(256)
+    for value in range(-128, 128):
+        tile = abs(value)
+        lookup[value & 0xFF] = tiles.index(tile) if tile in tiles else fallback
+
+    return palette, bytes(lookup)
+
+
+_PALETTE, _LOOKUP = _build_palette()
+
+
 def generate_level_preview(level_data, size=(300, 150)):
     """Generate a scaled preview image from level tile data.
 
@@ -14,17 +40,35 @@ def generate_level_preview(level_data, size=(300, 150)):
     Returns:
         pygame.Surface: The scaled surface visualizing the level layout.
     """
+    tiles = array("b")
+    for row in level_data:
+        tiles.extend(row)
+
+    return generate_tiles_preview(tiles, (len(level_data[0]), len(level_data)), size)
+
+
+def generate_tiles_preview(tiles, level_size, size=(300, 150)):
+    """Generate a scaled preview image from a flat array of tiles, such as ArrayMap.tiles.
+
+    The tiles are converted to palette indices with a single lookup table
+    and written to an 8-bit surface in one operation.
 
-    width = len(level_data[0])
-    height = len(level_data)
+    Args:
+        tiles (array): Signed byte tile values of the level, row by row.
+        level_size (tuple[int, int]): The width and height of the level in cells.
+        size (tuple[int, int]): Maximum size (width, height) of the output preview image.
 
-    preview_surface = pygame.Surface((width, height)).convert_alpha()
+    Returns:
+        pygame.Surface: The scaled surface visualizing the level layout.
+    """
+    width, height = level_size
 
-    for y in range(height):
-        for x in range(width):
-            tile = level_data[y][x]
-            color = constants.TILE_COLORS.get(abs(tile), (0, 0, 0))
-            preview_surface.set_at((x, y), color)
+    pixels = tiles.tobytes().translate(_LOOKUP)
+
+    indexed_surface = pygame.image.frombytes(pixels, (width, height), "P")
+    indexed_surface.set_palette(_PALETTE)
+
+    preview_surface = indexed_surface.convert_alpha()
 
     scaler = min(size[0] / width, size[1] / height)
 
@@ -32,3 +76,48 @@ def generate_level_preview(level_data, size=(300, 150)):
         preview_surface, (int(width * scaler), int(height * scaler)))
 
     return preview_surface
+
+
+def patch_level_preview(preview, tile_map, area):
+    """Redraw an area of cells on a preview made with generate_level_preview.
+
+    Only the pixels of the given cells are filled again, the rest of the preview is untouched.
+    The result matches a newly generated preview when the preview is scaled by a whole number.
+
+    Args:
+        preview (pygame.Surface): The preview surface to draw on.
+        tile_map (Map): The map of the level, the cells are read from it one by one.
+        area (tuple[int, int, int, int]): The cells to redraw as (x, y, width, height).
+            Cells outside the level are ignored.
+    """
+    level_size = (tile_map.width, tile_map.height)
+
+    area_x, area_y, area_width, area_height = area
+
+    for y in range(max(area_y, 0), min(area_y + area_height, tile_map.height)):
+        for x in range(max(area_x, 0), min(area_x + area_width, tile_map.width)):
+            color = constants.TILE_COLORS.get(abs(tile_map.get_tile_at_cell(x, y)), (0, 0, 0))
+            preview.fill(color, _get_cell_rect(x, y, level_size, preview.get_size()))
+
+
+def _get_cell_rect(x, y, level_size, preview_size):
+    """Get the pixels a cell covers on a scaled preview.
+
+    Args:
+        x (int): The x index of the cell.
+        y (int): The y index of the cell.
+        level_size (tuple[int, int]): The width and height of the level in cells.
+        preview_size (tuple[int, int]): The width and height of the preview in pixels.
+
+    Returns:
+        tuple[int, int, int, int]: The area of the cell as (x, y, width, height).
+    """
+    width, height = level_size
+    preview_width, preview_height = preview_size
+
+    left = -(-x * preview_width // width)
+    right = -(-(x + 1) * preview_width // width)
+    top = -(-y * preview_height // height)
+    bottom = -(-(y + 1) * preview_height // height)
+
+    return left, top, right - left, bottom - top
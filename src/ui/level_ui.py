@@ -26,6 +26,11 @@ class LevelUI:
 
         self.back_button = Button("Back", self._font, self._BACK_BUTTON_RECT)
 
+        self._text = None
+        self._text_surface = None
+        self._text_rect = None
+        self._drawn_rect = None
+
     def draw(self, display, item, timer):
         """Draw the level UI on the display.
 
@@ -34,6 +39,22 @@ class LevelUI:
             item (int): The current item count in the inventory.
             timer (Timer): The timer object for the level.
         """
+        self.render(item, timer)
+        self.blit(display)
+
+    def render(self, item, timer):
+        """Render the UI text for the current state without drawing it.
+
+        The text is only rendered again when it has changed.
+
+        Args:
+            item (int): The current item count in the inventory.
+            timer (Timer): The timer object for the level.
+
+        Returns:
+            tuple[pygame.Rect]: The areas of the display the UI covers now
+                and covered when last rendered, to be redrawn.
+        """
         best_time = timer.get_best_time()
         time = timer.get_time()
 
@@ -44,9 +65,23 @@ class LevelUI:
             f"Best Time: {record:<10}"
             f"Time: {time:<10.2f}"
         )
-        text_surface = self._font.render(text, True, self._TEXT_COLOR)
-        text_rect = text_surface.get_rect(topleft=self._TEXT_POS)
-        display.blit(text_surface, text_rect)
+        if text != self._text:
+            self._text = text
+            self._text_surface = self._font.render(text, True, self._TEXT_COLOR)
+            self._text_rect = self._text_surface.get_rect(topleft=self._TEXT_POS)
+
+        rect = self._text_rect.union(self._BACK_BUTTON_RECT)
+        drawn = (rect, self._drawn_rect) if self._drawn_rect else (rect,)
+        self._drawn_rect = rect
+        return drawn
+
+    def blit(self, display):
+        """Draw the UI rendered by the last render call on the display.
+
+        Args:
+            display (pygame.Surface): The surface to draw on.
+        """
+        display.blit(self._text_surface, self._text_rect)
 
         self.back_button.draw(display)
 
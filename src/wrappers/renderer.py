@@ -1,22 +1,33 @@
 """ Renderer class for rendering the game scene. """
 import pygame
 
+from constants import Settings
+
 
 class Renderer:
     """ Renderer class for rendering the game scene. """
 
-    def __init__(self, display, scene):
+    def __init__(self, display, scene, dirty_rects=Settings.DIRTY_RECTS):
         """ Initialize the Renderer.
 
         Args:
             display (pygame.Surface): The display surface to render on.
             scene (Scene): The scene to be rendered.
+            dirty_rects (bool, optional): If True, scenes that support it only redraw
+                and update the changed areas of the display. Defaults to Settings.DIRTY_RECTS.
         """
         self._display = display
         self._scene = scene
+        self._dirty_rects = dirty_rects
 
     def render(self):
         """ Render the current scene to the display. """
+        if self._dirty_rects:
+            rects = self._scene.draw_dirty(self._display)
+            if rects is not None:
+                pygame.display.update(rects)
+                return
+
         self._display.fill((0, 0, 0))
 
         self._scene.draw(self._display)
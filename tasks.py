@@ -34,4 +34,25 @@ def lint(ctx):
 
 @task
 def format(ctx):
-	ctx.run("autopep8 --in-place --recursive src", pty=(platform != "win32"))
\ No newline at end of file
+	ctx.run("autopep8 --in-place --recursive src", pty=(platform != "win32"))
+
+@task
+def benchmark(ctx):
+	if is_windows():
+		ctx.run("python src/headless_loop.py", pty=False)
+	else:
+		ctx.run("python3 src/headless_loop.py", pty=True)
+
+@task
+def validate(ctx):
+	if is_windows():
+		ctx.run("python src/level_validator.py", pty=False)
+	else:
+		ctx.run("python3 src/level_validator.py", pty=True)
+
+@task
+def migrate(ctx):
+	if is_windows():
+		ctx.run("python src/level_migration.py", pty=False)
+	else:
+		ctx.run("python3 src/level_migration.py", pty=True)
\ No newline at end of file